@@ -1,9 +1,10 @@
+import inspect
 from math import pi
 
 import numpy as np
-from psrqpy import QueryATNF
 
-from pulsar_spectra.catalogue import ATNF_VER
+from pulsar_spectra.spectral_fit import propagate_fit_quantities_bulk
+from pulsar_spectra.utils import get_atnf_table
 
 
 def calc_log_parabolic_spectrum_max_freq(a, b, v0, u_a, u_b, u_ab):
@@ -36,6 +37,151 @@ def calc_log_parabolic_spectrum_max_freq(a, b, v0, u_a, u_b, u_ab):
     return v_peak, u_v_peak
 
 
+def _bisect_peak(model_function, values, log_lower, log_upper, n_iter=40, h=1e-7):
+    """Bisect the log10 frequency brackets for where the log flux density stops rising, which also finds peaks at a break."""
+    for _ in range(n_iter):
+        log_mid = (log_lower + log_upper) / 2
+        with np.errstate(all="ignore"):
+            rising = model_function(10 ** (log_mid + h), *values.T) > model_function(10 ** (log_mid - h), *values.T)
+        log_lower = np.where(rising, log_mid, log_lower)
+        log_upper = np.where(rising, log_upper, log_mid)
+    return (log_lower + log_upper) / 2
+
+
+def _peak_bracket(model_function, values, freq_range_Hz, n_grid):
+    """Find the log10 frequency grid cells either side of the peak of each fit, which are NaN if the peak is on the
+    edge of the frequency range."""
+    log_freqs = np.linspace(np.log10(freq_range_Hz[0]), np.log10(freq_range_Hz[1]), n_grid)
+    with np.errstate(all="ignore"):
+        fluxs = model_function(10**log_freqs, *values.T[:, :, np.newaxis])
+    peak = np.argmax(np.where(np.isfinite(fluxs), fluxs, -np.inf), axis=1)
+    inside = (peak > 0) & (peak < n_grid - 1)
+    log_lower = np.where(inside, log_freqs[np.clip(peak - 1, 0, n_grid - 1)], np.nan)
+    log_upper = np.where(inside, log_freqs[np.clip(peak + 1, 0, n_grid - 1)], np.nan)
+    return log_lower, log_upper
+
+
+def peak_frequency(model_function, values, freq_range_Hz, n_grid=400):
+    """Find the frequency of the peak flux density of many fits of a model at once.
+
+    The model is evaluated on a logarithmic frequency grid and the peak is then refined by bisection,
+    so the peaks of smooth models and those at a break (e.g. :py:meth:`pulsar_spectra.models.broken_power_law`) are
+    both found to a relative precision of better than 1e-6.
+
+    Parameters
+    ----------
+    model_function : `function`
+        The model function from :py:meth:`pulsar_spectra.models.model_registry`.
+    values : `numpy.ndarray`
+        The parameter values (including the reference frequency v0) of each fit with the shape (n_fits, n_params).
+    freq_range_Hz : `tuple`
+        The minimum and maximum frequency in Hz to search for the peak.
+    n_grid : `int`, optional
+        The number of frequencies in the grid. |br| Default: 400.
+
+    Returns
+    -------
+    v_peak : `numpy.ndarray`
+        The peak frequency in Hz of each fit, which is NaN if the peak is not inside the frequency range.
+    """
+    values = np.asarray(values, dtype=float)
+    log_lower, log_upper = _peak_bracket(model_function, values, freq_range_Hz, n_grid)
+    return 10 ** _bisect_peak(model_function, values, log_lower, log_upper)
+
+
+def _derived_quantities(model_function, fit_params, log_lower, log_upper, freq_params, curvature_freq_MHz):
+    """The peak frequency, peak flux density, curvature and break ratio of each fit for
+    :py:meth:`pulsar_spectra.analysis.calc_derived_quantities_bulk`."""
+    log_v_peak = _bisect_peak(model_function, fit_params, log_lower, log_upper)
+    with np.errstate(all="ignore"):
+        S_peak = model_function(10**log_v_peak, *fit_params.T) * 1e3
+        if curvature_freq_MHz is None:
+            log_v = np.log10(fit_params[:, -1])
+        else:
+            log_v = np.full(len(fit_params), np.log10(curvature_freq_MHz * 1e6))
+        # Second order central difference of the log flux density
+        h = 1e-3
+        log_fluxs = [np.log10(model_function(10 ** (log_v + step), *fit_params.T)) for step in (-h, 0, h)]
+        curvature = (log_fluxs[0] - 2 * log_fluxs[1] + log_fluxs[2]) / h**2
+    if len(freq_params) == 2:
+        freqs = fit_params[:, freq_params]
+        break_ratio = np.max(freqs, axis=1) / np.min(freqs, axis=1)
+    else:
+        break_ratio = np.full(len(fit_params), np.nan)
+    return np.array([10**log_v_peak, S_peak, curvature, break_ratio])
+
+
+def calc_derived_quantities_bulk(fit_results, curvature_freq_MHz=None, freq_range_MHz=(10, 1e5), rel_step=1e-5):
+    """Calculate quantities derived from the spectral fits of many pulsars at once.
+
+    The fits are grouped by model and each quantity is calculated for the whole group at once.
+    The uncertainties are propagated with a finite difference Jacobian and the covariance matrix of each fit,
+    see :py:meth:`pulsar_spectra.spectral_fit.propagate_fit_quantities_bulk`.
+
+    Parameters
+    ----------
+    fit_results : `list` of `dict` or `pandas.DataFrame`
+        The stored fit results, each with at least the ``'model'``, ``'values'`` and ``'covariance'`` keys
+        (see :py:meth:`pulsar_spectra.spectral_fit.fit_result_to_dict`).
+    curvature_freq_MHz : `float`, optional
+        The frequency in MHz to calculate the curvature at. |br| Default: None, the reference frequency (v0) of each fit.
+    freq_range_MHz : `tuple`, optional
+        The minimum and maximum frequency in MHz to search for peaks. |br| Default: (10, 1e5).
+    rel_step : `float`, optional
+        The relative step size used to compute the Jacobian by central differences. |br| Default: 1e-5.
+
+    Returns
+    -------
+    derived : `dict`
+        The quantities as `numpy.ndarray` columns with a value for each fit result, with the keys:
+
+        ``'v_peak'``, ``'u_v_peak'`` : `numpy.ndarray`
+            The frequency of the peak flux density in Hz (see :py:meth:`pulsar_spectra.analysis.peak_frequency`)
+            and its uncertainty. NaN if the spectrum does not peak within freq_range_MHz.
+        ``'S_peak'``, ``'u_S_peak'`` : `numpy.ndarray`
+            The peak flux density in mJy and its uncertainty.
+        ``'curvature'``, ``'u_curvature'`` : `numpy.ndarray`
+            The spectral curvature, :math:`d^2 \\log_{10} S_v / d (\\log_{10} v)^2`, at curvature_freq_MHz and its uncertainty.
+            This is 2a for :py:meth:`pulsar_spectra.models.log_parabolic_spectrum` and 0 for a power law.
+        ``'break_ratio'``, ``'u_break_ratio'`` : `numpy.ndarray`
+            The ratio of the higher to the lower frequency parameter of models with two (e.g. vb2/vb1 of
+            :py:meth:`pulsar_spectra.models.double_broken_power_law` and vc/vpeak of
+            :py:meth:`pulsar_spectra.models.double_turn_over_spectrum`) and its uncertainty. NaN for the other models.
+
+        The uncertainties are NaN for fits without a covariance matrix.
+    """
+    freq_range_Hz = (freq_range_MHz[0] * 1e6, freq_range_MHz[1] * 1e6)
+
+    def group_derived_quantities(model_function, params):
+        # The frequency parameters (except the reference frequency) for the break ratio
+        freq_params = [
+            j
+            for j, parameter in enumerate(list(inspect.signature(model_function).parameters)[1:-1])
+            if parameter.startswith("v")
+        ]
+        # Find the grid cells around the peaks once so the perturbed parameters bisect the same peak
+        log_lower, log_upper = _peak_bracket(model_function, params, freq_range_Hz, 400)
+
+        def quantity(fit_params, fits):
+            quantities = _derived_quantities(
+                model_function, fit_params, log_lower[fits], log_upper[fits], freq_params, curvature_freq_MHz
+            )
+            # Put the fits first with the shape (nfits, nquantities)
+            return quantities.T
+
+        return quantity
+
+    keys = ["v_peak", "S_peak", "curvature", "break_ratio"]
+    values, errors = propagate_fit_quantities_bulk(
+        fit_results, group_derived_quantities, shape=(len(keys),), rel_step=rel_step
+    )
+    derived = {}
+    for k, key in enumerate(keys):
+        derived[key] = values[:, k]
+        derived[f"u_{key}"] = errors[:, k]
+    return derived
+
+
 def calc_high_frequency_cutoff_emission_height(psrname, v_c, u_v_c, z_surf=12, u_z_surf=2):
     """Calculate emission height and magetic field strengths using high-frequency cut-off model (:py:meth:`pulsar_spectra.models.high_frequency_cut_off_power_law`).
     Details on the calculation procedure can be found in Jankowski et al. (2018) and Lee et al. (2022). The default neutron star radius is based on a canonical
@@ -75,18 +221,58 @@ def calc_high_frequency_cutoff_emission_height(psrname, v_c, u_v_c, z_surf=12, u
     u_z_percent : `float`
         Uncertainty of z_percent as a percentage of light-cylinder radius.
     """
+    emission_height_columns = calc_high_frequency_cutoff_emission_height_bulk(
+        [psrname], v_c, u_v_c, z_surf=z_surf, u_z_surf=u_z_surf
+    )
+    return tuple(column[0] for column in emission_height_columns)
+
+
+def calc_high_frequency_cutoff_emission_height_bulk(psrnames, v_c, u_v_c, z_surf=12, u_z_surf=2, query=None):
+    """Calculate the emission heights and magnetic field strengths of many pulsars at once using their high-frequency
+    cut-off model fits (see :py:meth:`pulsar_spectra.analysis.calc_high_frequency_cutoff_emission_height`).
+
+    Parameters
+    ----------
+    psrnames : `list`
+        The pulsar J or B names.
+    v_c : `numpy.ndarray`
+        The cut-off frequencies in units of Hz.
+    u_v_c : `numpy.ndarray`
+        The uncertainties of the cut-off frequencies in units of Hz.
+    z_surf : `float`, optional
+        Radius of the neutron star in km. |br| Default: 12.
+    u_z_surf : `float`, optional
+        Uncertainty on the radius of the neutron star in km. |br| Default: 2.
+    query : `pandas.DataFrame`, optional
+        A previous psrqpy.QueryATNF query with the P0, BSURF and B_LC parameters. Can be supplied to prevent
+        performing a new query. |br| Default: None, will use the cached query from
+        :py:meth:`pulsar_spectra.utils.get_atnf_table`.
+
+    Returns
+    -------
+    B_pc, u_B_pc, B_surf, B_lc, r_lc, z_e, u_z_e, z_percent, u_z_percent : `numpy.ndarray`
+        The outputs of :py:meth:`pulsar_spectra.analysis.calc_high_frequency_cutoff_emission_height` for each pulsar,
+        which are NaN for pulsars that are not in the catalogue or are missing a parameter.
+    """
     m_e = 9.1094e-28  # electron mass (g)
     c0 = 2.99792458e10  # speed of light (cm s^{-1})
     e = 4.8032e-10  # electron charge (cm^{3/2} g^{1/2} s^{-1})
     c_lc = 4.77e4  # light cylinder calculation constant (km s^{-1})
     c_B = m_e * c0 / (pi * e)  # magnetic field calculation constant
 
-    query = QueryATNF(params=["P0", "BSurf", "B_LC"], psrs=[psrname], version=ATNF_VER)
-    psrs = query.get_pulsars()
-
-    P = psrs[psrname].P0
-    B_surf = psrs[psrname].BSurf
-    B_lc = psrs[psrname].B_LC
+    if query is None:
+        query = get_atnf_table()
+    # Look up the parameters of all the pulsars at once, converting any B names to J names
+    psr_table = query.drop_duplicates("PSRJ").set_index("PSRJ")
+    if "PSRB" in query:
+        b_to_j = dict(zip(query["PSRB"], query["PSRJ"]))
+        psrnames = [psrname if psrname in psr_table.index else b_to_j.get(psrname, psrname) for psrname in psrnames]
+    psr_table = psr_table.reindex(list(psrnames))
+    P = psr_table["P0"].to_numpy(dtype=float)
+    B_surf = psr_table["BSURF"].to_numpy(dtype=float)
+    B_lc = psr_table["B_LC"].to_numpy(dtype=float)
+    v_c = np.asarray(v_c, dtype=float)
+    u_v_c = np.asarray(u_v_c, dtype=float)
 
     B_pc = c_B * P * v_c**2
     u_B_pc = 2 * c_B * P * v_c * u_v_c
@@ -0,0 +1,611 @@
+"""
+Fit a spectral model to many pulsars at once with a vectorised robust Levenberg-Marquardt minimiser
+"""
+
+import inspect
+import logging
+import time
+
+import numpy as np
+
+from pulsar_spectra.analysis import peak_frequency
+from pulsar_spectra.jit_models import jit_model
+from pulsar_spectra.models import get_model, model_registry
+from pulsar_spectra.spectral_fit import fit_result_to_dict, iminuit_fit_spectral_model
+
+logger = logging.getLogger(__name__)
+
+
+def stack_pulsar_data(cat_list, pulsars):
+    """Stack the data of several pulsars into padded arrays so they can be fit at the same time.
+
+    Parameters
+    ----------
+    cat_list : `dict`
+        The catalogue from :py:meth:`pulsar_spectra.catalogue.collect_catalogue_fluxes`.
+    pulsars : `list`
+        The Jnames of the pulsars to stack.
+
+    Returns
+    -------
+    freqs_Hz : `numpy.ndarray`
+        The frequencies in Hz with the shape (n_pulsars, max_n_data).
+    bands_Hz : `numpy.ndarray`
+        The bandwidths in Hz, which are NaN if a bandwidth is unknown.
+    fluxs_Jy : `numpy.ndarray`
+        The flux densities in Jy.
+    flux_errs_Jy : `numpy.ndarray`
+        The flux density uncertainties in Jy.
+    mask : `numpy.ndarray`
+        True for data and False for the padding.
+    """
+    n_data = [len(cat_list[pulsar][0]) for pulsar in pulsars]
+    shape = (len(pulsars), max(n_data))
+    # Pad with the first measurement so the models can be evaluated everywhere
+    freqs_Hz = np.ones(shape)
+    bands_Hz = np.ones(shape)
+    fluxs_Jy = np.ones(shape)
+    flux_errs_Jy = np.ones(shape)
+    mask = np.zeros(shape, dtype=bool)
+    for i, (pulsar, n) in enumerate(zip(pulsars, n_data)):
+        freqs_MHz, bands_MHz, fluxs_mJy, flux_errs_mJy, _ = cat_list[pulsar]
+        freqs_Hz[i] = freqs_MHz[0] * 1e6
+        freqs_Hz[i, :n] = np.array(freqs_MHz, dtype=float) * 1e6
+        bands_Hz[i, :n] = [np.nan if band is None else band * 1e6 for band in bands_MHz]
+        bands_Hz[i, n:] = bands_Hz[i, 0]
+        fluxs_Jy[i, :n] = np.array(fluxs_mJy, dtype=float) / 1e3
+        flux_errs_Jy[i, :n] = np.array(flux_errs_mJy, dtype=float) / 1e3
+        mask[i, :n] = True
+    return freqs_Hz, bands_Hz, fluxs_Jy, flux_errs_Jy, mask
+
+
+def _to_external(u, lower, upper):
+    """Convert the unbounded internal parameters to the bounded parameters (the same transforms as Minuit)."""
+    both = np.isfinite(lower) & np.isfinite(upper)
+    lower_only = np.isfinite(lower) & ~np.isfinite(upper)
+    upper_only = ~np.isfinite(lower) & np.isfinite(upper)
+    with np.errstate(invalid="ignore"):
+        theta = np.where(both, lower + (upper - lower) * (np.sin(u) + 1) / 2, u)
+        theta = np.where(lower_only, lower - 1 + np.sqrt(u**2 + 1), theta)
+        theta = np.where(upper_only, upper + 1 - np.sqrt(u**2 + 1), theta)
+    return theta
+
+
+def _to_internal(theta, lower, upper):
+    """Convert the bounded parameters to the unbounded internal parameters."""
+    both = np.isfinite(lower) & np.isfinite(upper)
+    lower_only = np.isfinite(lower) & ~np.isfinite(upper)
+    upper_only = ~np.isfinite(lower) & np.isfinite(upper)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        u = np.where(both, np.arcsin(np.clip(2 * (theta - lower) / (upper - lower) - 1, -1, 1)), theta)
+        u = np.where(lower_only, np.sqrt(np.maximum((theta - lower + 1) ** 2 - 1, 0)), u)
+        u = np.where(upper_only, np.sqrt(np.maximum((upper - theta + 1) ** 2 - 1, 0)), u)
+    return u
+
+
+def huber_cost(residuals, mask, k=1.345):
+    """The robust cost of each pulsar's fit, which is the same as :py:meth:`pulsar_spectra.spectral_fit.robust_cost_function`.
+
+    Parameters
+    ----------
+    residuals : `numpy.ndarray`
+        The residuals divided by the uncertainties with the shape (n_pulsars, max_n_data).
+    mask : `numpy.ndarray`
+        True for data and False for the padding.
+    k : `float`, optional
+        A constant that defines at which distance the loss function starts to penalize outliers. |br| Default: 1.345.
+
+    Returns
+    -------
+    beta : `numpy.ndarray`
+        The cost of each pulsar's fit.
+    """
+    abs_residuals = np.abs(residuals)
+    rho = np.where(abs_residuals < k, residuals**2 / 2, k * abs_residuals - k**2 / 2)
+    return np.sum(np.where(mask, rho, 0.0), axis=-1)
+
+
+def batch_fit_spectral_model(
+    cat_list,
+    pulsars=None,
+    model_name="simple_power_law",
+    max_iter=1000,
+    tol=1e-10,
+    fallback=True,
+    use_jit=False,
+):
+    """Fit a spectral model to many pulsars at once.
+
+    The data of all pulsars are stacked into padded arrays and a robust (Huber loss) Levenberg-Marquardt minimiser
+    takes a step for every pulsar at once, so the Python overhead is shared by all the pulsars.
+    The parameters limits are applied with the same transforms as Minuit.
+    Pulsars with all their bandwidths are fit with the model's bandwidth intergration correction.
+
+    Parameters
+    ----------
+    cat_list : `dict`
+        The catalogue from :py:meth:`pulsar_spectra.catalogue.collect_catalogue_fluxes`.
+    pulsars : `list`, optional
+        The Jnames of the pulsars to fit. |br| Default: None, will fit all pulsars with data.
+    model_name : `str`, optional
+        One of the model names from :py:meth:`pulsar_spectra.models.model_registry`. |br| Default: "simple_power_law".
+    max_iter : `int`, optional
+        The maximum number of Levenberg-Marquardt steps. |br| Default: 1000.
+    tol : `float`, optional
+        A fit has converged when a step reduces its cost by less than this fraction. |br| Default: 1e-10.
+    fallback : `boolean`, optional
+        Refit the pulsars that did not converge with :py:meth:`pulsar_spectra.spectral_fit.iminuit_fit_spectral_model`.
+        |br| Default: True.
+    use_jit : `boolean`, optional
+        Use the numba compiled models from :py:meth:`pulsar_spectra.jit_models.jit_model` if numba is installed.
+        |br| Default: False.
+
+    Returns
+    -------
+    fit_results : `dict`
+        The fit of each pulsar keyed by the pulsar's Jname, in the format of
+        :py:meth:`pulsar_spectra.spectral_fit.fit_result_to_dict` with the extra keys:
+
+        ``'converged'`` : `boolean`
+            If the fit converged.
+        ``'engine'`` : `str`
+            "lm" for the batch fit or "iminuit" if the pulsar was refit by iminuit.
+
+        The ``'fit_time'`` of the batch fits is the time of the whole batch divided by the number of pulsars.
+        Pulsars with too few data points for the model are left out.
+    """
+    if pulsars is None:
+        pulsars = [pulsar for pulsar in cat_list.keys() if len(cat_list[pulsar][0]) > 0]
+    model_spec = get_model(model_name)
+    k = len(model_spec.start_params)  # number of free model parameters
+    fit_pulsars = []
+    for pulsar in pulsars:
+        if len(cat_list[pulsar][0]) <= k + 1:
+            logger.debug(f"Only {len(cat_list[pulsar][0])} supplied for {model_name} model fit of {pulsar} so skipping")
+        else:
+            fit_pulsars.append(pulsar)
+    if len(fit_pulsars) == 0:
+        return {}
+
+    # Fit the pulsars with and without all their bandwidths separately as they use different model functions
+    freqs_Hz, bands_Hz, fluxs_Jy, flux_errs_Jy, mask = stack_pulsar_data(cat_list, fit_pulsars)
+    band_bools = ~np.any(np.isnan(bands_Hz), axis=1)
+    fit_results = {}
+    for band_bool in (False, True):
+        batch = np.flatnonzero(band_bools == band_bool)
+        if len(batch) == 0:
+            continue
+        start_time = time.perf_counter()
+        values, covariance, aics, converged, nfcn = _lm_fit(
+            model_spec,
+            freqs_Hz[batch],
+            bands_Hz[batch] if band_bool else None,
+            fluxs_Jy[batch],
+            flux_errs_Jy[batch],
+            mask[batch],
+            max_iter=max_iter,
+            tol=tol,
+            use_jit=use_jit,
+        )
+        fit_time = (time.perf_counter() - start_time) / len(batch)
+        parameters = list(inspect.signature(model_spec.function).parameters)[1:]
+        for i, pulsar_i in enumerate(batch):
+            fit_results[fit_pulsars[pulsar_i]] = {
+                "pulsar": fit_pulsars[pulsar_i],
+                "model": model_name,
+                "parameters": parameters,
+                "values": values[i].tolist(),
+                "errors": np.sqrt(np.abs(np.diag(covariance[i]))).tolist(),
+                "covariance": covariance[i].tolist() if converged[i] else None,
+                "aic": float(aics[i]),
+                "band_bool": band_bool,
+                "nfcn": int(nfcn[i]),
+                "fit_time": fit_time,
+                "converged": bool(converged[i]),
+                "engine": "lm",
+            }
+
+    n_failed = sum(not fit_result["converged"] for fit_result in fit_results.values())
+    logger.debug(f"{len(fit_results) - n_failed} of {len(fit_results)} {model_name} batch fits converged")
+    if fallback:
+        for pulsar, fit_result in fit_results.items():
+            if fit_result["converged"]:
+                continue
+            logger.debug(f"Refitting {pulsar} {model_name} with iminuit")
+            _, iminuit_result, _, _ = iminuit_fit_spectral_model(
+                *cat_list[pulsar], model_name=model_name, use_jit=use_jit
+            )
+            if iminuit_result is not None:
+                fit_result = fit_result_to_dict(pulsar, model_name, iminuit_result)
+                fit_result["converged"] = bool(iminuit_result.valid)
+                fit_result["engine"] = "iminuit"
+                fit_results[pulsar] = fit_result
+    return fit_results
+
+
+def _lm_fit(
+    model_spec,
+    freqs_Hz,
+    bands_Hz,
+    fluxs_Jy,
+    flux_errs_Jy,
+    mask,
+    max_iter=1000,
+    tol=1e-10,
+    use_jit=False,
+    start_values=None,
+    v0_Hz=None,
+    max_freqs_Hz=None,
+):
+    """Minimise the robust cost of a batch of pulsars with the Levenberg-Marquardt algorithm.
+
+    Each step solves (J^T W J + lambda D) delta = -J^T W r for every pulsar at once, where W are the
+    iteratively reweighted least squares weights of the Huber loss, J is the jacobian of the residuals r with respect
+    to the internal (unbounded) parameters, lambda is the damping of each pulsar's fit and D is diag(J^T W J) with
+    a floor of a tenth of its largest value.
+    The start values, reference frequencies and maximum frequencies (which set the cut off frequency limits) default
+    to those of the model and each row's data but can be given so all rows share them (e.g. bootstrap replicates).
+    """
+    n_pulsars = len(freqs_Hz)
+    n_data = np.sum(mask, axis=1)
+    model_function = model_spec.function if bands_Hz is None else model_spec.integrate_function
+    if use_jit:
+        model_function = jit_model(model_function)
+    if bands_Hz is None:
+        x = freqs_Hz
+    else:
+        x = (freqs_Hz - bands_Hz / 2, freqs_Hz + bands_Hz / 2)
+    # Reference frequency is the logarithmic centre frequency of each pulsar
+    masked_freqs = np.where(mask, freqs_Hz, np.nan)
+    if v0_Hz is None:
+        v0_Hz = 10 ** ((np.log10(np.nanmin(masked_freqs, axis=1)) + np.log10(np.nanmax(masked_freqs, axis=1))) / 2)
+    else:
+        v0_Hz = np.broadcast_to(np.asarray(v0_Hz, dtype=float), (n_pulsars,))
+    if max_freqs_Hz is None:
+        max_freqs_Hz = np.nanmax(masked_freqs, axis=1)
+    else:
+        max_freqs_Hz = np.broadcast_to(np.asarray(max_freqs_Hz, dtype=float), (n_pulsars,))
+
+    # Set up the start parameters and limits of each pulsar
+    n_params = len(model_spec.start_params)
+    start = np.tile(np.array(model_spec.start_params, dtype=float), (n_pulsars, 1))
+    lower = np.full((n_pulsars, n_params), -np.inf)
+    upper = np.full((n_pulsars, n_params), np.inf)
+    for j, limit in enumerate(model_spec.mod_limits):
+        if limit is None:
+            # The cut off frequency limits are based on the data set's frequency range
+            lower[:, j] = max_freqs_Hz
+            upper[:, j] = 10 * max_freqs_Hz
+            start[:, j] = max_freqs_Hz
+            continue
+        if limit[0] is not None:
+            lower[:, j] = limit[0]
+        if limit[1] is not None:
+            upper[:, j] = limit[1]
+    if start_values is not None:
+        start = np.array(np.broadcast_to(np.asarray(start_values, dtype=float), (n_pulsars, n_params)))
+    # Move any start parameters that are on a limit inside the limits so the transforms have a gradient
+    span = np.where(np.isfinite(upper - lower), upper - lower, np.abs(start) + 1)
+    start = np.clip(start, lower + 1e-3 * span, upper - 1e-3 * span)
+    u = _to_internal(start, lower, upper)
+
+    def residuals(u_params, rows):
+        theta = _to_external(u_params, lower[rows], upper[rows])
+        params = [theta[:, j, np.newaxis] for j in range(n_params)] + [v0_Hz[rows, np.newaxis]]
+        rows_x = x[rows] if bands_Hz is None else (x[0][rows], x[1][rows])
+        with np.errstate(all="ignore"):
+            model = model_function(rows_x, *params)
+        r = (model - fluxs_Jy[rows]) / flux_errs_Jy[rows]
+        return np.where(mask[rows] & np.isfinite(r), r, 0.0), np.isfinite(r) | ~mask[rows]
+
+    def jacobian(u_params, rows, r):
+        jac = np.empty(r.shape + (n_params,))
+        for j in range(n_params):
+            step = 1e-7 * np.maximum(np.abs(u_params[:, j]), 1.0)
+            u_step = u_params.copy()
+            u_step[:, j] += step
+            jac[..., j] = (residuals(u_step, rows)[0] - r) / step[:, np.newaxis]
+        return jac
+
+    all_rows = np.arange(n_pulsars)
+    r, finite = residuals(u, all_rows)
+    cost = huber_cost(r, mask)
+    cost[~np.all(finite, axis=1)] = np.inf
+    damping = np.full(n_pulsars, 1e-3)
+    # The magnitude of the parameters without both limits (the others are angles)
+    scale = np.where(np.isfinite(lower) & np.isfinite(upper), 1.0, np.maximum(np.abs(u), 1.0))
+    converged = np.zeros(n_pulsars, dtype=bool)
+    nfcn = np.ones(n_pulsars, dtype=int)
+    k = 1.345
+    for _ in range(max_iter):
+        rows = np.flatnonzero(~converged & (damping < 1e12) & np.isfinite(cost))
+        if len(rows) == 0:
+            break
+        r_rows = r[rows]
+        jac = jacobian(u[rows], rows, r_rows)
+        # Iteratively reweighted least squares weights of the Huber loss
+        abs_r = np.abs(r_rows)
+        weights = np.where(abs_r < k, 1.0, k / np.maximum(abs_r, k)) * mask[rows]
+        jtwj = np.einsum("pni,pn,pnj->pij", jac, weights, jac)
+        jtwr = np.einsum("pni,pn,pn->pi", jac, weights, r_rows)
+        # Floor the Marquardt scaling so a parameter on a limit (with no gradient) can't take huge steps.
+        # The floor is in units of each parameter's start magnitude so large parameters (e.g. c) can still move
+        diag = np.einsum("pii->pi", jtwj) * scale[rows] ** 2
+        diag = np.maximum(diag, 1e-1 * np.max(diag, axis=1, keepdims=True) + 1e-12) / scale[rows] ** 2
+        lhs = jtwj + damping[rows, np.newaxis, np.newaxis] * diag[:, :, np.newaxis] * np.eye(n_params)
+        try:
+            delta = -np.linalg.solve(lhs, jtwr[..., np.newaxis])[..., 0]
+        except np.linalg.LinAlgError:
+            delta = -np.einsum("pij,pj->pi", np.linalg.pinv(lhs), jtwr)
+        u_new = u[rows] + delta
+        r_new, finite_new = residuals(u_new, rows)
+        cost_new = huber_cost(r_new, mask[rows])
+        cost_new[~np.all(finite_new, axis=1)] = np.inf
+        nfcn[rows] += n_params + 1
+
+        improved = cost_new < cost[rows]
+        # Only trust a small change in cost if the step was not heavily damped
+        small_change = ((cost[rows] - cost_new) <= tol * (1 + cost[rows])) & (damping[rows] <= 1e-2)
+        # Accept the steps that improved the cost and reduce their damping
+        accept = rows[improved]
+        u[accept] = u_new[improved]
+        r[accept] = r_new[improved]
+        converged[accept] = small_change[improved]
+        cost[accept] = cost_new[improved]
+        damping[accept] = np.maximum(damping[accept] / 3, 1e-12)
+        damping[rows[~improved]] *= 10
+
+    # A fit that can't improve because the gradient is zero has also converged
+    r, _ = residuals(u, all_rows)
+    jac = jacobian(u, all_rows, r)
+    abs_r = np.abs(r)
+    weights = np.where(abs_r < k, 1.0, k / np.maximum(abs_r, k)) * mask
+    gradient = np.einsum("pni,pn,pn->pi", jac, weights, r)
+    converged |= np.isfinite(cost) & np.all(np.abs(gradient) <= 1e-6 * (1 + cost[:, np.newaxis]), axis=1)
+
+    # Covariance from the hessian of the cost with respect to the bounded parameters
+    values = _to_external(u, lower, upper)
+    ext_jac = np.empty(r.shape + (n_params,))
+    for j in range(n_params):
+        step = 1e-6 * np.maximum(np.abs(values[:, j]), 1e-12)
+        u_step = u.copy()
+        u_step[:, j] = _to_internal(values[:, j] + step, lower[:, j], upper[:, j])
+        # Use a backward step for parameters on their upper limit
+        at_upper = np.abs(_to_external(u_step, lower, upper)[:, j] - values[:, j]) < step / 2
+        u_step[at_upper, j] = _to_internal(values[at_upper, j] - step[at_upper], lower[at_upper, j], upper[at_upper, j])
+        signed_step = np.where(at_upper, -step, step)
+        ext_jac[..., j] = (residuals(u_step, all_rows)[0] - r) / signed_step[:, np.newaxis]
+    # Only the residuals inside the Huber threshold contribute to the hessian
+    hessian = np.einsum("pni,pn,pnj->pij", ext_jac, (abs_r < k) * mask, ext_jac)
+    param_covariance = 2 * np.linalg.pinv(hessian)
+    converged &= np.all(np.isfinite(param_covariance), axis=(1, 2))
+
+    # Add the fixed reference frequency
+    values = np.hstack([values, v0_Hz[:, np.newaxis]])
+    covariance = np.zeros((n_pulsars, n_params + 1, n_params + 1))
+    covariance[:, :n_params, :n_params] = param_covariance
+    aics = 2 * cost + 2 * n_params + (2 * n_params * (n_params + 1)) / (n_data - n_params - 1)
+    return values, covariance, aics, converged, nfcn
+
+
+def batch_find_best_spectral_fit(cat_list, pulsars=None, max_iter=1000, tol=1e-10, fallback=True, use_jit=False):
+    """Fit all the models to many pulsars at once with :py:meth:`pulsar_spectra.batch_fit.batch_fit_spectral_model`
+    and find the best model for each pulsar.
+
+    Parameters
+    ----------
+    cat_list : `dict`
+        The catalogue from :py:meth:`pulsar_spectra.catalogue.collect_catalogue_fluxes`.
+    pulsars : `list`, optional
+        The Jnames of the pulsars to fit. |br| Default: None, will fit all pulsars with data.
+    max_iter : `int`, optional
+        The maximum number of Levenberg-Marquardt steps. |br| Default: 1000.
+    tol : `float`, optional
+        A fit has converged when a step reduces its cost by less than this fraction. |br| Default: 1e-10.
+    fallback : `boolean`, optional
+        Refit the pulsars that did not converge with :py:meth:`pulsar_spectra.spectral_fit.iminuit_fit_spectral_model`.
+        |br| Default: True.
+    use_jit : `boolean`, optional
+        Use the numba compiled models from :py:meth:`pulsar_spectra.jit_models.jit_model` if numba is installed.
+        |br| Default: False.
+
+    Returns
+    -------
+    best_fits : `dict`
+        The best fit of each pulsar keyed by the pulsar's Jname, in the format of
+        :py:meth:`pulsar_spectra.batch_fit.batch_fit_spectral_model` with the probability that the best-fit model
+        is actually the best-fit model (``'p_best'``). Only converged fits are compared.
+    """
+    if pulsars is None:
+        pulsars = [pulsar for pulsar in cat_list.keys() if len(cat_list[pulsar][0]) > 0]
+    model_fits = {}
+    for model_name in model_registry():
+        fit_results = batch_fit_spectral_model(
+            cat_list, pulsars, model_name=model_name, max_iter=max_iter, tol=tol, fallback=fallback, use_jit=use_jit
+        )
+        for pulsar, fit_result in fit_results.items():
+            if fit_result["converged"]:
+                model_fits.setdefault(pulsar, []).append(fit_result)
+
+    best_fits = {}
+    for pulsar, fit_results in model_fits.items():
+        aics = np.array([fit_result["aic"] for fit_result in fit_results])
+        aici = np.argmin(aics)
+        # Calc probability of best fit
+        best_fit = dict(fit_results[aici])
+        best_fit["p_best"] = float(1 / np.sum(np.exp(-1 / 2 * np.abs(aics - aics[aici]))))
+        best_fits[pulsar] = best_fit
+    return best_fits
+
+
+def bootstrap_spectral_fit(
+    freqs_MHz,
+    bands_MHz,
+    fluxs_mJy,
+    flux_errs_mJy,
+    refs,
+    model_name="simple_power_law",
+    iminuit_result=None,
+    n_boot=1000,
+    per_reference=False,
+    percentiles=(16, 50, 84),
+    derived_functions=None,
+    seed=None,
+    max_iter=1000,
+    tol=1e-10,
+    use_jit=False,
+):
+    """Estimate the uncertainties of a spectral fit by bootstrap resampling the measurements.
+
+    Every replicate is a resample (with replacement) of the measurements, or of the references if ``per_reference``,
+    and all the replicates are fit at once by the batch Levenberg-Marquardt minimiser
+    (see :py:meth:`pulsar_spectra.batch_fit.batch_fit_spectral_model`) starting from the best fit.
+    The replicates share the best fit's reference frequency, cut off frequency limits and bandwidth correction.
+
+    Parameters
+    ----------
+    freqs_MHz : `list`
+        A list of the frequencies in MHz.
+    bands_MHz : `list`
+        A list of the bandwidths in MHz.
+    fluxs_mJy : `list`
+        A list of the flux density in mJy.
+    flux_errs_mJy : `list`
+        A list of the uncertainty of the flux density in mJy.
+    refs : `list`
+        A list of the reference labels (in the format 'Author_year').
+    model_name : `str`, optional
+        One of the model names from :py:meth:`pulsar_spectra.models.model_registry`. |br| Default: "simple_power_law".
+    iminuit_result : `iminuit.Minuit`, optional
+        The best fit from :py:meth:`pulsar_spectra.spectral_fit.iminuit_fit_spectral_model`.
+        |br| Default: None, will fit the model.
+    n_boot : `int`, optional
+        The number of bootstrap replicates. |br| Default: 1000.
+    per_reference : `boolean`, optional
+        Resample the references instead of the measurements so the replicates keep each reference's measurements
+        together, which includes the scatter between references. |br| Default: False.
+    percentiles : `tuple`, optional
+        The percentiles of the replicates to return. |br| Default: (16, 50, 84).
+    derived_functions : `dict`, optional
+        Extra quantities to compute from the parameter values of every replicate, keyed by name.
+        Each function takes the values with the shape (n_boot, n_params) and returns an array of length n_boot.
+        |br| Default: None, only the peak frequency (``'peak_frequency'``) from
+        :py:meth:`pulsar_spectra.analysis.peak_frequency` is computed.
+    seed : `int`, optional
+        The seed of the random resampling. |br| Default: None.
+    max_iter : `int`, optional
+        The maximum number of Levenberg-Marquardt steps. |br| Default: 1000.
+    tol : `float`, optional
+        A fit has converged when a step reduces its cost by less than this fraction. |br| Default: 1e-10.
+    use_jit : `boolean`, optional
+        Use the numba compiled models from :py:meth:`pulsar_spectra.jit_models.jit_model` if numba is installed.
+        |br| Default: False.
+
+    Returns
+    -------
+    bootstrap_result : `dict`
+        None if the model could not be fit, otherwise a dictionary with the keys:
+
+        ``'model'`` : `str`
+            The model name.
+        ``'parameters'`` : `list`
+            The parameter names (including the fixed reference frequency v0).
+        ``'values'`` : `list`
+            The best fit parameter values.
+        ``'percentiles'`` : `list`
+            The percentiles of the intervals.
+        ``'intervals'`` : `dict`
+            The percentiles of each free parameter and derived quantity, keyed by name.
+            The peak frequency (in Hz) is NaN for replicates whose peak is more than a decade outside of the data.
+        ``'samples'`` : `dict`
+            The values of each free parameter and derived quantity of the converged replicates, keyed by name.
+        ``'n_boot'`` : `int`
+            The number of replicates.
+        ``'n_converged'`` : `int`
+            The number of replicates whose fit converged, which are the only ones used.
+    """
+    if iminuit_result is None:
+        _, iminuit_result, _, _ = iminuit_fit_spectral_model(
+            freqs_MHz, bands_MHz, fluxs_mJy, flux_errs_mJy, refs, model_name=model_name, use_jit=use_jit
+        )
+        if iminuit_result is None:
+            return None
+    band_bool = iminuit_result.fit_stats["band_bool"]
+    model_spec = get_model(model_name)
+    parameters = list(iminuit_result.parameters)
+    best_values = np.array(iminuit_result.values, dtype=float)
+    n_params = len(best_values) - 1
+
+    # Resampled indices of each replicate, padded with the first index
+    rng = np.random.default_rng(seed)
+    n_data = len(freqs_MHz)
+    if per_reference:
+        ref_indices = {}
+        for i, ref in enumerate(refs):
+            ref_indices.setdefault(ref, []).append(i)
+        ref_indices = list(ref_indices.values())
+        ref_choices = rng.integers(0, len(ref_indices), size=(n_boot, len(ref_indices)))
+        replicates = [np.concatenate([ref_indices[ref_i] for ref_i in choice]) for choice in ref_choices]
+        max_n_data = max(len(replicate) for replicate in replicates)
+        indices = np.zeros((n_boot, max_n_data), dtype=int)
+        mask = np.zeros((n_boot, max_n_data), dtype=bool)
+        for i, replicate in enumerate(replicates):
+            indices[i, : len(replicate)] = replicate
+            indices[i, len(replicate) :] = replicate[0]
+            mask[i, : len(replicate)] = True
+    else:
+        indices = rng.integers(0, n_data, size=(n_boot, n_data))
+        mask = np.ones((n_boot, n_data), dtype=bool)
+
+    freqs_Hz = np.array(freqs_MHz, dtype=float)[indices] * 1e6
+    fluxs_Jy = np.array(fluxs_mJy, dtype=float)[indices] / 1e3
+    flux_errs_Jy = np.array(flux_errs_mJy, dtype=float)[indices] / 1e3
+    bands_Hz = np.array(bands_MHz, dtype=float)[indices] * 1e6 if band_bool else None
+    start_time = time.perf_counter()
+    values, _, _, converged, _ = _lm_fit(
+        model_spec,
+        freqs_Hz,
+        bands_Hz,
+        fluxs_Jy,
+        flux_errs_Jy,
+        mask,
+        max_iter=max_iter,
+        tol=tol,
+        use_jit=use_jit,
+        start_values=best_values[:-1],
+        v0_Hz=best_values[-1],
+        max_freqs_Hz=max(freqs_MHz) * 1e6,
+    )
+    # Replicates with too few distinct frequencies can't constrain the model
+    n_freqs = np.array([len(np.unique(row[row_mask])) for row, row_mask in zip(freqs_Hz, mask)])
+    converged &= n_freqs > n_params
+    logger.debug(
+        f"{np.sum(converged)} of {n_boot} {model_name} bootstrap fits converged in {time.perf_counter() - start_time:.2f} s"
+    )
+
+    samples = {parameter: values[converged, j] for j, parameter in enumerate(parameters[:-1])}
+    if derived_functions is None:
+        freq_range_Hz = (min(freqs_MHz) * 1e5, max(freqs_MHz) * 1e7)
+        derived_functions = {
+            "peak_frequency": lambda fit_values: peak_frequency(model_spec.function, fit_values, freq_range_Hz),
+        }
+    for name, derived_function in derived_functions.items():
+        samples[name] = np.asarray(derived_function(values[converged]), dtype=float)
+    intervals = {}
+    for name, sample in samples.items():
+        finite_sample = sample[np.isfinite(sample)]
+        if len(finite_sample) == 0:
+            intervals[name] = [np.nan] * len(percentiles)
+        else:
+            intervals[name] = np.percentile(finite_sample, percentiles).tolist()
+
+    return {
+        "model": model_name,
+        "parameters": parameters,
+        "values": best_values.tolist(),
+        "percentiles": list(percentiles),
+        "intervals": intervals,
+        "samples": samples,
+        "n_boot": n_boot,
+        "n_converged": int(np.sum(converged)),
+    }
@@ -2,6 +2,7 @@
 Loads all the data required by vcstools from the data directory.
 """
 
+import functools
 import glob
 import logging
 import os
@@ -435,6 +436,82 @@ def all_flux_from_atnf(query=None, adjust_errors=True):
     return jname_cat
 
 
+# refs that have errors that we plan to inform ATNF about
+ATNF_INCORRECT_REFS = [
+    "Zhao_2019",
+    "Mignani_2017",
+    "Bell_2016",
+    "Robinson_1995",
+    "Johnston_1994",
+    "Manchester_1996",
+    "Xie_2019",
+    "Han_2016",
+    "Kramer_1999",
+    "Kondratiev_2015",
+    "Crawford_2001",
+    "Michilli_2020",
+    "Manchester_2013",
+    "Brinkman_2018",
+    "Fruchter_1990",
+]
+# refs that are correct but where scaled to by their spectral index for the ATNF frequencies
+ATNF_ADJUSTED_REFS = [
+    "Lorimer_1995b",
+    "Stovall_2015",
+    "Sanidas_2019",
+    "Wolszczan_1992",
+    "Dembska_2014",
+    "Kaur_2019",
+    "Alam_2021",
+    "Foster_1991",
+]
+# refs that were rounded to different decimal places than the publications
+ATNF_ROUNDED_REFS = [
+    "Johnston_2018",
+    "Dai_2015",
+    "McEwen_2020",
+    "McConnell_1991",
+    "Bondonneau_2020",
+    "Johnston_2021",
+    "Bates_2011",
+    "Han_2021",
+    "Sayer_1997",
+    "Lynch_2012",
+    "Stovall_2014",
+    "Crowter_2020",
+    "Bilous_2016",
+    "Frail_2016",
+    "Gitika_2023",
+    "Dembska_2015",
+    "Wang_2024",
+    "Keith_2024",
+    "Deneva_2024",
+]
+# refs that have different uncertainties than published
+ATNF_UNCERT_REFS = [
+    "Stairs_1999",
+    "Kuzmin_2001",
+    "Jankowski_2019",
+    "Jankowski_2018",
+    "Kramer_2003a",
+    "Manchester_2001",
+    "Morris_2002",
+    "Zhang_2019",
+    "Bangale_2024",
+    "Martsen_2022",
+]
+ATNF_OTHER_REFS = [
+    "Taylor_1993",  # excluding due to duplication of other references
+    "Ahmad_2024",  # need to add this to the pulsar_spectra catalogue properly
+    "Spiewak_2022",  # delibrately excluded for pulsars with Gitika_2023 data, see Issue #108
+    "Ro.Zko_2018",  # named Rozko_2018 in pulsar_spectra catalogue, so strings don't match
+    "Ro.zko_2021",  # named Rozko_2021 in pulsar_spectra catalogue, so strings don't match
+    "Kijak_2021",  # frequencies were rounded to nearest 100 MHz
+]
+# all the ATNF references that are left out of collect_catalogue_fluxes
+ATNF_EXCLUDED_REFS = ATNF_INCORRECT_REFS + ATNF_ADJUSTED_REFS + ATNF_ROUNDED_REFS + ATNF_UNCERT_REFS + ATNF_OTHER_REFS
+
+
 def collect_catalogue_fluxes(only_use=None, exclude=None, query=None, use_atnf=True, adjust_errors=True):
     """Collect the fluxes from all of the catalogues recorded in this repo.
 
@@ -539,79 +616,6 @@ def collect_catalogue_fluxes(only_use=None, exclude=None, query=None, use_atnf=T
 
     # Add the atnf to the cataogues
     atnf_dict = all_flux_from_atnf(query=query, adjust_errors=adjust_errors)
-    # refs that have errors that we plan to inform ATNF about
-    atnf_incorrect_refs = [
-        "Zhao_2019",
-        "Mignani_2017",
-        "Bell_2016",
-        "Robinson_1995",
-        "Johnston_1994",
-        "Manchester_1996",
-        "Xie_2019",
-        "Han_2016",
-        "Kramer_1999",
-        "Kondratiev_2015",
-        "Crawford_2001",
-        "Michilli_2020",
-        "Manchester_2013",
-        "Brinkman_2018",
-        "Fruchter_1990",
-    ]
-    # refs that are correct but where scaled to by their spectral index for the ATNF frequencies
-    atnf_adjusted_refs = [
-        "Lorimer_1995b",
-        "Stovall_2015",
-        "Sanidas_2019",
-        "Wolszczan_1992",
-        "Dembska_2014",
-        "Kaur_2019",
-        "Alam_2021",
-        "Foster_1991",
-    ]
-    # refs that were rounded to different decimal places than the publications
-    atnf_rounded_refs = [
-        "Johnston_2018",
-        "Dai_2015",
-        "McEwen_2020",
-        "McConnell_1991",
-        "Bondonneau_2020",
-        "Johnston_2021",
-        "Bates_2011",
-        "Han_2021",
-        "Sayer_1997",
-        "Lynch_2012",
-        "Stovall_2014",
-        "Crowter_2020",
-        "Bilous_2016",
-        "Frail_2016",
-        "Gitika_2023",
-        "Dembska_2015",
-        "Wang_2024",
-        "Keith_2024",
-        "Deneva_2024",
-    ]
-    # refs that have different uncertainties than published
-    atnf_uncert_refs = [
-        "Stairs_1999",
-        "Kuzmin_2001",
-        "Jankowski_2019",
-        "Jankowski_2018",
-        "Kramer_2003a",
-        "Manchester_2001",
-        "Morris_2002",
-        "Zhang_2019",
-        "Bangale_2024",
-        "Martsen_2022",
-    ]
-    atnf_other_refs = [
-        "Taylor_1993",  # excluding due to duplication of other references
-        "Ahmad_2024",  # need to add this to the pulsar_spectra catalogue properly
-        "Spiewak_2022",  # delibrately excluded for pulsars with Gitika_2023 data, see Issue #108
-        "Ro.Zko_2018",  # named Rozko_2018 in pulsar_spectra catalogue, so strings don't match
-        "Ro.zko_2021",  # named Rozko_2021 in pulsar_spectra catalogue, so strings don't match
-        "Kijak_2021",  # frequencies were rounded to nearest 100 MHz
-    ]
-
     for jname in jnames:
         for ref in atnf_dict[jname].keys():
             # Remove "_atnf" from the end of  the reference
@@ -623,15 +627,7 @@ def collect_catalogue_fluxes(only_use=None, exclude=None, query=None, use_atnf=T
                     continue
             if exclude is None:
                 exclude = []
-            if (
-                raw_ref
-                in exclude
-                + atnf_incorrect_refs
-                + atnf_adjusted_refs
-                + atnf_rounded_refs
-                + atnf_uncert_refs
-                + atnf_other_refs
-            ):
+            if raw_ref in exclude + ATNF_EXCLUDED_REFS:
                 # exclude by skipping
                 continue
 
@@ -661,6 +657,34 @@ def collect_catalogue_fluxes(only_use=None, exclude=None, query=None, use_atnf=T
     return jname_cat_list
 
 
+@functools.lru_cache(maxsize=None)
+def get_reference_index():
+    """Index the papers in the catalogue that have measurements of each pulsar.
+
+    The catalogue yaml files are parsed with the C yaml loader (if available) and only the pulsar keys are used, so
+    this is much faster than :py:meth:`collect_catalogue_fluxes` when you only need to know which papers measured a
+    pulsar. The index is cached, so the files are only read once.
+    It does not include the ATNF pulsar catalogue references.
+
+    Returns
+    -------
+    ref_index : `dict`
+        The sorted reference labels (in the format 'Author_year') of each pulsar, in the format ref_index[jname].
+        It is shared by all callers so should not be modified.
+    """
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    ref_index = {}
+    for cat_file in sorted(CAT_YAMLS):
+        cat_label = os.path.basename(cat_file).split(".")[0]
+        with open(cat_file, "r") as stream:
+            cat_dict = yaml.load(stream, Loader=loader)
+        for jname, entry in cat_dict.items():
+            # Skip the pulsars listed without any measurements
+            if jname != "Paper Metadata" and len(entry["Frequency MHz"]) > 0:
+                ref_index.setdefault(jname, []).append(cat_label)
+    return ref_index
+
+
 def convert_cat_list_to_dict(jname_cat_list):
     """
     Returns
@@ -700,3 +724,44 @@ def convert_cat_list_to_dict(jname_cat_list):
                 jname_cat_dict[jname][ref]["Flux Density mJy"] = [flux]
                 jname_cat_dict[jname][ref]["Flux Density error mJy"] = [flux_err]
     return jname_cat_dict
+
+
+def catalogue_summary(cat_list=None, query=None):
+    """Summarise the number of pulsars and the frequency range of each paper and the ATNF pulsar catalogue
+    in the compiled catalogue.
+
+    Parameters
+    ----------
+    cat_list : `dict`, optional
+        The catalogue from :py:meth:`pulsar_spectra.catalogue.collect_catalogue_fluxes`.
+        |br| Default: None, will collect the whole catalogue.
+    query : psrqpy object, optional
+        A previous psrqpy.QueryATNF query used to collect the catalogue. Can be supplied to prevent performing a new query.
+
+    Returns
+    -------
+    summary : `pandas.DataFrame`
+        A row for each reference label ('ATNF' for all the ATNF pulsar catalogue measurements, then the papers sorted
+        by year and author) with the columns:
+
+        ``'n_pulsars'`` : `int`
+            The number of pulsars with measurements.
+        ``'n_points'`` : `int`
+            The number of measurements.
+        ``'min_freq_MHz'`` : `float`
+            The lowest frequency (frequency - bandwidth / 2) in MHz.
+        ``'max_freq_MHz'`` : `float`
+            The highest frequency (frequency + bandwidth / 2) in MHz.
+        ``'ads'`` : `str`
+            The ADS link of the paper, or None.
+    """
+    from pulsar_spectra.selection import FrequencyCoverageIndex
+
+    if cat_list is None:
+        cat_list = collect_catalogue_fluxes(query=query)
+    coverage = FrequencyCoverageIndex(cat_list).coverage_table(by="reference", group_atnf=True)
+    summary = coverage[["n_pulsars", "n_points", "min_freq_MHz", "max_freq_MHz"]].rename_axis("ref")
+    summary["ads"] = [ADS_REF.get(ref) for ref in summary.index]
+    # ATNF first then sort by year then author
+    order = sorted(summary.index, key=lambda ref: (ref != "ATNF", ref.split("_")[-1], ref.split("_")[0]))
+    return summary.loc[order]
@@ -4,9 +4,11 @@ import yaml
 import psrqpy
 
 from pulsar_spectra.scripts.csv_to_yaml import dump_yaml
+from pulsar_spectra.names import get_name_index
 
 query = psrqpy.QueryATNF(params=["PSRJ", "NAME", "PSRB", "P0"]).pandas
 all_jnames = list(query["PSRJ"])
+name_index = get_name_index()
 
 with open("Alam_2021_raw.csv") as file:
     tsv_file = csv.reader(file, delimiter=" ")
@@ -35,11 +37,8 @@ for row in lines:
         pid = list(query["PSRB"]).index(pulsar)
         pulsar = query["PSRJ"][pid]
 
-    # Incorrect names
-    if pulsar == "J1804-2718":
-        pulsar = "J1804-2717"
-    if pulsar == "J2129-5718":
-        pulsar = "J2129-5721"
+    # Incorrect names (see configs/pulsar_aliases.yaml)
+    pulsar = name_index.resolve(pulsar) or pulsar
     if pulsar not in all_jnames:
         print(pulsar)
 
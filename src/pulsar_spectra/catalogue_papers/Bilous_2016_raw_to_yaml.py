@@ -3,8 +3,10 @@ import psrqpy
 import csv
 
 from pulsar_spectra.scripts.csv_to_yaml import dump_yaml
+from pulsar_spectra.names import get_name_index
 
 query = psrqpy.QueryATNF(params=['PSRJ', 'NAME', 'PSRB']).pandas
+name_index = get_name_index()
 
 with open("Bilous_2016_raw.tsv", "r") as raw_file:
     tsv_file = csv.reader(raw_file, delimiter="\t")
@@ -33,17 +35,8 @@ for row in lines:
         pulsar = query['PSRJ'][pid]
     else:
         pulsar = row[0].strip().replace("–", "-")
-    # Wrong names I found
-    if pulsar == "J0435+27":
-        pulsar = "J0435+2749"
-    elif pulsar == "J0943+22":
-        pulsar = "J0943+2253"
-    elif pulsar == "J0947+27":
-        pulsar = "J0947+2740"
-    elif pulsar == "J1238+21":
-        pulsar = "J1238+2152"
-    elif pulsar == "J1246+22":
-        pulsar = "J1246+2253"
+    # Wrong names I found (see configs/pulsar_aliases.yaml)
+    pulsar = name_index.resolve(pulsar) or pulsar
 
     if row[1] == '<':
         continue
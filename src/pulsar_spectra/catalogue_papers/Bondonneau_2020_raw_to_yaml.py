@@ -1,6 +1,9 @@
 import yaml
 
 from pulsar_spectra.scripts.csv_to_yaml import dump_yaml
+from pulsar_spectra.names import get_name_index
+
+name_index = get_name_index()
 
 with open("Bondonneau_2020_raw.txt", "r") as raw_file:
     lines = raw_file.readlines()
@@ -22,9 +25,8 @@ for row in lines:
         band = 30
     else:
         band = 55
-    # Wrong names I found
-    if pulsar == "J0927+23":
-        pulsar = "J0927+2345"
+    # Wrong names I found (see configs/pulsar_aliases.yaml)
+    pulsar = name_index.resolve(pulsar) or pulsar
 
     pulsar_dict[pulsar] = {
         "Frequency MHz":[freq],
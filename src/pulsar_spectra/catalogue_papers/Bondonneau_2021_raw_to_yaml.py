@@ -3,6 +3,7 @@ import psrqpy
 import csv
 
 from pulsar_spectra.scripts.csv_to_yaml import dump_yaml
+from pulsar_spectra.names import get_name_index
 
 with open("Bondonneau_2021_raw.csv", "r") as file:
     tsv_file = csv.reader(file, delimiter=" ")
@@ -11,6 +12,7 @@ with open("Bondonneau_2021_raw.csv", "r") as file:
         lines.append(line)
 query = psrqpy.QueryATNF(params=['PSRJ', 'NAME', 'PSRB']).pandas
 all_jnames = list(query['PSRJ'])
+name_index = get_name_index()
 
 pulsar_dict = {
     "Paper Metadata": {
@@ -25,9 +27,8 @@ for row in lines:
         pid = list(query['PSRB']).index(pulsar)
         pulsar = query['PSRJ'][pid]
 
-    # Wrong names I found
-    if pulsar == "J1710+49":
-        pulsar = "J1710+4923"
+    # Wrong names I found (see configs/pulsar_aliases.yaml)
+    pulsar = name_index.resolve(pulsar) or pulsar
     if pulsar not in all_jnames:
         print(pulsar)
 
@@ -2,9 +2,11 @@ import yaml
 import psrqpy
 
 from pulsar_spectra.scripts.csv_to_yaml import dump_yaml
+from pulsar_spectra.names import get_name_index
 
 query = psrqpy.QueryATNF(params=["PSRJ", "NAME", "PSRB", "P0"]).pandas
 all_jnames = list(query["PSRJ"])
+name_index = get_name_index()
 
 with open("Deneva_2024_raw.csv", "r") as raw_file:
     lines = raw_file.readlines()
@@ -29,11 +31,8 @@ for row in lines:
         pulsar = query["PSRJ"][pid]
         print(f"Converted to J name {pulsar}")
 
-    # Wrong names I've found
-    if pulsar == "J2017+2819g":
-        pulsar = "J2017+2819"
-    elif pulsar == "J2023+2853g":
-        pulsar = "J2023+2853_P"
+    # Wrong names I've found (see configs/pulsar_aliases.yaml)
+    pulsar = name_index.resolve(pulsar) or pulsar
 
     pulsar_dict[pulsar] = {
         "Frequency MHz": [327.0],
@@ -3,8 +3,10 @@ import psrqpy
 import csv
 
 from pulsar_spectra.scripts.csv_to_yaml import dump_yaml
+from pulsar_spectra.names import get_name_index
 
 query = psrqpy.QueryATNF(params=['PSRJ', 'NAME', 'PSRB']).pandas
+name_index = get_name_index()
 
 with open("Frail_2016_raw.tsv", "r") as raw_file:
     tsv_file = csv.reader(raw_file, delimiter="\t")
@@ -32,9 +34,8 @@ for row in lines:
         pulsar = query['PSRJ'][pid]
     else:
         pulsar = row[0].strip().replace("–", "-")
-    # Wrong names I found
-    if pulsar == "J0737-3039":
-        pulsar = "J0737-3039A"
+    # Wrong names I found (see configs/pulsar_aliases.yaml)
+    pulsar = name_index.resolve(pulsar) or pulsar
 
     flux = float(row[1])
     flux_err = float(row[2])
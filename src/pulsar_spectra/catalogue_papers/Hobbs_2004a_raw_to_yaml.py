@@ -3,9 +3,11 @@ import csv
 import psrqpy
 
 from pulsar_spectra.scripts.csv_to_yaml import dump_yaml
+from pulsar_spectra.names import get_name_index
 
 query = psrqpy.QueryATNF(params=['PSRJ', 'NAME', 'PSRB']).pandas
 all_jnames = list(query['PSRJ'])
+name_index = get_name_index()
 
 with open("Hobbs_2004a_raw_table_1-4.tsv") as file:
     tsv_file = csv.reader(file, delimiter="\t")
@@ -29,8 +31,8 @@ for row in lines:
     #print(row)
 
     pulsar = "J" + row[0].strip().replace("–", "-")
-    if pulsar == "J1915+07":
-        pulsar = "J1915+0752"
+    # Wrong names (see configs/pulsar_aliases.yaml)
+    pulsar = name_index.resolve(pulsar) or pulsar
     if pulsar not in all_jnames:
         print(pulsar)
 
@@ -59,29 +61,8 @@ for row in lines:
     #print(row)
 
     pulsar = row[0].strip().replace("–", "-")
-    # Wrong names I found
-    if pulsar == "J0820-3927":
-        pulsar = "J0820-3921"
-    elif pulsar == "J1356-6230":
-        pulsar = "J1357-62"
-    elif pulsar == "J1537-49":
-        pulsar = "J1537-4912"
-    elif pulsar == "J1748-2021":
-        pulsar = "J1748-2021A"
-    elif pulsar == "J1748-2446":
-        pulsar = "J1748-2446A"
-    elif pulsar == "J1807-2459":
-        pulsar = "J1807-2459A"
-    elif pulsar == "J1824-2452":
-        pulsar = "J1824-2452A"
-    elif pulsar == "J1849+06":
-        pulsar = "J1848+0604"
-    elif pulsar == "J1915+07":
-        pulsar = "J1915+0752"
-    elif pulsar == "J1916+07":
-        pulsar = "J1916+0748"
-    elif pulsar == "J1918+08":
-        pulsar = "J1917+0834"
+    # Wrong names I found (see configs/pulsar_aliases.yaml)
+    pulsar = name_index.resolve(pulsar) or pulsar
 
     if pulsar not in all_jnames:
         print(pulsar)
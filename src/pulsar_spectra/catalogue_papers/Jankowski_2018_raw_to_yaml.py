@@ -2,6 +2,9 @@ import yaml
 from astroquery.vizier import Vizier
 
 from pulsar_spectra.scripts.csv_to_yaml import dump_yaml
+from pulsar_spectra.names import get_name_index
+
+name_index = get_name_index()
 
 with open("Jankowski_2018_raw.txt", "r") as raw_file:
     lines = raw_file.readlines()
@@ -17,9 +20,8 @@ for row in lines[3:]:
     row = row.split("|")
     print(row)
     pulsar = row[0].strip().replace("−", "-")
-    # wrong names I've found
-    if pulsar == "J1235-5516":
-        pulsar = "J1235-54"
+    # wrong names I've found (see configs/pulsar_aliases.yaml)
+    pulsar = name_index.resolve(pulsar) or pulsar
 
     freqs = []
     bands = []
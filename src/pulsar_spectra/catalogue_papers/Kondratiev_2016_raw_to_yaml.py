@@ -4,9 +4,11 @@ import yaml
 import psrqpy
 
 from pulsar_spectra.scripts.csv_to_yaml import dump_yaml
+from pulsar_spectra.names import get_name_index
 
 query = psrqpy.QueryATNF(params=["PSRJ", "NAME", "PSRB", "P0"]).pandas
 all_jnames = list(query["PSRJ"])
+name_index = get_name_index()
 
 # was converted from image to csv using ABBYY FineReader
 with open("Kondratiev_2016_raw.csv") as file:
@@ -29,9 +31,8 @@ for row in lines:
         pid = list(query["PSRB"]).index(pulsar)
         pulsar = query["PSRJ"][pid]
 
-    # Wrong names
-    if pulsar == "J0636+5129":
-        pulsar = "J0636+5128"
+    # Wrong names (see configs/pulsar_aliases.yaml)
+    pulsar = name_index.resolve(pulsar) or pulsar
     if pulsar not in all_jnames:
         print(pulsar)
 
@@ -3,9 +3,11 @@ import psrqpy
 import csv
 
 from pulsar_spectra.scripts.csv_to_yaml import dump_yaml
+from pulsar_spectra.names import get_name_index
 
 query = psrqpy.QueryATNF(params=['PSRJ', 'NAME', 'PSRB', 'P0']).pandas
 all_jnames = list(query['PSRJ'])
+name_index = get_name_index()
 
 # was converted from image to csv using ABBYY FineReader
 with open("Kravtsov_2022_raw.csv") as file:
@@ -27,15 +29,8 @@ for row in lines:
     if pulsar.startswith("B"):
         pid = list(query['PSRB']).index(pulsar)
         pulsar = query['PSRJ'][pid]
-    # Wrong names
-    if pulsar == "J0121+1":
-        pulsar = "J0122+1416"
-    if pulsar == "J0454+45":
-        pulsar = "J0454+4529"
-    if pulsar == "J2122+24":
-        pulsar = "J2122+2426"
-    if pulsar == "J2227+30":
-        pulsar = "J2227+3038"
+    # Wrong names (see configs/pulsar_aliases.yaml)
+    pulsar = name_index.resolve(pulsar) or pulsar
     if pulsar not in all_jnames:
         print(pulsar)
 
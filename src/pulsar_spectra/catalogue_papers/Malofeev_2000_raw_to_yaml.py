@@ -4,9 +4,11 @@ import yaml
 import psrqpy
 
 from pulsar_spectra.scripts.csv_to_yaml import dump_yaml
+from pulsar_spectra.names import get_name_index
 
 query = psrqpy.QueryATNF(params=["PSRJ", "NAME", "PSRB"]).pandas
 all_jnames = list(query["PSRJ"])
+name_index = get_name_index()
 
 with open("Malofeev_2000_raw.tsv", "r") as raw_file:
     tsv_file = csv.reader(raw_file, delimiter="\t")
@@ -47,15 +49,8 @@ for row in lines:
             pulsar = possible_names[0]
         else:
             exit()
-    # Wrong names I found
-    if pulsar == "J1025-0709":
-        pulsar = "J1024-0719"
-    elif pulsar == "J1549+2110":
-        pulsar = "J1549+2113"
-    elif pulsar == "J2347-0612":
-        pulsar = "J2346-0609"
-    elif pulsar == "J1235-5516":
-        pulsar = "J1235-54"
+    # Wrong names I found (see configs/pulsar_aliases.yaml)
+    pulsar = name_index.resolve(pulsar) or pulsar
 
     flux = float(row[3])
     flux_err = float(row[4])
@@ -3,8 +3,10 @@ import csv
 import psrqpy
 
 from pulsar_spectra.scripts.csv_to_yaml import dump_yaml
+from pulsar_spectra.names import get_name_index
 
 query = psrqpy.QueryATNF(params=['PSRJ', 'NAME', 'PSRB']).pandas
+name_index = get_name_index()
 jnames = list(query['PSRJ'])
 
 with open("Morris_2002_raw.tsv", "r") as raw_file:
@@ -30,11 +32,8 @@ for row in lines:
 
     pulsar = "J" + row[0].strip().replace("–", "-")
 
-    # Wrong names I found
-    if pulsar == "J1839-06273":
-        pulsar = "J1839-0627"
-    if pulsar == "J1841-0348":
-        pulsar = "J1841-0345"
+    # Wrong names I found (see configs/pulsar_aliases.yaml)
+    pulsar = name_index.resolve(pulsar) or pulsar
 
     if pulsar not in jnames:
         print(pulsar)
@@ -3,9 +3,11 @@ import psrqpy
 import csv
 
 from pulsar_spectra.scripts.csv_to_yaml import dump_yaml
+from pulsar_spectra.names import get_name_index
 
 query = psrqpy.QueryATNF(params=['PSRJ', 'NAME', 'PSRB', 'P0']).pandas
 all_jnames = list(query['PSRJ'])
+name_index = get_name_index()
 
 # was converted from image to csv using ABBYY FineReader
 with open("Stairs_1999_raw.csv") as file:
@@ -29,9 +31,8 @@ for i, row in enumerate(lines):
             pid = list(query['PSRB']).index(pulsar)
             pulsar = query['PSRJ'][pid]
 
-        # Incorrect names
-        if pulsar == "J2033+1736":
-            pulsar = "J2033+1734"
+        # Incorrect names (see configs/pulsar_aliases.yaml)
+        pulsar = name_index.resolve(pulsar) or pulsar
         if pulsar not in all_jnames:
             print(pulsar)
 
@@ -2,10 +2,12 @@ import yaml
 import psrqpy
 
 from pulsar_spectra.scripts.csv_to_yaml import dump_yaml
+from pulsar_spectra.names import get_name_index
 
 with open("Zakharenko_2013_raw.txt", "r") as raw_file:
     lines = raw_file.readlines()
 query = psrqpy.QueryATNF(params=['PSRJ', 'NAME', 'PSRB']).pandas
+name_index = get_name_index()
 
 pulsar_dict = {
     "Paper Metadata": {
@@ -36,11 +38,8 @@ for row in lines[16:]:
         pulsar = query['PSRJ'][pid]
     else:
         pulsar = row[1].replace("−", "-")
-    # Wrong names I found
-    if pulsar == "J0927+23":
-        pulsar = "J0927+2345"
-    elif pulsar == "J1238+21":
-        pulsar = "J1238+2152"
+    # Wrong names I found (see configs/pulsar_aliases.yaml)
+    pulsar = name_index.resolve(pulsar) or pulsar
 
     flux, flux_err = row[2].split("±")
     pulsar_dict[pulsar] = {
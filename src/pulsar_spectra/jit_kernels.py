@@ -0,0 +1,149 @@
+"""
+The element-wise kernels of the numba compiled spectral models.
+
+This module requires numba, so it is only imported by :py:meth:`pulsar_spectra.jit_models.jit_model` when a
+compiled model is first used. Each kernel is a scalar function that is compiled with numba.vectorize.
+"""
+
+import numpy as np
+from numba import njit
+
+from pulsar_spectra import models
+
+
+@njit(inline="always")
+def horner(x, coefficients):
+    result = coefficients[-1]
+    for i in range(len(coefficients) - 2, -1, -1):
+        result = result * x + coefficients[i]
+    return result
+
+
+@njit(inline="always")
+def power_law_integrate(vmin, vmax, a, c, v0):
+    return c * (vmax ** (a + 1) - vmin ** (a + 1)) / ((vmax - vmin) * v0**a * (a + 1))
+
+
+# Compile the shared coefficients so they are computed the same way as the reference
+turn_over_taylor_coefficients = njit(inline="always")(models._turn_over_taylor_coefficients)
+double_turn_over_cut_off_coefficients = njit(inline="always")(models._double_turn_over_cut_off_coefficients)
+
+
+def simple_power_law(v, a, c, v0):
+    return c * (v / v0) ** a
+
+
+def simple_power_law_integrate(vmin, vmax, a, c, v0):
+    return power_law_integrate(vmin, vmax, a, c, v0)
+
+
+def broken_power_law(v, vb, a1, a2, c, v0):
+    x = v / v0
+    xb = vb / v0
+    if x <= xb:
+        return c * x**a1
+    return c * x**a2 * xb ** (a1 - a2)
+
+
+def broken_power_law_intergral(vmin, vmax, vb, a1, a2, c, v0):
+    # Only evaluates the branch that is needed
+    if vmin < vmax and vmax <= vb:
+        return power_law_integrate(vmin, vmax, a1, c, v0)
+    if vb <= vmin and vmin < vmax:
+        return power_law_integrate(vmin, vmax, a2, c, v0) * (vb / v0) ** (a1 - a2)
+    if vmin < vb and vb < vmax:
+        return c * (vmax ** (a1 + 1) - vmin ** (a1 + 1)) / ((vb - vmin) * v0**a1 * (a1 + 1)) + c * (
+            vmax ** (a2 + 1) - vmin ** (a2 + 1)
+        ) / ((vmax - vb) * v0**a2 * (a2 + 1)) * (vb / v0) ** (a1 - a2)
+    return 0.0
+
+
+def double_broken_power_law(v, vb1, vb2, a1, a2, a3, c, v0):
+    x = v / v0
+    xb1 = vb1 / v0
+    xb2 = vb2 / v0
+    if x <= xb1:
+        return c * x**a1
+    if x <= xb2:
+        return c * x**a2 * xb1 ** (a1 - a2)
+    return c * x**a3 * xb1 ** (a1 - a2) * xb2 ** (a2 - a3)
+
+
+def log_parabolic_spectrum(v, a, b, c, v0):
+    x = np.log10(v / v0)
+    return 10 ** (a * x**2 + b * x + c)
+
+
+def high_frequency_cut_off_power_law(v, vc, a, c, v0):
+    x = v / v0
+    xc = vc / v0
+    if x < xc:
+        return c * x**a * (1 - x / xc)
+    return 0.0
+
+
+def high_frequency_cut_off_power_law_taylor(vmin, vmax, vc, a, c, v0):
+    v = (vmax + vmin) / 2
+    if not v < vc:
+        return 0.0
+    A = c * (v / v0) ** a
+    w = v / vc
+    y = (a + 1) * w
+    r = ((vmax - vmin) / v) ** 2
+    f4 = a * (a - 1) * (a - 2)
+    f6 = f4 * (a - 3) * (a - 4)
+    return A * (1 - w + r * (a * (a - 1 - y) / 24 + r * (f4 * (a - 3 - y) / 1920 + r * f6 * (a - 5 - y) / 322560)))
+
+
+def low_frequency_turn_over_power_law(v, vpeak, a, c, beta, v0):
+    return c * (v / v0) ** a * np.exp(a / beta * (v / vpeak) ** (-beta))
+
+
+def low_frequency_turn_over_power_law_taylor(vmin, vmax, vpeak, a, c, beta, v0):
+    v = (vmax + vmin) / 2
+    u = (v / vpeak) ** (-beta)
+    s0 = c * (v / v0) ** a * np.exp(a / beta * u)
+    r = ((vmax - vmin) / v) ** 2
+    q2, q4, q6 = turn_over_taylor_coefficients(a, beta)
+    return s0 * (1 + a * r * (horner(u, q2) / 24 + r * (horner(u, q4) / 1920 + r * horner(u, q6) / 322560)))
+
+
+def double_turn_over_spectrum(v, vc, vpeak, a, beta, c, v0):
+    x = v / v0
+    xc = vc / v0
+    if x < xc:
+        return c * x**a * (1 - x / xc) * np.exp(a / beta * (v / vpeak) ** (-beta))
+    return 0.0
+
+
+def double_turn_over_spectrum_taylor(vmin, vmax, vc, vpeak, a, beta, c, v0):
+    v = (vmax + vmin) / 2
+    if not v < vc:
+        return 0.0
+    u = (v / vpeak) ** (-beta)
+    Z = c * (v / v0) ** a * np.exp(a / beta * u)
+    w = v / vc
+    r = ((vmax - vmin) / v) ** 2
+    q2, q4, _ = turn_over_taylor_coefficients(a, beta)
+    p2, p4 = double_turn_over_cut_off_coefficients(a, beta)
+    S2 = horner(u, q2) + w * horner(u, p2)
+    S4 = horner(u, q4) + w * horner(u, p4)
+    return Z * (1 - w + a * r * (S2 / 24 + r * S4 / 1920))
+
+
+# The kernel and if it is a bandwidth intergration correction (so the first argument is (vmin, vmax)),
+# keyed by the NumPy model function it replaces
+KERNELS = {
+    models.simple_power_law: (simple_power_law, False),
+    models.simple_power_law_integrate: (simple_power_law_integrate, True),
+    models.broken_power_law: (broken_power_law, False),
+    models.broken_power_law_intergral: (broken_power_law_intergral, True),
+    models.double_broken_power_law: (double_broken_power_law, False),
+    models.log_parabolic_spectrum: (log_parabolic_spectrum, False),
+    models.high_frequency_cut_off_power_law: (high_frequency_cut_off_power_law, False),
+    models.high_frequency_cut_off_power_law_taylor: (high_frequency_cut_off_power_law_taylor, True),
+    models.low_frequency_turn_over_power_law: (low_frequency_turn_over_power_law, False),
+    models.low_frequency_turn_over_power_law_taylor: (low_frequency_turn_over_power_law_taylor, True),
+    models.double_turn_over_spectrum: (double_turn_over_spectrum, False),
+    models.double_turn_over_spectrum_taylor: (double_turn_over_spectrum_taylor, True),
+}
@@ -0,0 +1,86 @@
+"""
+Optional numba compiled versions of the spectral models.
+
+Each model is compiled into a single loop over the frequencies, so no temporary arrays are made for each
+step of the calculation. A model is only compiled the first time it is used and the compiled kernels are cached
+on disk, so other processes (such as the multi-start and jackknife workers) load them instead of compiling them
+again. The NumPy models in :py:mod:`pulsar_spectra.models` are the reference versions, and are used when numba is
+not installed or a model does not have a compiled version. The fits only use the compiled models if asked to
+(``use_jit=True``), as they calculate in double precision instead of the extended precision of the NumPy fits.
+"""
+
+import functools
+import inspect
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def numba_available():
+    """Check if numba is installed.
+
+    Returns
+    -------
+    available : `boolean`
+        True if numba can be imported.
+    """
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def jit_model(model_function):
+    """Get the numba compiled version of a model function (or bandwidth intergration correction function).
+
+    The compiled models calculate in double precision, while the reference NumPy models keep the precision of the input.
+
+    Parameters
+    ----------
+    model_function : `function`
+        The model function from :py:meth:`pulsar_spectra.models`.
+
+    Returns
+    -------
+    jit_function : `function`
+        The compiled version of the model function with the same arguments,
+        or the input model function if numba is not installed or there is no compiled version of the model.
+    """
+    if model_function is None or not numba_available():
+        return model_function
+    from numba import vectorize
+
+    from pulsar_spectra.jit_kernels import KERNELS
+
+    if model_function not in KERNELS:
+        logger.debug(f"No compiled version of {model_function.__name__} so using the NumPy version")
+        return model_function
+    scalar_kernel, band = KERNELS[model_function]
+    n_args = len(inspect.signature(scalar_kernel).parameters)
+    kernel = vectorize([f"float64({', '.join(['float64'] * n_args)})"], cache=True)(scalar_kernel)
+
+    if band:
+
+        def jit_function(vmin_vmax, *params):
+            vmin, vmax = vmin_vmax
+            return kernel(
+                np.asarray(vmin, dtype=np.float64),
+                np.asarray(vmax, dtype=np.float64),
+                *(np.asarray(param, dtype=np.float64) for param in params),
+            )
+
+    else:
+
+        def jit_function(v, *params):
+            return kernel(np.asarray(v, dtype=np.float64), *(np.asarray(param, dtype=np.float64) for param in params))
+
+    # iminuit uses the signature to find the parameter names
+    jit_function.__signature__ = inspect.signature(model_function)
+    jit_function.__name__ = model_function.__name__
+    jit_function.__doc__ = model_function.__doc__
+    return jit_function
@@ -5,3 +5,5 @@ CONFIG_DIR = os.path.join(os.path.dirname(__file__), "configs")
 DEFAULT_PLOTTING_CONFIG = os.path.join(os.path.dirname(__file__), "configs/plotting_config.yaml")
 
 DEFAULT_MARKER_CSV = os.path.join(os.path.dirname(__file__), "configs/default_markers.csv")
+
+DEFAULT_ALIAS_FILE = os.path.join(os.path.dirname(__file__), "configs/pulsar_aliases.yaml")
@@ -2,6 +2,13 @@
 Spectral models used for fitting
 """
 
+import functools
+import inspect
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Optional
+
 import numpy as np
 
 
@@ -275,18 +282,123 @@ def high_frequency_cut_off_power_law_taylor(vmin_vmax, vc, a, c, v0):
         The flux density predicted by the model.
     """
     vmin, vmax = vmin_vmax
-    BW = vmax - vmin
-    v = (vmin + vmax) / 2
-    s0 = high_frequency_cut_off_power_law(v, vc, a, c, v0)
-    s2 = ((c * a) / v0**a) * ((a - 1) * v ** (a - 2) - ((a + 1) * v ** (a - 1)) / vc)
-    s4 = ((c * a * (a - 1) * (a - 2)) / v0**a) * ((a - 3) * v ** (a - 4) - ((a + 1) * v ** (a - 3)) / vc)
-    s6 = ((c * a * (a - 1) * (a - 2) * (a - 3) * (a - 4)) / v0**a) * (
-        (a - 5) * v ** (a - 6) - ((a + 1) * v ** (a - 5)) / vc
-    )
-    sv = s0 + (s2 * BW**2) / 12 + (s4 * BW**4) / 80 + (s6 * BW**6) / 448
+    v = (vmax + vmin) / 2
+    # The even derivatives are s_n = A * a * (a - 1) ... (a - n + 2) / v**n * ((a - n + 1) - (a + 1) * v / vc)
+    # where A = c * (v / v0)**a, so the Taylor series is evaluated in powers of r = (BW / v)**2
+    A = c * (v / v0) ** a
+    w = v / vc
+    y = (a + 1) * w
+    r = ((vmax - vmin) / v) ** 2
+    f4 = a * (a - 1) * (a - 2)
+    f6 = f4 * (a - 3) * (a - 4)
+    sv = A * (1 - w + r * (a * (a - 1 - y) / 24 + r * (f4 * (a - 3 - y) / 1920 + r * f6 * (a - 5 - y) / 322560)))
     return np.where(v < vc, sv, 0)
 
 
+def _horner(x, coefficients):
+    """Evaluate the polynomial sum(coefficients[k] * x**k) using Horner's method."""
+    result = coefficients[-1]
+    for coefficient in coefficients[-2::-1]:
+        result = result * x + coefficient
+    return result
+
+
+def _turn_over_taylor_coefficients(a, beta):
+    """The coefficients of the even derivatives of the low-frequency turn-over power law,
+    see :ref:`derivation <low_frequency_turn_over_power_law_taylor>`.
+
+    The nth derivative is s0 * a / v**n * sum(q_n[k] * u**k) where u = (v / vpeak)**(-beta).
+    Each power of a and beta is only computed once, as these are reused many times.
+
+    Parameters
+    ----------
+    a : `float`
+        The spectral index.
+    beta : `float`
+        The smoothness of the turn-over.
+
+    Returns
+    -------
+    q2, q4, q6 : `tuple`
+        The polynomial coefficients (in increasing powers of u) of the second, fourth and sixth derivatives.
+    """
+    a2 = a * a
+    a3 = a2 * a
+    a4 = a3 * a
+    a5 = a4 * a
+    b2 = beta * beta
+    b3 = b2 * beta
+    b4 = b3 * beta
+    b5 = b4 * beta
+    q2 = (a - 1, -2 * a + beta + 1, a)
+    q4 = (
+        (a - 1) * (a - 2) * (a - 3),
+        -4 * a3 + 6 * a2 * beta + 18 * a2 - 4 * a * b2 - 18 * a * beta - 22 * a + b3 + 6 * b2 + 11 * beta + 6,
+        a * (6 * a2 - 12 * a * beta - 18 * a + 7 * b2 + 18 * beta + 11),
+        a2 * (-4 * a + 6 * beta + 6),
+        a3,
+    )
+    q6 = (
+        (a - 1) * (a - 2) * (a - 3) * (a - 4) * (a - 5),
+        -6 * a5
+        + 15 * a4 * beta
+        + 75 * a4
+        - 20 * a3 * b2
+        - 150 * a3 * beta
+        - 340 * a3
+        + 15 * a2 * b3
+        + 150 * a2 * b2
+        + 510 * a2 * beta
+        + 675 * a2
+        - 6 * a * b4
+        - 75 * a * b3
+        - 340 * a * b2
+        - 675 * a * beta
+        - 548 * a
+        + b5
+        + 15 * b4
+        + 85 * b3
+        + 225 * b2
+        + 274 * beta
+        + 120,
+        a
+        * (
+            15 * a4
+            - 60 * a3 * beta
+            - 150 * a3
+            + 105 * a2 * b2
+            + 450 * a2 * beta
+            + 510 * a2
+            - 90 * a * b3
+            - 525 * a * b2
+            - 1020 * a * beta
+            - 675 * a
+            + 31 * b4
+            + 225 * b3
+            + 595 * b2
+            + 675 * beta
+            + 274
+        ),
+        a2
+        * (
+            -20 * a3
+            + 90 * a2 * beta
+            + 150 * a2
+            - 150 * a * b2
+            - 450 * a * beta
+            - 340 * a
+            + 90 * b3
+            + 375 * b2
+            + 510 * beta
+            + 225
+        ),
+        a3 * (15 * a2 - 60 * a * beta - 75 * a + 65 * b2 + 150 * beta + 85),
+        a4 * (-6 * a + 15 * beta + 15),
+        a5,
+    )
+    return q2, q4, q6
+
+
 def low_frequency_turn_over_power_law(v, vpeak, a, c, beta, v0):
     """Low-frequency turn-over power law:
 
@@ -381,102 +493,48 @@ def low_frequency_turn_over_power_law_taylor(vmin_vmax, vpeak, a, c, beta, v0):
         The flux density predicted by the model.
     """
     vmin, vmax = vmin_vmax
-    BW = vmax - vmin
     v = (vmax + vmin) / 2
-    X = (v / vpeak) ** beta
-    s0 = low_frequency_turn_over_power_law(v, vpeak, a, c, beta, v0)
-    s2 = (s0 * a) / (v**2 * X**2) * (X**2 * (a - 1) + X * (-2 * a + beta + 1) + a)
-    s4 = (
-        (s0 * a)
-        / (v**4 * X**4)
-        * (
-            X**4 * (a**3 - 6 * a**2 + 11 * a - 6)
-            + X**3
-            * (
-                -4 * a**3
-                + 6 * a**2 * beta
-                + 18 * a**2
-                - 4 * a * beta**2
-                - 18 * a * beta
-                - 22 * a
-                + beta**3
-                + 6 * beta**2
-                + 11 * beta
-                + 6
-            )
-            + X**2 * a * (6 * a**2 - 12 * a * beta - 18 * a + 7 * beta**2 + 18 * beta + 11)
-            + X * a**2 * (-4 * a + 6 * beta + 6)
-            + a**3
-        )
-    )
-    s6 = (
-        (s0 * a)
-        / (v**6 * X**6)
-        * (
-            X**6 * (a**5 - 15 * a**4 + 85 * a**3 - 225 * a**2 + 274 * a - 120)
-            + X**5
-            * (
-                -6 * a**5
-                + 15 * a**4 * beta
-                + 75 * a**4
-                - 20 * a**3 * beta**2
-                - 150 * a**3 * beta
-                - 340 * a**3
-                + 15 * a**2 * beta**3
-                + 150 * a**2 * beta**2
-                + 510 * a**2 * beta
-                + 675 * a**2
-                - 6 * a * beta**4
-                - 75 * a * beta**3
-                - 340 * a * beta**2
-                - 675 * a * beta
-                - 548 * a
-                + beta**5
-                + 15 * beta**4
-                + 85 * beta**3
-                + 225 * beta**2
-                + 274 * beta
-                + 12
-            )
-            + X**4
-            * a
-            * (
-                15 * a**4
-                - 60 * a**3 * beta
-                - 150 * a**3
-                + 105 * a**2 * beta**2
-                + 450 * a**2 * beta
-                + 510 * a**2
-                - 90 * a * beta**3
-                - 525 * a * beta**2
-                - 1020 * a * beta
-                - 675 * a
-                + 31 * beta**4
-                + 225 * beta**3
-                + 595 * beta**2
-                + 675 * beta
-                + 274
-            )
-            + X**3
-            * a**2
-            * (
-                -20 * a**3
-                + 90 * a**2 * beta
-                + 150 * a**2
-                - 150 * a * beta**2
-                - 450 * a * beta
-                - 340 * a
-                + 90 * beta**3
-                + 375 * beta**2
-                + 510 * beta
-                + 225
-            )
-            + X**2 * a**3 * (15 * a**2 - 60 * a * beta - 75 * a + 65 * beta**2 + 150 * beta + 85)
-            + X * a**4 * (-6 * a + 15 * beta + 15)
-            + a**5
-        )
+    u = (v / vpeak) ** (-beta)
+    s0 = c * (v / v0) ** a * np.exp(a / beta * u)
+    r = ((vmax - vmin) / v) ** 2
+    q2, q4, q6 = _turn_over_taylor_coefficients(a, beta)
+    # s_n = s0 * a / v**n * sum(q_n[k] * u**k) so factor out s0 * a and evaluate the polynomials with Horner's method
+    Q2 = _horner(u, q2)
+    Q4 = _horner(u, q4)
+    Q6 = _horner(u, q6)
+    return s0 * (1 + a * r * (Q2 / 24 + r * (Q4 / 1920 + r * Q6 / 322560)))
+
+
+def _double_turn_over_cut_off_coefficients(a, beta):
+    """The coefficients of the cut-off terms of the even derivatives of the double turn-over spectrum,
+    see :ref:`derivation <double_turn_over_spectrum_taylor>`.
+
+    The nth derivative is Z * a / v**n * (sum(q_n[k] * u**k) + (v / vc) * sum(p_n[k] * u**k))
+    where q_n are from :py:meth:`pulsar_spectra.models._turn_over_taylor_coefficients`.
+
+    Parameters
+    ----------
+    a : `float`
+        The spectral index.
+    beta : `float`
+        The smoothness of the turn-over.
+
+    Returns
+    -------
+    p2, p4 : `tuple`
+        The polynomial coefficients (in increasing powers of u) of the second and fourth derivatives.
+    """
+    a2 = a * a
+    b2 = beta * beta
+    p2 = (-a - 1, 2 * a - beta + 1, -a)
+    p4 = (
+        -a * a2 + 2 * a2 + a - 2,
+        4 * a * a2 - 6 * a2 * beta - 6 * a2 + 4 * a * b2 + 6 * a * beta - 2 * a - beta * b2 - 2 * b2 + beta + 2,
+        a * (-6 * a2 + 12 * a * beta + 6 * a - 7 * b2 - 6 * beta + 1),
+        a2 * (4 * a - 6 * beta - 2),
+        -a * a2,
     )
-    return s0 + (s2 * BW**2) / 12 + (s4 * BW**4) / 80 + (s6 * BW**6) / 448
+    return p2, p4
 
 
 def double_turn_over_spectrum(v, vc, vpeak, a, beta, c, v0):
@@ -592,81 +650,157 @@ def double_turn_over_spectrum_taylor(vmin_vmax, vc, vpeak, a, beta, c, v0):
         The flux density predicted by the model.
     """
     vmin, vmax = vmin_vmax
-    BW = vmax - vmin
     v = (vmax + vmin) / 2
-    X = (v / vpeak) ** beta
-    Y = v - vc
-    Z = c * (v / v0) ** a * np.exp(a / beta * (v / vpeak) ** (-beta))
-    s0 = double_turn_over_spectrum(v, vc, vpeak, a, beta, c, v0)
-    s2 = (
-        (Z * a)
-        / (v**2 * vc * X**2)
-        * (-a * Y - 2 * v * X**2 + 2 * v * X + X**2 * Y * (1 - a) + X * Y * (2 * a - beta - 1))
-    )
-    s4 = (
-        (Z * a)
-        / (v**4 * vc * X**4)
-        * (
-            X**4 * (v * (-(a**3) + 2 * a**2 + a - 2) + vc * (a**3 - 6 * a**2 + 11 * a - 6))
-            + X**3
-            * (
-                v
-                * (
-                    4 * a**3
-                    - 6 * a**2 * beta
-                    - 6 * a**2
-                    + 4 * a * beta**2
-                    + 6 * a * beta
-                    - 2 * a
-                    - beta**3
-                    - 2 * beta**2
-                    + beta
-                    + 2
-                )
-                + vc
-                * (
-                    -4 * a**3
-                    + 6 * a**2 * beta
-                    + 18 * a**2
-                    - 4 * a * beta**2
-                    - 18 * a * beta
-                    - 22 * a
-                    + beta**3
-                    + 6 * beta**2
-                    + 11 * beta
-                    + 6
-                )
-            )
-            + X**2
-            * a
-            * (
-                v * (-6 * a**2 + 12 * a * beta + 6 * a - 7 * beta**2 - 6 * beta + 1)
-                + vc * (6 * a**2 - 12 * a * beta - 18 * a + 7 * beta**2 + 18 * beta + 11)
-            )
-            + X * a**2 * (v * (4 * a - 6 * beta - 2) + vc * (-4 * a + 6 * beta + 6))
-            + a**3 * vc
-            - a**3 * v
-        )
-    )
-    sv = s0 + (s2 * BW**2) / 12 + (s4 * BW**4) / 80
+    u = (v / vpeak) ** (-beta)
+    Z = c * (v / v0) ** a * np.exp(a / beta * u)
+    w = v / vc
+    r = ((vmax - vmin) / v) ** 2
+    q2, q4, _ = _turn_over_taylor_coefficients(a, beta)
+    # The derivatives are the low-frequency turn-over derivatives plus a (v / vc) cut-off term
+    # s_n = Z * a / v**n * (sum(q_n[k] * u**k) + w * sum(p_n[k] * u**k))
+    p2, p4 = _double_turn_over_cut_off_coefficients(a, beta)
+    S2 = _horner(u, q2) + w * _horner(u, p2)
+    S4 = _horner(u, q4) + w * _horner(u, p4)
+    sv = Z * (1 - w + a * r * (S2 / 24 + r * S4 / 1920))
     return np.where(v < vc, sv, 0)
 
 
-def model_settings(print_models=False):
-    """Holds metadata about spectral models such as common names and default fit parameters.
+# The number of Gauss-Legendre nodes used to integrate models across each measurement's bandwidth
+GAUSS_LEGENDRE_ORDER = 16
+
+
+@functools.lru_cache(maxsize=None)
+def gauss_legendre_nodes(order=GAUSS_LEGENDRE_ORDER):
+    """The Gauss-Legendre quadrature nodes and weights, which are only computed once for each order.
 
     Parameters
     ----------
-    print_models : `boolean`, optional
-        If true, will print the models dictionary which is useful for debuging new models. Default False.
+    order : `int`, optional
+        The number of nodes. |br| Default: GAUSS_LEGENDRE_ORDER (16).
 
     Returns
     -------
-    model_dict : `dict`
-        Returns a dictionary in the format
+    nodes : `numpy.ndarray`
+        The read-only nodes on the interval [-1, 1].
+    weights : `numpy.ndarray`
+        The read-only weights, normalised to sum to one so they average the model over the interval.
+    """
+    nodes, weights = np.polynomial.legendre.leggauss(order)
+    weights = weights / 2
+    nodes.flags.writeable = False
+    weights.flags.writeable = False
+    return nodes, weights
+
+
+def gauss_legendre_integrate(model_function, vmin_vmax, *params, order=GAUSS_LEGENDRE_ORDER):
+    """The bandwith intergration correction of any model using Gauss-Legendre quadrature.
+
+    The model is evaluated at every node of every measurement in a single call,
+    so the cost is predictable and the model does not need a derived intergral.
+    A high order may be required for accurate results for models with discontinuities such as breaks or cut-offs.
+
+    Parameters
+    ----------
+    model_function : `function`
+        The model function from :py:meth:`pulsar_spectra.models`.
+    vmin_vmax : `tuple` (vmin, vmax)
+        Where vmin is the minimum and vmax is the maximum frequency
+        in Hz for each flux density measurement's bandwidth.
+    *params
+        The model parameters (including the reference frequency v0).
+    order : `int`, optional
+        The number of nodes. |br| Default: GAUSS_LEGENDRE_ORDER (16).
 
-        {model_name: [model_function, short_name, start_params, mod_limits]}
+    Returns
+    -------
+    S_v : `list`
+        The flux density predicted by the model averaged over each bandwidth.
     """
+    vmin, vmax = vmin_vmax
+    nodes, weights = gauss_legendre_nodes(order)
+    centre = (np.asarray(vmax) + np.asarray(vmin)) / 2
+    half_width = (np.asarray(vmax) - np.asarray(vmin)) / 2
+    # Every node for every measurement in the shape (order, *measurement_shape)
+    v = centre + half_width * nodes.reshape((-1,) + (1,) * centre.ndim)
+    return np.tensordot(weights, model_function(v, *params), axes=1)
+
+
+@functools.lru_cache(maxsize=None)
+def gauss_legendre_integrate_function(model_function, order=GAUSS_LEGENDRE_ORDER):
+    """Make a bandwith intergration correction function for a model that uses
+    :py:meth:`pulsar_spectra.models.gauss_legendre_integrate`.
+
+    Parameters
+    ----------
+    model_function : `function`
+        The model function from :py:meth:`pulsar_spectra.models`.
+    order : `int`, optional
+        The number of nodes. |br| Default: GAUSS_LEGENDRE_ORDER (16).
+
+    Returns
+    -------
+    model_function_integrate : `function`
+        The function in the form model_function_integrate(vmin_vmax, *params)
+        with the same parameter names as the model function so it can be fit by iminuit.
+    """
+
+    def model_function_integrate(vmin_vmax, *params):
+        return gauss_legendre_integrate(model_function, vmin_vmax, *params, order=order)
+
+    # iminuit uses the signature to find the parameter names
+    signature = inspect.signature(model_function)
+    parameters = list(signature.parameters.values())
+    model_function_integrate.__signature__ = signature.replace(
+        parameters=[parameters[0].replace(name="vmin_vmax")] + parameters[1:]
+    )
+    model_function_integrate.__name__ = f"{model_function.__name__}_gauss_legendre"
+    model_function_integrate.__doc__ = (
+        f"The bandwith intergration correction for {model_function.__name__} using Gauss-Legendre quadrature."
+    )
+    return model_function_integrate
+
+
+@dataclass(frozen=True)
+class ModelSpec:
+    """Read-only metadata about a spectral model such as its common name and default fit parameters.
+
+    Parameters
+    ----------
+    name : `str`
+        The model name, which is the same as the model function name.
+    function : `function`
+        The model function from :py:meth:`pulsar_spectra.models`.
+    short_name : `str`
+        A short name used to label plots.
+    start_params : `tuple`
+        The default starting parameters of the fit (excluding the reference frequency v0).
+    mod_limits : `tuple`
+        The default (min, max) limits of each parameter. A limit of None for the cut-off frequency
+        will set it based on the data set's frequency range.
+    integrate_function : `function`, optional
+        The bandwidth intergration correction function of the model. |br| Default: None.
+    """
+
+    name: str
+    function: Callable
+    short_name: str
+    start_params: tuple
+    mod_limits: tuple
+    integrate_function: Optional[Callable] = None
+
+    def __post_init__(self):
+        # Store the defaults as tuples so they can not be altered in place
+        object.__setattr__(self, "start_params", tuple(self.start_params))
+        object.__setattr__(
+            self, "mod_limits", tuple(None if limit is None else tuple(limit) for limit in self.mod_limits)
+        )
+        if self.integrate_function is None:
+            # Models without a derived intergral are integrated numerically
+            object.__setattr__(self, "integrate_function", gauss_legendre_integrate_function(self.function))
+
+
+def _default_models():
+    """Builds the specs of the spectral models that are fit by default."""
     # fit starting value, min and max
     # constant
     c_s = 1.0
@@ -688,62 +822,172 @@ def model_settings(print_models=False):
     vpeak_min = 10e6
     vpeak_max = 2e9
 
-    model_dict = {
-        # Name: [model_function, short_name, start_params, mod_limits]
-        "simple_power_law": [
+    return (
+        ModelSpec(
+            "simple_power_law",
             simple_power_law,
             "simple pl",
             # (a, c)
             (a_s, c_s),
             [(a_min, a_max), (c_min, c_max)],
             simple_power_law_integrate,
-        ],
-        "broken_power_law": [
+        ),
+        ModelSpec(
+            "broken_power_law",
             broken_power_law,
             "broken pl",
             # (vb, a1, a2, c)
             (1e9, a_s, a_s, c_s),
             [(50e6, 5e9), (a_min, a_max), (a_min, a_max), (c_min, c_max)],
             broken_power_law_intergral,
-        ],
-        # "log_parabolic_spectrum" : [
+        ),
+        # ModelSpec(
+        #     "log_parabolic_spectrum",
         #     log_parabolic_spectrum,
         #     "lps",
-        #     #(a, b, c)
-        #     (-1, -1., c_s),
+        #     # (a, b, c)
+        #     (-1, -1.0, c_s),
         #     [(-5, 2), (-5, 2), (None, c_max)],
-        # ],
-        "high_frequency_cut_off_power_law": [
+        # ),
+        ModelSpec(
+            "high_frequency_cut_off_power_law",
             high_frequency_cut_off_power_law,
             "pl hard cut-off",
             # (vc, a, c)
             (vc_s, a_s, c_s),
             [vc_both, (a_min, 0.0), (c_min, c_max)],
             high_frequency_cut_off_power_law_taylor,
-        ],
-        "low_frequency_turn_over_power_law": [
+        ),
+        ModelSpec(
+            "low_frequency_turn_over_power_law",
             low_frequency_turn_over_power_law,
             "pl low turn-over",
             # (vpeak, a, c, beta)
             (vpeak_s, a_s, c_s, beta_s),
             [(vpeak_min, vpeak_max), (a_min, 0.0), (c_min, c_max), (beta_min, beta_max)],
             low_frequency_turn_over_power_law_taylor,
-        ],
-        "double_turn_over_spectrum": [
+        ),
+        ModelSpec(
+            "double_turn_over_spectrum",
             double_turn_over_spectrum,
             "double turn-over spectrum",
             # (vc, vpeak, a, beta, c)
             (vc_s, vpeak_s, a_s, beta_s, c_s),
-            [(vc_both), (vpeak_min, vpeak_max), (a_min, 0.0), (beta_min, beta_max), (c_min, c_max)],
+            [vc_both, (vpeak_min, vpeak_max), (a_min, 0.0), (beta_min, beta_max), (c_min, c_max)],
             double_turn_over_spectrum_taylor,
-        ],
-        # "double_broken_power_law" : [
-        #    double_broken_power_law,
-        #    "double bpl",
-        #    (100e6, 1e9, -1.6, -1.6, -1.6, 0.1),
-        #    [(10e6, 100e9), (1e9, 100e9), (-5, 5), (-5, 5), (-5, 5), (0, None)],
-        # ],
-    }
+        ),
+        # ModelSpec(
+        #     "double_broken_power_law",
+        #     double_broken_power_law,
+        #     "double bpl",
+        #     (100e6, 1e9, -1.6, -1.6, -1.6, 0.1),
+        #     [(10e6, 100e9), (1e9, 100e9), (-5, 5), (-5, 5), (-5, 5), (0, None)],
+        # ),
+    )
+
+
+DEFAULT_MODELS = _default_models()
+
+# The registry is replaced (never altered in place) when a model is registered,
+# so readers always see a consistent snapshot
+_registry_lock = threading.Lock()
+_model_registry = MappingProxyType({spec.name: spec for spec in DEFAULT_MODELS})
+
+
+def model_registry():
+    """Returns the read-only registry of spectral models that are used for fitting.
+
+    The registry is built once on import and is safe to share between threads. Worker processes started with
+    the "spawn" method only have the default models, so any extra models must be registered again in each worker.
+
+    Returns
+    -------
+    registry : `types.MappingProxyType` [`str`, :py:class:`pulsar_spectra.models.ModelSpec`]
+        A read-only dictionary of the model specs, keyed by model name.
+    """
+    return _model_registry
+
+
+def get_model(model_name):
+    """Get the :py:class:`pulsar_spectra.models.ModelSpec` of a model.
+
+    Parameters
+    ----------
+    model_name : `str`
+        One of the model names from :py:meth:`pulsar_spectra.models.model_registry`.
+
+    Returns
+    -------
+    model_spec : :py:class:`pulsar_spectra.models.ModelSpec`
+        The model spec.
+    """
+    try:
+        return _model_registry[model_name]
+    except KeyError:
+        raise KeyError(f"{model_name} is not a registered model. Options are: {', '.join(_model_registry)}") from None
+
+
+def register_model(model_spec, replace=False):
+    """Add a model to the registry so it is included in :py:meth:`pulsar_spectra.spectral_fit.find_best_spectral_fit`.
+
+    Parameters
+    ----------
+    model_spec : :py:class:`pulsar_spectra.models.ModelSpec`
+        The spec of the model to register.
+    replace : `boolean`, optional
+        If True, will replace an already registered model of the same name. |br| Default: False.
+    """
+    global _model_registry
+    with _registry_lock:
+        if model_spec.name in _model_registry and not replace:
+            raise ValueError(f"A model named {model_spec.name} is already registered. Use replace=True to replace it.")
+        new_registry = dict(_model_registry)
+        new_registry[model_spec.name] = model_spec
+        _model_registry = MappingProxyType(new_registry)
+
+
+def unregister_model(model_name):
+    """Remove a model from the registry.
+
+    Parameters
+    ----------
+    model_name : `str`
+        The name of the registered model to remove.
+    """
+    global _model_registry
+    with _registry_lock:
+        new_registry = dict(_model_registry)
+        new_registry.pop(model_name)
+        _model_registry = MappingProxyType(new_registry)
+
+
+def model_settings(print_models=False):
+    """Holds metadata about spectral models such as common names and default fit parameters.
+
+    This is a mutable copy of :py:meth:`pulsar_spectra.models.model_registry` in the legacy list format.
+
+    Parameters
+    ----------
+    print_models : `boolean`, optional
+        If true, will print the models dictionary which is useful for debuging new models. Default False.
+
+    Returns
+    -------
+    model_dict : `dict`
+        Returns a dictionary in the format
+
+        {model_name: [model_function, short_name, start_params, mod_limits, model_function_integrate]}
+    """
+    model_dict = {}
+    for model_name, spec in model_registry().items():
+        # Name: [model_function, short_name, start_params, mod_limits, model_function_integrate]
+        model_dict[model_name] = [
+            spec.function,
+            spec.short_name,
+            spec.start_params,
+            list(spec.mod_limits),
+            spec.integrate_function,
+        ]
 
     if print_models:
         # Print the models dictionary which is useful for debuging new models
@@ -0,0 +1,170 @@
+"""
+Functions used to resolve the many names of pulsars to their ATNF pulsar catalogue Jname
+"""
+
+import functools
+import logging
+import re
+
+import numpy as np
+import yaml
+
+from pulsar_spectra.load_data import DEFAULT_ALIAS_FILE
+from pulsar_spectra.utils import get_atnf_table, unit_vectors
+
+logger = logging.getLogger(__name__)
+
+# The position encoded in a Jname, e.g. J0038-25 or J0034-0721 (and J0034-0721A for pulsars in binaries or clusters)
+JNAME_POSITION = re.compile(r"^J(\d{2})(\d{2})(?:\.\d+)?([+-])(\d{2})(\d{0,2})")
+
+
+def clean_pulsar_name(pulsar):
+    """Remove whitespace and weird dash characters from a pulsar name."""
+    return pulsar.strip().replace("–", "-").replace("−", "-")
+
+
+def parse_name_position(pulsar):
+    """Calculate the approximate sky position encoded in a Jname.
+
+    Parameters
+    ----------
+    pulsar : `str`
+        The Jname, which may be truncated (e.g. J0038-25).
+
+    Returns
+    -------
+    ra_deg : `float`
+        The right ascension in degrees, or NaN if the name is not a Jname.
+    dec_deg : `float`
+        The declination in degrees, or NaN if the name is not a Jname.
+    """
+    match = JNAME_POSITION.match(pulsar)
+    if match is None:
+        return np.nan, np.nan
+    ra_hours, ra_minutes, sign, dec_degrees, dec_minutes = match.groups()
+    ra_deg = (int(ra_hours) + int(ra_minutes) / 60) * 15
+    dec_deg = int(dec_degrees) + (int(dec_minutes) / 60 if dec_minutes else 0)
+    return ra_deg, dec_deg if sign == "+" else -dec_deg
+
+
+class PulsarNameIndex:
+    """An index of every name of each pulsar (Jname, Bname, ATNF name and curated aliases) that resolves names to
+    Jnames with a dictionary lookup, falling back to the pulsar closest to the position encoded in a Jname.
+
+    Parameters
+    ----------
+    query : `pandas.DataFrame`
+        A psrqpy.QueryATNF query with the ``PSRJ`` column and optionally the ``PSRB``, ``NAME``, ``RAJD`` and
+        ``DECJD`` columns. Without the positions, the positions encoded in the Jnames are used for the fuzzy matches.
+    aliases : `dict`, optional
+        Extra names (such as the names used in a paper) and the Jname they refer to. |br| Default: None.
+    alias_file : `str`, optional
+        A yaml file of curated aliases and their Jnames. |br| Default: the alias file included in pulsar_spectra.
+        Use None for no alias file.
+    """
+
+    def __init__(self, query, aliases=None, alias_file=DEFAULT_ALIAS_FILE):
+        self.jnames = np.array(query["PSRJ"].astype(str).tolist(), dtype=object)
+        self.name_map = {}
+        for column in ["NAME", "PSRB"]:
+            if column in query:
+                for name, jname in zip(query[column], self.jnames):
+                    if isinstance(name, str):
+                        self.name_map[clean_pulsar_name(name)] = jname
+        all_aliases = {}
+        if alias_file is not None:
+            with open(alias_file, "r") as stream:
+                all_aliases.update(yaml.safe_load(stream) or {})
+        if aliases is not None:
+            all_aliases.update(aliases)
+        for alias, jname in all_aliases.items():
+            self.name_map[clean_pulsar_name(alias)] = jname
+        # Jnames take priority over the other names
+        self.name_map.update(zip(self.jnames, self.jnames))
+
+        if "RAJD" in query and "DECJD" in query:
+            ra_deg = query["RAJD"].to_numpy(dtype=float)
+            dec_deg = query["DECJD"].to_numpy(dtype=float)
+        else:
+            ra_deg, dec_deg = np.full(len(self.jnames), np.nan), np.full(len(self.jnames), np.nan)
+        # Use the position encoded in the name of pulsars without a position
+        name_positions = np.array([parse_name_position(jname) for jname in self.jnames], dtype=float).reshape(-1, 2)
+        no_position = ~(np.isfinite(ra_deg) & np.isfinite(dec_deg))
+        ra_deg = np.where(no_position, name_positions[:, 0], ra_deg)
+        dec_deg = np.where(no_position, name_positions[:, 1], dec_deg)
+        self._position_rows = np.flatnonzero(np.isfinite(ra_deg) & np.isfinite(dec_deg))
+        self._vectors = unit_vectors(ra_deg[self._position_rows], dec_deg[self._position_rows])
+
+    def __contains__(self, pulsar):
+        return clean_pulsar_name(pulsar) in self.name_map
+
+    def candidates(self, pulsar, max_sep_deg=1.0):
+        """Find the pulsars near the position encoded in a Jname.
+
+        Parameters
+        ----------
+        pulsar : `str`
+            The Jname, which may be truncated or wrong (e.g. J0038-25).
+        max_sep_deg : `float`, optional
+            The maximum separation in degrees. |br| Default: 1.0.
+
+        Returns
+        -------
+        candidates : `list`
+            The (jname, separation_deg) of each pulsar within max_sep_deg, sorted by their separation.
+        """
+        ra_deg, dec_deg = parse_name_position(clean_pulsar_name(pulsar))
+        if not np.isfinite(ra_deg) or len(self._vectors) == 0:
+            return []
+        separations = np.degrees(np.arccos(np.clip(self._vectors @ unit_vectors(ra_deg, dec_deg), -1, 1)))
+        close = np.flatnonzero(separations <= max_sep_deg)
+        close = close[np.argsort(separations[close], kind="stable")]
+        return [(self.jnames[self._position_rows[i]], float(separations[i])) for i in close]
+
+    def resolve(self, pulsar, fuzzy=False, max_sep_deg=1.0):
+        """Resolve a pulsar name to its Jname.
+
+        Parameters
+        ----------
+        pulsar : `str`
+            The Jname, Bname, ATNF name or alias of the pulsar.
+        fuzzy : `boolean`, optional
+            If the name is unknown, use the pulsar closest to the position encoded in the Jname. |br| Default: False.
+        max_sep_deg : `float`, optional
+            The maximum separation in degrees of the fuzzy match. |br| Default: 1.0.
+
+        Returns
+        -------
+        jname : `str`
+            The Jname, or None if the name could not be resolved.
+        """
+        pulsar = clean_pulsar_name(pulsar)
+        jname = self.name_map.get(pulsar)
+        if jname is None and fuzzy:
+            candidates = self.candidates(pulsar, max_sep_deg=max_sep_deg)
+            if len(candidates) > 0:
+                jname, separation = candidates[0]
+                logger.warning(f"{pulsar} is not a known pulsar name, using {jname} which is {separation:.2f} deg away")
+        return jname
+
+    def resolve_many(self, pulsars, fuzzy=False, max_sep_deg=1.0):
+        """Resolve many pulsar names to their Jnames with :py:meth:`resolve`.
+
+        Returns
+        -------
+        jnames : `list`
+            The Jname of each pulsar, or None for the names that could not be resolved.
+        """
+        return [self.resolve(pulsar, fuzzy=fuzzy, max_sep_deg=max_sep_deg) for pulsar in pulsars]
+
+
+@functools.lru_cache(maxsize=None)
+def get_name_index():
+    """Make the :py:class:`PulsarNameIndex` of a single cached ATNF query.
+
+    Returns
+    -------
+    name_index : :py:class:`PulsarNameIndex`
+        The index of the names of all the pulsars in the ATNF pulsar catalogue.
+    """
+    return PulsarNameIndex(get_atnf_table(("NAME", "RAJD", "DECJD")))
@@ -0,0 +1,201 @@
+"""
+Functions used to calculate population statistics of the spectral fits of many pulsars
+"""
+
+import numpy as np
+import pandas as pd
+
+from pulsar_spectra.utils import get_atnf_table
+
+
+def population_table(results, atnf_params=("P0", "AGE"), query=None):
+    """Make a table of the best fit of each pulsar with a column for each fit parameter and ATNF parameter.
+
+    Parameters
+    ----------
+    results : :py:class:`pulsar_spectra.results.ResultsStore`, `dict`, `list` or `pandas.DataFrame`
+        The fit records, such as a results store, the records from its ``load()`` method or a list of records
+        (see :py:meth:`pulsar_spectra.results.make_fit_record`).
+    atnf_params : `tuple`, optional
+        The ATNF parameters to add to the table. |br| Default: ("P0", "AGE").
+    query : `pandas.DataFrame`, optional
+        A previous psrqpy.QueryATNF query with a ``PSRJ`` column and the atnf_params. Can be supplied to prevent
+        performing a new query. |br| Default: None, will use the cached query from
+        :py:meth:`pulsar_spectra.utils.get_atnf_table`.
+
+    Returns
+    -------
+    table : `pandas.DataFrame`
+        A row for each pulsar with a model, with the ``'pulsar'``, ``'model'`` and ``'p_best'`` columns, the value of
+        each fit parameter (e.g. ``'a'``), its uncertainty (e.g. ``'u_a'``) and each ATNF parameter.
+        The fit parameters a model does not have are NaN.
+    """
+    if hasattr(results, "load"):
+        results = results.load()
+    if isinstance(results, dict):
+        results = list(results.values())
+    if hasattr(results, "to_dict"):
+        results = results.to_dict("records")
+    results = [record for record in results if record.get("model") is not None]
+
+    columns = {
+        "pulsar": [record["pulsar"] for record in results],
+        "model": [record["model"] for record in results],
+        "p_best": [np.nan if record.get("p_best") is None else record["p_best"] for record in results],
+    }
+    table = pd.DataFrame(columns)
+    # Fill the parameter columns of each model at once
+    for rows in table.groupby("model").indices.values():
+        parameters = results[rows[0]]["parameters"]
+        values = np.array([results[row_i]["values"] for row_i in rows], dtype=float)
+        errors = np.array([results[row_i]["errors"] for row_i in rows], dtype=float)
+        for j, parameter in enumerate(parameters):
+            for column, column_values in ((parameter, values[:, j]), (f"u_{parameter}", errors[:, j])):
+                if column not in table:
+                    table[column] = np.nan
+                table.loc[table.index[rows], column] = column_values
+
+    if len(atnf_params) > 0:
+        atnf_params = [param.upper() for param in atnf_params]
+        if query is None:
+            query = get_atnf_table(tuple(atnf_params))
+        atnf_table = query[["PSRJ"] + atnf_params].drop_duplicates("PSRJ").set_index("PSRJ")
+        for param in atnf_params:
+            table[param] = atnf_table[param].reindex(table["pulsar"]).to_numpy(dtype=float)
+    return table
+
+
+def weighted_quantiles(values, quantiles, weights=None):
+    """Calculate the quantiles of weighted values.
+
+    Each value is at the middle of its weight in the cumulative distribution, so with equal weights this is the
+    same as the ``"hazen"`` method of `numpy.quantile`.
+
+    Parameters
+    ----------
+    values : `numpy.ndarray`
+        The values. NaN values are ignored.
+    quantiles : `list`
+        The quantiles between 0 and 1.
+    weights : `numpy.ndarray`, optional
+        The weight of each value (e.g. the inverse variance). |br| Default: None, equal weights.
+
+    Returns
+    -------
+    value_quantiles : `numpy.ndarray`
+        The value at each quantile, which are NaN if there are no values.
+    """
+    values = np.asarray(values, dtype=float)
+    weights = np.ones_like(values) if weights is None else np.asarray(weights, dtype=float)
+    keep = np.isfinite(values) & np.isfinite(weights) & (weights > 0)
+    values, weights = values[keep], weights[keep]
+    if len(values) == 0:
+        return np.full(len(quantiles), np.nan)
+    order = np.argsort(values)
+    values, weights = values[order], weights[order]
+    cumulative = (np.cumsum(weights) - weights / 2) / np.sum(weights)
+    return np.interp(quantiles, cumulative, values)
+
+
+def _bin_groups(table, by, bins):
+    """Group the rows of the table by bins of a column, or into a single group if by is None."""
+    if by is None:
+        return pd.Series("all", index=table.index, name="all")
+    return pd.cut(table[by], bins)
+
+
+def grouped_histogram(table, column, bins, by=None, by_bins=None):
+    """Count the number of pulsars in bins of a column in each bin of another column (e.g. the spectral index
+    in bins of period).
+
+    Parameters
+    ----------
+    table : `pandas.DataFrame`
+        The table from :py:meth:`pulsar_spectra.population.population_table`.
+    column : `str`
+        The column to histogram (e.g. "a").
+    bins : `list`
+        The edges of the histogram bins.
+    by : `str`, optional
+        The column to group the pulsars by (e.g. "P0"). |br| Default: None, a single histogram of all pulsars.
+    by_bins : `list`, optional
+        The edges of the bins of the by column. |br| Default: None.
+
+    Returns
+    -------
+    histograms : `pandas.DataFrame`
+        The counts with a row for each group and a column for each histogram bin.
+    """
+    column_bins = pd.cut(table[column], bins)
+    groups = _bin_groups(table, by, by_bins)
+    return pd.crosstab(groups, column_bins, dropna=False)
+
+
+def grouped_quantiles(table, column, by, bins, quantiles=(0.16, 0.5, 0.84), weights=None):
+    """Calculate the (weighted) quantiles of a column in bins of another column (e.g. the median spectral index in
+    bins of age).
+
+    Parameters
+    ----------
+    table : `pandas.DataFrame`
+        The table from :py:meth:`pulsar_spectra.population.population_table`.
+    column : `str`
+        The column to calculate the quantiles of (e.g. "a").
+    by : `str`
+        The column to group the pulsars by (e.g. "AGE"). If None, all the pulsars are one group.
+    bins : `list`
+        The edges of the bins of the by column.
+    quantiles : `tuple`, optional
+        The quantiles between 0 and 1. |br| Default: (0.16, 0.5, 0.84).
+    weights : `str` or `numpy.ndarray`, optional
+        The column name or an array of the weight of each pulsar, such as the inverse variance ``1 / table["u_a"]**2``.
+        |br| Default: None, equal weights.
+
+    Returns
+    -------
+    group_quantiles : `pandas.DataFrame`
+        The quantiles with a row for each group, a column for each quantile and the number of pulsars with a
+        value in each group (``'n'``).
+    """
+    if weights is None:
+        weights = np.ones(len(table))
+    elif isinstance(weights, str):
+        weights = table[weights].to_numpy(dtype=float)
+    data = pd.DataFrame(
+        {"group": _bin_groups(table, by, bins), "value": table[column].to_numpy(dtype=float), "weight": weights}
+    )
+    data = data[np.isfinite(data["value"])]
+    group_quantiles = data.groupby("group", observed=False).apply(
+        lambda group: pd.Series(
+            list(weighted_quantiles(group["value"], quantiles, group["weight"])) + [len(group)],
+            index=list(quantiles) + ["n"],
+        )
+    )
+    group_quantiles["n"] = group_quantiles["n"].astype(int)
+    return group_quantiles
+
+
+def model_fractions(table, by=None, bins=None):
+    """Calculate the fraction of pulsars best fit by each model in bins of a column (e.g. the fraction of
+    turn-over spectra in bins of period).
+
+    Parameters
+    ----------
+    table : `pandas.DataFrame`
+        The table from :py:meth:`pulsar_spectra.population.population_table`.
+    by : `str`, optional
+        The column to group the pulsars by (e.g. "P0"). |br| Default: None, all the pulsars are one group.
+    bins : `list`, optional
+        The edges of the bins of the by column. |br| Default: None.
+
+    Returns
+    -------
+    fractions : `pandas.DataFrame`
+        The fractions with a row for each group, a column for each model and the number of pulsars in each group
+        (``'n'``). The fractions of empty groups are NaN.
+    """
+    counts = pd.crosstab(_bin_groups(table, by, bins), table["model"], dropna=False)
+    n = counts.sum(axis=1)
+    fractions = counts.div(n.where(n > 0), axis=0)
+    fractions["n"] = n
+    return fractions
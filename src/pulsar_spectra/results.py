@@ -0,0 +1,362 @@
+"""
+Functions used to store the results of spectral fits so that long fitting runs can be resumed
+"""
+
+import hashlib
+import json
+import logging
+import os
+
+from pulsar_spectra.spectral_fit import fit_result_to_dict
+
+logger = logging.getLogger(__name__)
+
+
+def data_hash(freqs_MHz, bands_MHz, fluxs_mJy, flux_errs_mJy, refs):
+    """Make a hash of a pulsar's input data so we can tell if the data has changed since it was last fit.
+
+    Parameters
+    ----------
+    freqs_MHz : `list`
+        A list of the frequencies in MHz.
+    bands_MHz : `list`
+        A list of the bandwidths in MHz.
+    fluxs_mJy : `list`
+        A list of the flux density in mJy.
+    flux_errs_mJy : `list`
+        A list of the uncertainty of the flux density in mJy.
+    refs : `list`
+        A list of the reference labels (in the format 'Author_year').
+
+    Returns
+    -------
+    hash : `str`
+        The SHA-1 hex digest of the data, which does not depend on the order of the data.
+    """
+    rows = sorted(
+        json.dumps([float(freq), None if band is None else float(band), float(flux), float(flux_err), str(ref)])
+        for freq, band, flux, flux_err, ref in zip(freqs_MHz, bands_MHz, fluxs_mJy, flux_errs_mJy, refs)
+    )
+    return hashlib.sha1("\n".join(rows).encode()).hexdigest()
+
+
+def ref_data_hashes(freqs_MHz, bands_MHz, fluxs_mJy, flux_errs_mJy, refs):
+    """Make a hash of the data each reference contributed to a pulsar's data set.
+
+    Parameters
+    ----------
+    freqs_MHz : `list`
+        A list of the frequencies in MHz.
+    bands_MHz : `list`
+        A list of the bandwidths in MHz.
+    fluxs_mJy : `list`
+        A list of the flux density in mJy.
+    flux_errs_mJy : `list`
+        A list of the uncertainty of the flux density in mJy.
+    refs : `list`
+        A list of the reference labels (in the format 'Author_year').
+
+    Returns
+    -------
+    ref_hashes : `dict`
+        The :py:meth:`pulsar_spectra.results.data_hash` of each reference's data, keyed by the reference label.
+    """
+    ref_rows = {}
+    for row in zip(freqs_MHz, bands_MHz, fluxs_mJy, flux_errs_mJy, refs):
+        ref_rows.setdefault(row[4], []).append(row)
+    return {ref: data_hash(*zip(*rows)) for ref, rows in sorted(ref_rows.items())}
+
+
+def find_changed_pulsars(records, cat_list, pulsars=None):
+    """Compare stored fits to the current catalogue to find which pulsars need to be refit.
+
+    Parameters
+    ----------
+    records : `dict`
+        The stored records keyed by pulsar Jname, from :py:meth:`pulsar_spectra.results.ResultsStore.load`.
+    cat_list : `dict`
+        The current catalogue from :py:meth:`pulsar_spectra.catalogue.collect_catalogue_fluxes`.
+    pulsars : `list`, optional
+        Only check these pulsars. |br| Default: None, will check all pulsars with data or a stored fit.
+
+    Returns
+    -------
+    changes : `dict`
+        The pulsars that need to be refit (or have had all their data removed), keyed by the pulsar's Jname.
+        Each value is a dictionary with the keys:
+
+        ``'status'`` : `str`
+            "new" if there is no stored fit, "changed" if the data has changed or "removed" if there is no data left.
+        ``'added_refs'`` : `list`
+            The references that were not used in the stored fit.
+        ``'removed_refs'`` : `list`
+            The references that were used in the stored fit but are no longer in the catalogue.
+        ``'changed_refs'`` : `list`
+            The references whose data has changed since the stored fit.
+    """
+    if pulsars is None:
+        pulsars = sorted(set(pulsar for pulsar in cat_list.keys() if len(cat_list[pulsar][0]) > 0) | set(records))
+
+    changes = {}
+    for pulsar in pulsars:
+        if pulsar in cat_list and len(cat_list[pulsar][0]) > 0:
+            current_hashes = ref_data_hashes(*cat_list[pulsar])
+        else:
+            current_hashes = {}
+        if pulsar not in records:
+            if current_hashes:
+                changes[pulsar] = {
+                    "status": "new",
+                    "added_refs": list(current_hashes),
+                    "removed_refs": [],
+                    "changed_refs": [],
+                }
+            continue
+
+        record = records[pulsar]
+        if current_hashes and record.get("data_hash") == data_hash(*cat_list[pulsar]):
+            # Nothing has changed
+            continue
+        stored_hashes = record.get("ref_hashes")
+        if stored_hashes is None:
+            # Older record without the per reference hashes so assume all references have changed
+            stored_hashes = {ref: None for ref in record.get("refs", [])}
+        changes[pulsar] = {
+            "status": "changed" if current_hashes else "removed",
+            "added_refs": [ref for ref in current_hashes if ref not in stored_hashes],
+            "removed_refs": [ref for ref in stored_hashes if ref not in current_hashes],
+            "changed_refs": [
+                ref for ref in current_hashes if ref in stored_hashes and stored_hashes[ref] != current_hashes[ref]
+            ],
+        }
+    return changes
+
+
+def make_fit_record(pulsar, cat_data, model_name, iminuit_result, p_best, fit_time=None):
+    """Make a record of a pulsar's best spectral fit that can be written to a :py:class:`pulsar_spectra.results.ResultsStore`.
+
+    Parameters
+    ----------
+    pulsar : `str`
+        The Jname of the pulsar.
+    cat_data : `list`
+        The pulsar's data from :py:meth:`pulsar_spectra.catalogue.collect_catalogue_fluxes`
+        in the format [freqs_MHz, bands_MHz, fluxs_mJy, flux_errs_mJy, refs].
+    model_name : `str`
+        The best fit model name from :py:meth:`pulsar_spectra.spectral_fit.find_best_spectral_fit` or None if no model was found.
+    iminuit_result : `iminuit.Minuit`
+        The best fit Minuit class from :py:meth:`pulsar_spectra.spectral_fit.find_best_spectral_fit` or None if no model was found.
+    p_best : `float`
+        The probability that the best-fit model is actually the best-fit model.
+    fit_time : `float`, optional
+        The time in seconds it took to fit all the models to the pulsar. |br| Default: None.
+
+    Returns
+    -------
+    record : `dict`
+        The record, which includes the output of :py:meth:`pulsar_spectra.spectral_fit.fit_result_to_dict`
+        as well as the ``'p_best'``, ``'total_fit_time'``, ``'refs'``, ``'ref_hashes'`` and ``'data_hash'`` keys.
+    """
+    if iminuit_result is None:
+        record = {"pulsar": pulsar, "model": None}
+    else:
+        record = fit_result_to_dict(pulsar, model_name, iminuit_result)
+    record["p_best"] = None if p_best is None else float(p_best)
+    record["total_fit_time"] = fit_time
+    record["refs"] = sorted(set(cat_data[4]))
+    # Record the data each paper contributed so we can tell which papers changed when the catalogue is updated
+    record["ref_hashes"] = ref_data_hashes(*cat_data)
+    record["data_hash"] = data_hash(*cat_data)
+    return record
+
+
+class ResultsStore:
+    """An append-only JSON lines file of spectral fit records, one line per pulsar.
+
+    By default, each record is flushed to disk as soon as it is appended, so if a run crashes only the pulsar
+    that was being fit is lost. If a pulsar is refit, the latest record is used. Pulsars are removed by appending a
+    ``{"pulsar": jname, "removed": true}`` line.
+
+    Parameters
+    ----------
+    filename : `str`
+        The location of the results file. It will be created if it does not exist.
+    buffer_size : `int`, optional
+        The maximum number of records to hold in memory before they are written to disk.
+        Records still in the buffer are lost if the run crashes. |br| Default: 1.
+    """
+
+    def __init__(self, filename, buffer_size=1):
+        self.filename = filename
+        self.buffer_size = buffer_size
+        self._buffer = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def load(self):
+        """Load the latest record of each pulsar in the store.
+
+        Returns
+        -------
+        records : `dict`
+            The records keyed by the pulsar's Jname.
+        """
+        records = {}
+        if not os.path.isfile(self.filename):
+            return records
+        with open(self.filename, "r") as stream:
+            for line_i, line in enumerate(stream):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Most likely a partially written line from an interrupted run
+                    logger.warning(f"Skipping unreadable line {line_i + 1} in {self.filename}")
+                    continue
+                if record.get("removed", False):
+                    records.pop(record["pulsar"], None)
+                else:
+                    records[record["pulsar"]] = record
+        return records
+
+    def completed(self):
+        """Find the pulsars that have already been fit.
+
+        Returns
+        -------
+        completed : `dict`
+            The data hash of each pulsar's last fit, keyed by the pulsar's Jname.
+        """
+        return {pulsar: record.get("data_hash") for pulsar, record in self.load().items()}
+
+    def append(self, record):
+        """Append a record to the store, which is written to disk once the buffer is full.
+
+        Parameters
+        ----------
+        record : `dict`
+            A record from :py:meth:`pulsar_spectra.results.make_fit_record`.
+        """
+        self._buffer.append(json.dumps(record) + "\n")
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def remove(self, pulsars):
+        """Remove the records of pulsars from the store, such as the pulsars that no longer have any data.
+
+        Parameters
+        ----------
+        pulsars : `list`
+            The Jnames of the pulsars to remove.
+        """
+        for pulsar in pulsars:
+            self._buffer.append(json.dumps({"pulsar": pulsar, "removed": True}) + "\n")
+        self.flush()
+
+    def flush(self):
+        """Write all the buffered records to disk."""
+        if len(self._buffer) == 0:
+            return
+        lines = "".join(self._buffer)
+        self._buffer = []
+        if os.path.isfile(self.filename) and os.path.getsize(self.filename) > 0:
+            with open(self.filename, "rb") as stream:
+                stream.seek(-1, os.SEEK_END)
+                if stream.read(1) != b"\n":
+                    # Start a new line so we don't append to a partially written record
+                    lines = "\n" + lines
+        with open(self.filename, "a") as stream:
+            stream.write(lines)
+            stream.flush()
+            os.fsync(stream.fileno())
+
+    def close(self):
+        """Write any buffered records to disk."""
+        self.flush()
+
+
+class ParquetResultsWriter:
+    """Streams spectral fit records to a Parquet file, writing a row group each time the buffer is full
+    so the memory used does not grow with the number of pulsars. Requires pyarrow.
+
+    The file is only valid once the writer is closed (or the ``with`` block exits).
+
+    Parameters
+    ----------
+    filename : `str`
+        The location of the Parquet file, which will be overwritten.
+    buffer_size : `int`, optional
+        The maximum number of records to hold in memory before they are written to disk. |br| Default: 1000.
+    """
+
+    def __init__(self, filename, buffer_size=1000):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as err:
+            raise ImportError(
+                "pyarrow is required to write Parquet files. Install it with: pip install pulsar-spectra[parquet]"
+            ) from err
+        self._pa = pa
+        # Columns with a fixed type, any other record keys are stored as a JSON string in the "extra" column
+        self.schema = pa.schema(
+            [
+                ("pulsar", pa.string()),
+                ("model", pa.string()),
+                ("parameters", pa.list_(pa.string())),
+                ("values", pa.list_(pa.float64())),
+                ("errors", pa.list_(pa.float64())),
+                ("covariance", pa.list_(pa.list_(pa.float64()))),
+                ("aic", pa.float64()),
+                ("band_bool", pa.bool_()),
+                ("nfcn", pa.int64()),
+                ("fit_time", pa.float64()),
+                ("p_best", pa.float64()),
+                ("total_fit_time", pa.float64()),
+                ("refs", pa.list_(pa.string())),
+                ("data_hash", pa.string()),
+                ("extra", pa.string()),
+            ]
+        )
+        self.filename = filename
+        self.buffer_size = buffer_size
+        self._buffer = []
+        self._writer = pq.ParquetWriter(filename, self.schema)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def append(self, record):
+        """Append a record, which is written to disk once the buffer is full.
+
+        Parameters
+        ----------
+        record : `dict`
+            A record from :py:meth:`pulsar_spectra.results.make_fit_record`.
+        """
+        row = {name: record.get(name) for name in self.schema.names if name != "extra"}
+        extra = {key: value for key, value in record.items() if key not in row}
+        row["extra"] = json.dumps(extra)
+        self._buffer.append(row)
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Write all the buffered records to disk as a row group."""
+        if len(self._buffer) == 0:
+            return
+        self._writer.write_table(self._pa.Table.from_pylist(self._buffer, schema=self.schema))
+        self._buffer = []
+
+    def close(self):
+        """Write any buffered records and close the file."""
+        self.flush()
+        self._writer.close()
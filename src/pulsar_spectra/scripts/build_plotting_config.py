@@ -273,6 +273,12 @@ def parse_args():
         help="Space seperated list of pulsar J names. "
         + "If given, will assign a unique marker to every publication in the pulsar set.",
     )
+    marker_generation.add_argument(
+        "--no_atnf",
+        action="store_true",
+        help="Only assign markers to the catalogue papers of the pulsar set and not the ATNF pulsar catalogue "
+        + "references. This does not need an ATNF query so is much faster.",
+    )
 
     args = parser.parse_args()
 
@@ -428,15 +434,69 @@ def generate_marker_set(
     return unique_markers
 
 
-def create_ref_marker_combinations(psrs, args):
-    from pulsar_spectra.catalogue import collect_catalogue_fluxes
+def get_pulsar_refs(psrs, use_atnf=True):
+    """Find the references of the flux densities that :py:meth:`pulsar_spectra.catalogue.collect_catalogue_fluxes`
+    would collect for a set of pulsars without reading the whole catalogue.
+
+    Parameters
+    ----------
+    psrs : `list`
+        The Jnames of the pulsars.
+    use_atnf : `bool`, optional
+        Whether to include the ATNF pulsar catalogue references. |br| Default: True.
+
+    Returns
+    -------
+    pulsar_refs : `dict`
+        The reference labels of each pulsar, in the format pulsar_refs[jname].
+    """
+    from pulsar_spectra.catalogue import (
+        ATNF_EXCLUDED_REFS,
+        ATNF_VER,
+        all_flux_from_atnf,
+        collect_catalogue_fluxes,
+        get_reference_index,
+    )
+
+    ref_index = get_reference_index()
+    pulsar_refs = {psr: list(ref_index.get(psr, [])) for psr in psrs}
+    if not use_atnf:
+        return pulsar_refs
 
-    cat_dict = collect_catalogue_fluxes()
-    all_refs = []
+    import psrqpy
+
+    # Only query the pulsar set
+    query = psrqpy.QueryATNF(version=ATNF_VER, psrs=psrs).pandas
+    atnf_dict = all_flux_from_atnf(query=query)
+    for psr in psrs:
+        # Remove "_ATNF" from the end of the references to compare them to the catalogue papers
+        atnf_dict[psr] = {
+            ref: data for ref, data in atnf_dict.get(psr, {}).items() if ref[:-5] not in ATNF_EXCLUDED_REFS
+        }
+
+    # The ATNF values of a catalogue paper are only used if they differ from the paper, so only read the papers of
+    # the pulsars where this must be checked
+    check_psrs = [psr for psr in psrs if any(ref[:-5] in pulsar_refs[psr] for ref in atnf_dict[psr])]
+    check_refs = sorted({ref for psr in check_psrs for ref in pulsar_refs[psr]})
+    cat_list = collect_catalogue_fluxes(only_use=check_refs, query=query, use_atnf=False) if check_refs else {}
     for psr in psrs:
-        _, _, _, _, refs = cat_dict[psr]
-        all_refs += refs
-    unique_refs = list(np.unique(np.array(all_refs)))
+        fluxes, flux_errs = (list(cat_list[psr][2]), list(cat_list[psr][3])) if psr in check_psrs else ([], [])
+        for ref, data in atnf_dict[psr].items():
+            for flux, flux_err in zip(data["Flux Density mJy"], data["Flux Density error mJy"]):
+                if flux in fluxes and flux_err in flux_errs and ref[:-5] in pulsar_refs[psr]:
+                    # Redundant ATNF data
+                    continue
+                fluxes.append(flux)
+                flux_errs.append(flux_err)
+                if ref not in pulsar_refs[psr]:
+                    pulsar_refs[psr].append(ref)
+    return pulsar_refs
+
+
+def create_ref_marker_combinations(psrs, args):
+    pulsar_refs = get_pulsar_refs(psrs, use_atnf=not args.no_atnf)
+    all_refs = [ref for psr in psrs for ref in pulsar_refs[psr]]
+    unique_refs = sorted(set(all_refs))
     num_unique_refs = len(unique_refs)
 
     shuffle_colours = False
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+import argparse
+
+from pulsar_spectra.catalogue import catalogue_summary
+
+ATNF_LINK = "https://www.atnf.csiro.au/research/pulsar/psrcat/"
+
+
+def paper_label(ref):
+    """Convert a reference label (e.g. Manchester_1978a) to how it is cited (e.g. Manchester et al. (1978a))."""
+    if ref == "Sieber_1973":
+        # Single author paper
+        return "Sieber (1973)"
+    author = " ".join(ref.split("_")[:-1])
+    year = ref.split("_")[-1]
+    return f"{author} et al. ({year})"
+
+
+def format_summary(summary, paper_format=False):
+    """Format each row of the catalogue summary as a line of the docs csv table or of a LaTeX table.
+
+    Parameters
+    ----------
+    summary : `pandas.DataFrame`
+        The summary from :py:meth:`pulsar_spectra.catalogue.catalogue_summary`.
+    paper_format : `boolean`, optional
+        Format the lines as LaTeX table rows. |br| Default: False.
+
+    Returns
+    -------
+    lines : `list`
+        The line of each row.
+    """
+    lines = []
+    for ref, row in summary.iterrows():
+        freq_range = f"{int(row['min_freq_MHz'])}-{int(row['max_freq_MHz'])}"
+        if paper_format:
+            cite = "ATNF pulsar catalogue" if ref == "ATNF" else f"\\cite{{{ref.replace('_', '')}}}"
+            lines.append(f"{cite} & {row['n_pulsars']} & {freq_range} \\\\")
+        elif ref == "ATNF":
+            lines.append(
+                f'"ATNF pulsar catalogue","{row["n_pulsars"]}","{freq_range}","`Catalogue website <{ATNF_LINK}>`_"'
+            )
+        else:
+            lines.append(f'"{paper_label(ref)}","{row["n_pulsars"]}","{freq_range}","`ADS <{row["ads"]}>`__"')
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Summarise the number of pulsars and frequency range of each paper in the catalogue."
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default="papers_in_catalogue.csv",
+        help="The file to write the summary to. Default: papers_in_catalogue.csv",
+    )
+    parser.add_argument(
+        "--paper_format",
+        action="store_true",
+        help="Write the summary as LaTeX table rows instead of the csv table used by the docs.",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Write the full summary table (including the number of measurements) as a plain csv, "
+        + "for monitoring the catalogue.",
+    )
+    args = parser.parse_args()
+
+    summary = catalogue_summary()
+    if args.full:
+        summary.to_csv(args.output, index_label="ref")
+        return
+    with open(args.output, "w") as output:
+        for line in format_summary(summary, paper_format=args.paper_format):
+            output.write(f"{line}\n")
+
+
+if __name__ == "__main__":
+    main()
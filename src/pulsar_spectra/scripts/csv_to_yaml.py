@@ -2,14 +2,16 @@
 
 import argparse
 import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
 
-import psrqpy
+import numpy as np
+import pandas as pd
 import yaml
 
-from pulsar_spectra.catalogue import ATNF_VER
+from pulsar_spectra.names import clean_pulsar_name, get_name_index
 
-query = psrqpy.QueryATNF(version=ATNF_VER, params=["PSRJ", "NAME", "PSRB"]).pandas
-all_jnames = list(query["PSRJ"])
+FLUX_COLUMNS = ["Frequency MHz", "Bandwidth MHz", "Flux Density mJy", "Flux Density error mJy"]
 
 
 class ListIndentDumper(yaml.Dumper):
@@ -23,66 +25,257 @@ def dump_yaml(pulsar_dict, filename):
         yaml.dump(pulsar_dict, cat_file, sort_keys=False, indent=2, default_flow_style=False, Dumper=ListIndentDumper)
 
 
-def convert_csv_to_yaml(csv_location, ref_label, obs_span, data_type):
+def read_flux_table(csv_location):
+    """Read the rows of a csv or tsv (if the file ends with .tsv) file of flux densities, skipping the header row.
+
+    Parameters
+    ----------
+    csv_location : `str`
+        The location of the file with the columns pulsar, frequency, bandwidth, flux density and
+        (optionally) flux density error.
+
+    Returns
+    -------
+    table : `pandas.DataFrame`
+        The ``'line'`` number in the file, the ``'pulsar'`` name and the values as strings. The flux density error of
+        rows without one is 50% of the flux density.
+    rejected : `pandas.DataFrame`
+        The ``'line'``, ``'row'`` and ``'reason'`` of the rows without four or five columns.
+    """
+    delimiter = "\t" if csv_location.endswith(".tsv") else ","
+    with open(csv_location, newline="") as csvfile:
+        rows = list(csv.reader(csvfile, delimiter=delimiter))[1:]
+    lines = np.arange(2, len(rows) + 2)
+    n_columns = np.array([len(row) for row in rows], dtype=int)
+    good = (n_columns == 4) | (n_columns == 5)
+    table = pd.DataFrame(
+        [row if len(row) == 5 else row + [None] for row, is_good in zip(rows, good) if is_good],
+        columns=["pulsar"] + FLUX_COLUMNS,
+    )
+    table.insert(0, "line", lines[good])
+    rejected = pd.DataFrame(
+        {
+            "line": lines[~good],
+            "row": [",".join(row) for row, is_good in zip(rows, good) if not is_good],
+            "reason": "expected 4 or 5 columns",
+        }
+    )
+    return table, rejected
+
+
+def validate_flux_table(table, name_index):
+    """Convert the names to Jnames and the values to floats and reject the rows with invalid values.
+
+    Parameters
+    ----------
+    table : `pandas.DataFrame`
+        The table from :py:meth:`read_flux_table`.
+    name_index : :py:class:`pulsar_spectra.names.PulsarNameIndex`
+        The index used to resolve the pulsar names to Jnames.
+
+    Returns
+    -------
+    table : `pandas.DataFrame`
+        The valid rows with the Jname of each pulsar and float values.
+    rejected : `pandas.DataFrame`
+        The ``'line'``, ``'row'`` and ``'reason'`` of each invalid row.
+    unknown : `pandas.DataFrame`
+        The Jnames that are kept although they are not in the name_index (``'pulsar'``) and the ``'closest'`` pulsar
+        to their position (or None).
+    """
+    names = table["pulsar"].astype(str).map(clean_pulsar_name)
+    # Resolve each unique name once
+    unique_names = names.unique()
+    jnames = names.map(dict(zip(unique_names, name_index.resolve_many(unique_names))))
+    # Keep the Jnames of pulsars that are not in the ATNF catalogue (yet)
+    unknown_jnames = jnames.isna() & names.str.match(r"^J\d{4}[+-]\d{2,4}")
+    jnames = jnames.where(~unknown_jnames, names)
+    values = table[FLUX_COLUMNS].apply(pd.to_numeric, errors="coerce")
+    # Rows without a flux density error use 50% of the flux density
+    values["Flux Density error mJy"] = values["Flux Density error mJy"].where(
+        table["Flux Density error mJy"].notna(), values["Flux Density mJy"] * 0.5
+    )
+
+    reasons = pd.Series("", index=table.index)
+    for reason, bad in [
+        ("unknown pulsar name", jnames.isna()),
+        ("non-numeric value", values.isna().any(axis=1)),
+        ("frequency is not positive", values["Frequency MHz"] <= 0),
+        ("bandwidth is negative", values["Bandwidth MHz"] < 0),
+        ("flux density is not positive", values["Flux Density mJy"] <= 0),
+        ("flux density error is negative", values["Flux Density error mJy"] < 0),
+    ]:
+        # Only record the first reason of each row
+        reasons = reasons.where(~(bad & (reasons == "")), reason)
+    bad = reasons != ""
+
+    rejected = pd.DataFrame(
+        {
+            "line": table["line"][bad],
+            "row": table[["pulsar"] + FLUX_COLUMNS][bad].fillna("").astype(str).agg(",".join, axis=1),
+            "reason": reasons[bad],
+        }
+    )
+    valid = values[~bad].copy()
+    valid.insert(0, "pulsar", jnames[~bad])
+    unknown_pulsars = np.unique(jnames[unknown_jnames & ~bad])
+    closest = []
+    for pulsar in unknown_pulsars:
+        candidates = name_index.candidates(pulsar)
+        closest.append(None if len(candidates) == 0 else candidates[0][0])
+    unknown = pd.DataFrame({"pulsar": unknown_pulsars, "closest": closest}, dtype=object)
+    return valid, rejected, unknown
+
+
+def flux_table_to_dict(table, obs_span, data_type):
+    """Make the catalogue dictionary of the valid rows from :py:meth:`validate_flux_table`."""
     pulsar_dict = {
         "Paper Metadata": {
             "Data Type": data_type,
             "Observation Span": obs_span,
         }
     }
+    # Keep the pulsars in the order they first appear
+    for pulsar, pulsar_table in table.groupby("pulsar", sort=False):
+        pulsar_dict[str(pulsar)] = {column: pulsar_table[column].astype(float).tolist() for column in FLUX_COLUMNS}
+    return pulsar_dict
 
-    # Read in the csv
-    with open(csv_location, newline="") as csvfile:
-        spamreader = csv.reader(csvfile)
-        # This skips the header row of the CSV file.
-        next(spamreader)
-        print("Input data:")
-        for row in spamreader:
-            # logger.debug(row)
-            # print(row)
-            if len(row) == 5:
-                pulsar, freq, band, flux, flux_err = row
-            elif len(row) == 4:
-                pulsar, freq, band, flux = row
-                flux_err = float(flux) * 0.5
-            else:
-                print(f"Error on row: {row}")
-                continue
-            # Make sure there are no weird dash characters in the pulsar name
-            pulsar = pulsar.replace("–", "-").replace("−", "-")
-            if pulsar.startswith("B"):
-                # convert from Bname to Jname
-                pid = list(query["PSRB"]).index(pulsar)
-                pulsar = query["PSRJ"][pid]
-            if pulsar not in all_jnames:
-                print(f"{pulsar} not in the ANTF")
-
-            if pulsar in pulsar_dict.keys():
-                # Append the new data
-                pulsar_dict[pulsar]["Frequency MHz"].append(float(freq))
-                pulsar_dict[pulsar]["Bandwidth MHz"].append(float(band))
-                pulsar_dict[pulsar]["Flux Density mJy"].append(float(flux))
-                pulsar_dict[pulsar]["Flux Density error mJy"].append(float(flux_err))
-            else:
-                # Make dict for this pulsar
-                pulsar_dict[pulsar] = {
-                    "Frequency MHz": [float(freq)],
-                    "Bandwidth MHz": [float(band)],
-                    "Flux Density mJy": [float(flux)],
-                    "Flux Density error mJy": [float(flux_err)],
-                }
+
+def convert_csv_to_yaml(csv_location, ref_label, obs_span, data_type, name_index=None, output_dir=".", verbose=True):
+    """Convert a csv (or tsv) file of flux densities to a catalogue yaml file named after the ref_label.
+
+    Parameters
+    ----------
+    csv_location : `str`
+        The location of the csv file.
+    ref_label : `str`
+        The reference label (in the format "Author_year").
+    obs_span : `str`
+        The observation span ("Single-epoch", "Multi-epoch" or "Long-term").
+    data_type : `str`
+        The data type ("Beamforming" or "Imaging").
+    name_index : :py:class:`pulsar_spectra.names.PulsarNameIndex`, optional
+        The index used to resolve the pulsar names. |br| Default: None, will use
+        :py:meth:`pulsar_spectra.names.get_name_index`.
+    output_dir : `str`, optional
+        The directory to write the yaml file to. |br| Default: ".".
+    verbose : `boolean`, optional
+        Print the rejected rows, the pulsars not in the ATNF and the catalogue data written. |br| Default: True.
+
+    Returns
+    -------
+    rejected : `pandas.DataFrame`
+        The ``'file'``, ``'line'``, ``'row'`` and ``'reason'`` of each rejected row.
+    unknown : `pandas.DataFrame`
+        The ``'file'``, ``'pulsar'`` and ``'closest'`` pulsar of each Jname that is not in the ATNF, see
+        :py:meth:`validate_flux_table`.
+    """
+    if name_index is None:
+        name_index = get_name_index()
+    table, column_rejected = read_flux_table(csv_location)
+    table, value_rejected, unknown = validate_flux_table(table, name_index)
+    rejected = pd.concat([column_rejected, value_rejected], ignore_index=True).sort_values("line")
+    rejected.insert(0, "file", csv_location)
+    unknown.insert(0, "file", csv_location)
+    pulsar_dict = flux_table_to_dict(table, obs_span, data_type)
 
     # Dump the dict to the yaml file in the catalogue directory
-    dump_yaml(pulsar_dict, f"{ref_label}.yaml")
+    dump_yaml(pulsar_dict, os.path.join(output_dir, f"{ref_label}.yaml"))
+
+    if verbose:
+        for _, rejected_row in rejected.iterrows():
+            print(f"Error on line {rejected_row['line']} ({rejected_row['reason']}): {rejected_row['row']}")
+        print_unknown_pulsars(unknown)
+        print("\nCatalogue data written:")
+        print(yaml.dump(pulsar_dict, sort_keys=False, indent=2))
+    return rejected, unknown
 
-    print("\nCatalogue data written:")
-    print(yaml.dump(pulsar_dict, sort_keys=False, indent=2))
+
+def print_unknown_pulsars(unknown):
+    """Print the pulsars that are not in the ATNF from :py:meth:`convert_csv_to_yaml` and the closest pulsar."""
+    for _, unknown_row in unknown.iterrows():
+        suggestion = "" if unknown_row["closest"] is None else f", the closest pulsar is {unknown_row['closest']}"
+        print(f"{unknown_row['pulsar']} not in the ATNF{suggestion}")
+
+
+def bulk_convert_csv_to_yaml(
+    csv_locations,
+    ref_labels=None,
+    obs_span="Single-epoch",
+    data_type="Beamforming",
+    name_index=None,
+    output_dir=".",
+    n_workers=None,
+):
+    """Convert many csv (or tsv) files of flux densities to catalogue yaml files in parallel.
+
+    Parameters
+    ----------
+    csv_locations : `list`
+        The locations of the csv files.
+    ref_labels : `list`, optional
+        The reference label of each file. |br| Default: None, the file names without their extension.
+    obs_span : `str` or `list`, optional
+        The observation span of all or each of the files. |br| Default: "Single-epoch".
+    data_type : `str` or `list`, optional
+        The data type of all or each of the files. |br| Default: "Beamforming".
+    name_index : :py:class:`pulsar_spectra.names.PulsarNameIndex`, optional
+        The index used to resolve the pulsar names. |br| Default: None, will use
+        :py:meth:`pulsar_spectra.names.get_name_index`.
+    output_dir : `str`, optional
+        The directory to write the yaml files to. |br| Default: ".".
+    n_workers : `int`, optional
+        The number of processes used to convert the files. |br| Default: None, the number of CPUs.
+
+    Returns
+    -------
+    rejected : `pandas.DataFrame`
+        The ``'file'``, ``'line'``, ``'row'`` and ``'reason'`` of each rejected row of all the files.
+    unknown : `pandas.DataFrame`
+        The ``'file'``, ``'pulsar'`` and ``'closest'`` pulsar of each Jname that is not in the ATNF of all the files.
+        The workers do not print anything, so these are returned to be reported once.
+    """
+    if ref_labels is None:
+        ref_labels = [os.path.splitext(os.path.basename(csv_location))[0] for csv_location in csv_locations]
+    if isinstance(obs_span, str):
+        obs_span = [obs_span] * len(csv_locations)
+    if isinstance(data_type, str):
+        data_type = [data_type] * len(csv_locations)
+    if name_index is None:
+        # Resolve the names of all the files with a single ATNF query
+        name_index = get_name_index()
+    convert_args = [
+        (csv_location, ref_label, file_obs_span, file_data_type, name_index, output_dir, False)
+        for csv_location, ref_label, file_obs_span, file_data_type in zip(
+            csv_locations, ref_labels, obs_span, data_type
+        )
+    ]
+    if n_workers == 1 or len(csv_locations) == 1:
+        results = [convert_csv_to_yaml(*args) for args in convert_args]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            results = list(pool.map(convert_csv_to_yaml, *zip(*convert_args)))
+    rejected = pd.concat([file_rejected for file_rejected, _ in results], ignore_index=True)
+    unknown = pd.concat([file_unknown for _, file_unknown in results], ignore_index=True)
+    return rejected, unknown
 
 
 def main():
-    parser = argparse.ArgumentParser(description="Convert a csv file to pulsar_spectra catalogue formated yaml file.")
-    parser.add_argument("--csv", type=str, help="The location of the csv file")
-    parser.add_argument("--ref", type=str, help='The reference label (in the format "Author_year")')
+    parser = argparse.ArgumentParser(description="Convert csv files to pulsar_spectra catalogue formated yaml files.")
+    parser.add_argument(
+        "--csv",
+        type=str,
+        nargs="+",
+        help="The location of the csv file. Several csv or tsv (ending in .tsv) files can be given to convert "
+        + "them in parallel.",
+    )
+    parser.add_argument(
+        "--ref",
+        type=str,
+        nargs="*",
+        help='The reference label (in the format "Author_year") of each csv file. '
+        + "Default: the csv file names without their extension",
+    )
     parser.add_argument(
         "--obs_span",
         type=str,
@@ -97,9 +290,48 @@ def main():
         default="Beamforming",
         choices=["Beamforming", "Imaging"],
     )
+    parser.add_argument(
+        "--output_dir",
+        type=str,
+        default=".",
+        help="The directory to write the yaml files to. Default: the current directory",
+    )
+    parser.add_argument(
+        "--n_workers",
+        type=int,
+        help="The number of processes used to convert several csv files. Default: the number of CPUs",
+    )
+    parser.add_argument(
+        "--rejected",
+        type=str,
+        help="A csv file to write the rejected rows of all the csv files to. Default: only print a summary",
+    )
     args = parser.parse_args()
 
-    convert_csv_to_yaml(args.csv, args.ref, args.obs_span, args.data_type)
+    if args.ref is not None and len(args.ref) != len(args.csv):
+        parser.error("--ref requires a reference label for each --csv file")
+
+    if len(args.csv) == 1:
+        ref_label = os.path.splitext(os.path.basename(args.csv[0]))[0] if args.ref is None else args.ref[0]
+        rejected, _ = convert_csv_to_yaml(
+            args.csv[0], ref_label, args.obs_span, args.data_type, output_dir=args.output_dir
+        )
+    else:
+        rejected, unknown = bulk_convert_csv_to_yaml(
+            args.csv,
+            ref_labels=args.ref,
+            obs_span=args.obs_span,
+            data_type=args.data_type,
+            output_dir=args.output_dir,
+            n_workers=args.n_workers,
+        )
+        print_unknown_pulsars(unknown)
+
+    print(f"\n{len(rejected)} rejected rows")
+    if len(rejected) > 0:
+        print(rejected.groupby(["file", "reason"]).size().to_string())
+        if args.rejected is not None:
+            rejected.to_csv(args.rejected, index=False)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,331 @@
+#!/usr/bin/env python
+
+import argparse
+import csv
+import glob
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import yaml
+
+from pulsar_spectra.catalogue import CAT_DIR
+from pulsar_spectra.names import clean_pulsar_name, get_name_index
+from pulsar_spectra.scripts.csv_to_yaml import dump_yaml
+
+SPEC_DIR = os.path.join(CAT_DIR, "ingest_specs")
+
+SPEC_DEFAULTS = {
+    "delimiter": None,
+    "skip_rows": 0,
+    "skip_prefixes": [],
+    "replace": {},
+    "pulsar_column": 0,
+    "name_prefix": "",
+    "name_fixes": {},
+    "resolve_names": False,
+    "skip_pulsars": [],
+    "duplicate_pulsars": "append",
+}
+
+MEASUREMENT_DEFAULTS = {
+    "freq_column": None,
+    "freq_scale": 1,
+    "band_column": None,
+    "flux_column": None,
+    "flux_err_column": None,
+    "flux_pm_column": None,
+    "flux_paren_column": None,
+    "flux_err_fraction": None,
+    "flux_scale": 1,
+    "round": None,
+    "round_to_error": False,
+    "skip_markers": [],
+}
+
+
+def load_spec(spec_file):
+    """Load a paper's ingestion spec and fill in the default options.
+
+    A spec is a small yaml file named after the paper's reference label with the keys:
+
+    ``'raw_file'``
+        The raw table of the paper in the catalogue directory.
+    ``'metadata'``
+        The "Paper Metadata" of the catalogue yaml ("Data Type" and "Observation Span").
+    ``'delimiter'``
+        The column delimiter, or None to split on whitespace. Default: None.
+    ``'skip_rows'``
+        The number of header rows to skip. Default: 0.
+    ``'skip_prefixes'``
+        Skip the rows that start with any of these strings (e.g. comments). Default: [].
+    ``'replace'``
+        Text to replace in each row before it is split (e.g. {" ± ": "±"}). Default: {}.
+    ``'pulsar_column'``
+        The column of the pulsar name. Default: 0.
+    ``'name_prefix'``
+        Text to add to the start of each pulsar name (e.g. "J" for a table without it). Default: "".
+    ``'name_fixes'``
+        The correct name of any pulsar names that are wrong in the paper. Default: {}.
+    ``'resolve_names'``
+        Convert the Bnames and aliases to Jnames with :py:meth:`pulsar_spectra.names.get_name_index`. Default: False.
+    ``'skip_pulsars'``
+        The (fixed or resolved) names of the pulsars to leave out, such as those with values that are quoted from
+        other papers. Default: [].
+    ``'duplicate_pulsars'``
+        Either "append" the measurements of pulsars with several rows or "replace" them with the last row.
+        Default: "append".
+    ``'measurements'``
+        A list of the measurements in each row. Each measurement is a constant ``'freq'`` and ``'band'`` (or the
+        ``'freq_column'``, with a ``'freq_scale'`` to convert it to MHz, and ``'band_column'``), the
+        ``'flux_column'`` and ``'flux_err_column'`` (or the ``'flux_pm_column'`` of a "flux±error" column or the
+        ``'flux_paren_column'`` of a "flux(error)" column with the error in units of the last digit, or a
+        ``'flux_err_fraction'`` of the flux density instead of the ``'flux_err_column'``), a ``'flux_scale'`` to
+        convert the flux densities to mJy, the number of decimals to ``'round'`` the flux densities to (or
+        ``'round_to_error'`` to round them to the first significant figure of the error) and ``'skip_markers'``
+        that mark the values to skip (such as upper limits). Measurements with missing or non-numeric values are
+        skipped.
+
+    Parameters
+    ----------
+    spec_file : `str`
+        The location of the spec yaml file.
+
+    Returns
+    -------
+    spec : `dict`
+        The spec with the ``'ref'`` label from the file name and the default options.
+    """
+    with open(spec_file, "r") as stream:
+        spec = yaml.safe_load(stream)
+    spec = {**SPEC_DEFAULTS, **spec}
+    spec["ref"] = os.path.splitext(os.path.basename(spec_file))[0]
+    spec["measurements"] = [{**MEASUREMENT_DEFAULTS, **measurement} for measurement in spec["measurements"]]
+    if spec["duplicate_pulsars"] not in ("append", "replace"):
+        raise ValueError(f"{spec['ref']}: duplicate_pulsars must be 'append' or 'replace'")
+    return spec
+
+
+def read_raw_rows(raw_file, spec):
+    """Read the rows of a raw table and split them into stripped columns."""
+    with open(raw_file, "r", newline="") as stream:
+        lines = stream.read().splitlines()[spec["skip_rows"] :]
+    for old, new in spec["replace"].items():
+        lines = [line.replace(old, new) for line in lines]
+    lines = [line for line in lines if line.strip() != "" and not line.strip().startswith(tuple(spec["skip_prefixes"]))]
+    if spec["delimiter"] is None:
+        return [line.split() for line in lines]
+    return [[cell.strip() for cell in row] for row in csv.reader(lines, delimiter=spec["delimiter"])]
+
+
+def _cell(row, column):
+    """Get a column of a row or an empty string if the row is too short."""
+    return row[column] if column < len(row) else ""
+
+
+def _parenthesis_cells(cell):
+    """Split a "flux(error)" cell, with the error in units of the last digit (e.g. 0.61(9)), into [flux, error]."""
+    cells = cell.split("(")
+    if len(cells) != 2 or not cells[1].endswith(")"):
+        return cells
+    flux, flux_err = cells[0], cells[1][:-1]
+    decimals = len(flux.split(".")[-1]) if "." in flux else 0
+    try:
+        return [flux, str(round(float(flux_err) * 10 ** (-decimals), decimals))]
+    except ValueError:
+        return cells
+
+
+def parse_measurement(row, measurement):
+    """Parse one measurement of a row into (freq, band, flux, flux_err), or None if it is missing or skipped."""
+    if measurement["flux_pm_column"] is not None:
+        cells = _cell(row, measurement["flux_pm_column"]).split("±")
+    elif measurement["flux_paren_column"] is not None:
+        cells = _parenthesis_cells(_cell(row, measurement["flux_paren_column"]))
+    elif measurement["flux_err_fraction"] is not None:
+        cells = [_cell(row, measurement["flux_column"])]
+    else:
+        cells = [_cell(row, measurement["flux_column"]), _cell(row, measurement["flux_err_column"])]
+    n_cells = 1 if measurement["flux_err_fraction"] is not None else 2
+    if len(cells) != n_cells or any(marker in cell for marker in measurement["skip_markers"] for cell in cells):
+        return None
+    try:
+        values = [float(cell) * measurement["flux_scale"] for cell in cells]
+        if measurement["freq_column"] is None:
+            freq = measurement["freq"]
+        else:
+            freq = float(row[measurement["freq_column"]]) * measurement["freq_scale"]
+        band = measurement["band"] if measurement["band_column"] is None else float(row[measurement["band_column"]])
+    except (ValueError, IndexError):
+        return None
+    flux = values[0]
+    flux_err = flux * measurement["flux_err_fraction"] if n_cells == 1 else values[1]
+    decimals = measurement["round"]
+    if measurement["round_to_error"] and flux_err != 0:
+        decimals = -math.floor(math.log10(abs(flux_err)))
+    if decimals is not None:
+        flux = round(flux, decimals)
+        if n_cells == 1:
+            # The fractional error of the rounded flux density
+            flux_err = flux * measurement["flux_err_fraction"]
+        flux_err = round(flux_err, decimals)
+    return freq, band, flux, flux_err
+
+
+def ingest_paper(spec_file, raw_dir=CAT_DIR, output_dir=CAT_DIR, name_index=None):
+    """Convert a paper's raw table to a catalogue yaml file using its ingestion spec.
+
+    Parameters
+    ----------
+    spec_file : `str`
+        The location of the spec yaml file (see :py:meth:`load_spec`).
+    raw_dir : `str`, optional
+        The directory of the raw table. |br| Default: the catalogue directory.
+    output_dir : `str`, optional
+        The directory to write the yaml file to. |br| Default: the catalogue directory.
+    name_index : :py:class:`pulsar_spectra.names.PulsarNameIndex`, optional
+        The index used to resolve the names and to report the pulsars that are not in the ATNF catalogue.
+        |br| Default: None, only query the ATNF catalogue if the spec resolves names.
+
+    Returns
+    -------
+    summary : `dict`
+        The ``'ref'``, the number of rows (``'n_rows'``), pulsars (``'n_pulsars'``) and measurements
+        (``'n_measurements'``) and the ``'unknown_pulsars'`` that are not in the name_index.
+    """
+    spec = load_spec(spec_file)
+    if name_index is None and spec["resolve_names"]:
+        name_index = get_name_index()
+    rows = read_raw_rows(os.path.join(raw_dir, spec["raw_file"]), spec)
+
+    pulsar_dict = {"Paper Metadata": dict(spec["metadata"])}
+    unknown_pulsars = []
+    n_measurements = 0
+    for row in rows:
+        pulsar = clean_pulsar_name(spec["name_prefix"] + _cell(row, spec["pulsar_column"]))
+        pulsar = spec["name_fixes"].get(pulsar, pulsar)
+        measurements = [parse_measurement(row, measurement) for measurement in spec["measurements"]]
+        measurements = [measurement for measurement in measurements if measurement is not None]
+        if len(measurements) == 0:
+            continue
+        if name_index is not None:
+            if pulsar not in name_index:
+                unknown_pulsars.append(pulsar)
+            elif spec["resolve_names"]:
+                pulsar = name_index.resolve(pulsar)
+        if pulsar in spec["skip_pulsars"]:
+            continue
+        if pulsar not in pulsar_dict or spec["duplicate_pulsars"] == "replace":
+            pulsar_dict[pulsar] = {
+                "Frequency MHz": [],
+                "Bandwidth MHz": [],
+                "Flux Density mJy": [],
+                "Flux Density error mJy": [],
+            }
+        for freq, band, flux, flux_err in measurements:
+            pulsar_dict[pulsar]["Frequency MHz"].append(freq)
+            pulsar_dict[pulsar]["Bandwidth MHz"].append(band)
+            pulsar_dict[pulsar]["Flux Density mJy"].append(flux)
+            pulsar_dict[pulsar]["Flux Density error mJy"].append(flux_err)
+        n_measurements += len(measurements)
+
+    dump_yaml(pulsar_dict, os.path.join(output_dir, f"{spec['ref']}.yaml"))
+    return {
+        "ref": spec["ref"],
+        "n_rows": len(rows),
+        "n_pulsars": len(pulsar_dict) - 1,
+        "n_measurements": n_measurements,
+        "unknown_pulsars": unknown_pulsars,
+    }
+
+
+def ingest_papers(spec_files=None, raw_dir=CAT_DIR, output_dir=CAT_DIR, name_index=None, n_workers=None):
+    """Rebuild the catalogue yaml files of many papers from their ingestion specs in parallel.
+
+    Parameters
+    ----------
+    spec_files : `list`, optional
+        The locations of the spec yaml files. |br| Default: None, all the specs in the ingest_specs directory.
+    raw_dir : `str`, optional
+        The directory of the raw tables. |br| Default: the catalogue directory.
+    output_dir : `str`, optional
+        The directory to write the yaml files to. |br| Default: the catalogue directory.
+    name_index : :py:class:`pulsar_spectra.names.PulsarNameIndex`, optional
+        The index used to resolve the names of all the papers. |br| Default: None, will query the ATNF catalogue
+        once if any spec resolves names.
+    n_workers : `int`, optional
+        The number of processes used to convert the papers. |br| Default: None, the number of CPUs.
+
+    Returns
+    -------
+    summaries : `list`
+        The summary of each paper from :py:meth:`ingest_paper`.
+    """
+    if spec_files is None:
+        spec_files = sorted(glob.glob(os.path.join(SPEC_DIR, "*.yaml")))
+    if name_index is None and any(load_spec(spec_file)["resolve_names"] for spec_file in spec_files):
+        # Share a single ATNF query between all the papers
+        name_index = get_name_index()
+    ingest_args = [(spec_file, raw_dir, output_dir, name_index) for spec_file in spec_files]
+    if n_workers == 1 or len(spec_files) <= 1:
+        return [ingest_paper(*args) for args in ingest_args]
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        return list(pool.map(ingest_paper, *zip(*ingest_args)))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild the catalogue yaml files of papers from their raw tables and ingestion specs."
+    )
+    parser.add_argument(
+        "--refs",
+        type=str,
+        nargs="*",
+        help="The reference labels of the papers to rebuild. Default: all the papers with a spec",
+    )
+    parser.add_argument(
+        "--spec_dir",
+        type=str,
+        default=SPEC_DIR,
+        help="The directory of the ingestion spec yaml files. Default: the catalogue ingest_specs directory",
+    )
+    parser.add_argument(
+        "--output_dir",
+        type=str,
+        default=CAT_DIR,
+        help="The directory to write the yaml files to. Default: the catalogue directory",
+    )
+    parser.add_argument(
+        "--check_names",
+        action="store_true",
+        help="Query the ATNF catalogue to report the pulsar names that are not in it.",
+    )
+    parser.add_argument(
+        "--n_workers",
+        type=int,
+        help="The number of processes used to convert the papers. Default: the number of CPUs",
+    )
+    args = parser.parse_args()
+
+    if args.refs is None:
+        spec_files = sorted(glob.glob(os.path.join(args.spec_dir, "*.yaml")))
+    else:
+        spec_files = [os.path.join(args.spec_dir, f"{ref}.yaml") for ref in args.refs]
+    name_index = None
+    if args.check_names or any(load_spec(spec_file)["resolve_names"] for spec_file in spec_files):
+        # Use the same index to resolve the names and suggest the closest pulsars to the unknown ones
+        name_index = get_name_index()
+    summaries = ingest_papers(spec_files, output_dir=args.output_dir, name_index=name_index, n_workers=args.n_workers)
+    for summary in summaries:
+        print(
+            f"{summary['ref']:20s} {summary['n_rows']:5d} rows {summary['n_pulsars']:5d} pulsars "
+            f"{summary['n_measurements']:5d} measurements"
+        )
+        for pulsar in summary["unknown_pulsars"]:
+            candidates = name_index.candidates(pulsar)
+            suggestion = "" if len(candidates) == 0 else f", the closest pulsar is {candidates[0][0]}"
+            print(f"    {pulsar} not in the ATNF{suggestion}")
+
+
+if __name__ == "__main__":
+    main()
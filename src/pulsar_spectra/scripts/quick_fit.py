@@ -3,15 +3,138 @@
 import argparse
 import logging
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 
 from pulsar_spectra.catalogue import collect_catalogue_fluxes
+from pulsar_spectra.names import get_name_index
+from pulsar_spectra.results import ParquetResultsWriter, ResultsStore, find_changed_pulsars, make_fit_record
+from pulsar_spectra.selection import PulsarSelector
 from pulsar_spectra.spectral_fit import find_best_spectral_fit
 
 logger = logging.getLogger(__name__)
 
 
-def quick_fit(pulsars):
+def report_changes(changes):
+    """Log which pulsars need to be refit and which papers caused it."""
+    for status in ["new", "changed", "removed"]:
+        status_pulsars = [pulsar for pulsar in changes.keys() if changes[pulsar]["status"] == status]
+        logger.info(f"{len(status_pulsars)} {status} pulsars")
+        if status == "new":
+            # All of their references are new so don't list them
+            continue
+        for pulsar in status_pulsars:
+            ref_changes = []
+            for ref_key, label in [("added_refs", "added"), ("removed_refs", "removed"), ("changed_refs", "changed")]:
+                if len(changes[pulsar][ref_key]) > 0:
+                    ref_changes.append(f"{label}: {', '.join(changes[pulsar][ref_key])}")
+            logger.info(f"    {pulsar}  {'  '.join(ref_changes)}")
+
+
+def quick_fit(
+    pulsars,
+    results_file=None,
+    changes_only=False,
+    parquet_file=None,
+    buffer_size=1,
+    band_tolerance=None,
+    fit_budget=None,
+    n_starts=1,
+    n_workers=None,
+    selection=None,
+    plot_best=None,
+    use_jit=False,
+):
+    named_pulsars = pulsars is not None
+    if plot_best is None:
+        # Only plot when fitting a few named pulsars, not thousands of plots for the whole catalogue
+        plot_best = named_pulsars
     cat_list = collect_catalogue_fluxes()
+    if pulsars is not None and any(pulsar not in cat_list.keys() for pulsar in pulsars):
+        # Resolve any Bnames or aliases to Jnames
+        name_index = get_name_index()
+        jnames = []
+        for pulsar in pulsars:
+            jname = pulsar if pulsar in cat_list.keys() else name_index.resolve(pulsar)
+            if jname is None or jname not in cat_list.keys():
+                logger.error(f"Unknown pulsar name: {pulsar}")
+            else:
+                jnames.append(jname)
+        pulsars = jnames
+    if selection is not None:
+        # Only fit the pulsars with data that satisfy the cone, parameter range and frequency coverage conditions
+        selector = PulsarSelector(params=tuple((selection.get("ranges") or {}).keys()), cat_list=cat_list)
+        selected = selector.select(pulsars=pulsars, **selection)
+        pulsars = [pulsar for pulsar in selected if pulsar in cat_list.keys() and len(cat_list[pulsar][0]) > 0]
+        logger.info(f"Selected {len(pulsars)} pulsars with data")
+
+    changes = None
+    if results_file is None:
+        store = None
+    else:
+        # Only fit the pulsars that are new or whose data has changed since they were stored
+        store = ResultsStore(results_file, buffer_size=buffer_size)
+        changes = find_changed_pulsars(store.load(), cat_list, pulsars=pulsars)
+        report_changes(changes)
+        if changes_only:
+            return changes
+        # Drop the fits of pulsars without any data left so they are not used by the population statistics
+        store.remove([pulsar for pulsar in changes.keys() if changes[pulsar]["status"] == "removed"])
+        if not named_pulsars:
+            # The pulsars asked for by name are always refit
+            pulsars = [pulsar for pulsar in changes.keys() if changes[pulsar]["status"] != "removed"]
+    if pulsars is None:
+        # Fit all pulsars with data
+        pulsars = [pulsar for pulsar in cat_list.keys() if len(cat_list[pulsar][0]) > 0]
+
+    # Where to stream the fit records
+    writers = []
+    if store is not None:
+        writers.append(store)
+    if parquet_file is not None:
+        writers.append(ParquetResultsWriter(parquet_file, buffer_size=max(buffer_size, 100)))
+    if n_starts > 1 and n_workers != 1:
+        # One pool of worker processes for the multi-start fits of all the pulsars
+        pool = ProcessPoolExecutor(max_workers=n_workers)
+    else:
+        pool = nullcontext()
+    try:
+        with pool as executor:
+            fit_pulsars(
+                pulsars,
+                cat_list,
+                writers,
+                band_tolerance=band_tolerance,
+                fit_budget=fit_budget,
+                n_starts=n_starts,
+                n_workers=n_workers,
+                plot_best=plot_best,
+                use_jit=use_jit,
+                executor=executor,
+            )
+    finally:
+        # Make sure the buffered records are written even if the run is interrupted
+        for writer in writers:
+            writer.close()
+    return changes
+
+
+def fit_pulsars(
+    pulsars,
+    cat_list,
+    writers,
+    band_tolerance=None,
+    fit_budget=None,
+    n_starts=1,
+    n_workers=None,
+    plot_best=True,
+    use_jit=False,
+    executor=None,
+):
+    if fit_budget is None:
+        # The max_calls, max_time, pulsar_max_calls and pulsar_max_time of find_best_spectral_fit
+        fit_budget = {}
     for pulsar in pulsars:
         logger.info(f"\nFitting {pulsar}")
         freq_all, band_all, flux_all, flux_err_all, ref_all = cat_list[pulsar]
@@ -32,9 +155,27 @@ def quick_fit(pulsars):
         logger.debug(f"len(flux_all): {len(flux_all)}")
         logger.debug(f"len(flux_err_all): {len(flux_err_all)}")
         logger.debug(ref_all)
+        start_time = time.perf_counter()
         model_name, iminuit_result, fit_info, p_best, p_category = find_best_spectral_fit(
-            pulsar, freq_all, band_all, flux_all, flux_err_all, ref_all, plot_best=True
+            pulsar,
+            freq_all,
+            band_all,
+            flux_all,
+            flux_err_all,
+            ref_all,
+            plot_best=plot_best,
+            band_tolerance=band_tolerance,
+            use_jit=use_jit,
+            n_starts=n_starts,
+            n_workers=n_workers,
+            executor=executor,
+            **fit_budget,
         )
+        fit_time = time.perf_counter() - start_time
+        if len(writers) > 0:
+            record = make_fit_record(pulsar, cat_list[pulsar], model_name, iminuit_result, p_best, fit_time=fit_time)
+            for writer in writers:
+                writer.append(record)
         logger.info(f"\n{pulsar} fit: {model_name}")
         if iminuit_result is None:
             continue
@@ -50,7 +191,123 @@ def main():
     loglevels = dict(DEBUG=logging.DEBUG, INFO=logging.INFO, WARNING=logging.WARNING)
 
     parser = argparse.ArgumentParser(description="Perform a spectral fit on the input pulsars.")
-    parser.add_argument("-p", "--pulsars", type=str, nargs="*", help="Space seperated list of pulsar J names.")
+    parser.add_argument(
+        "-p",
+        "--pulsars",
+        type=str,
+        nargs="*",
+        help="Space seperated list of pulsar J names (or B names and aliases). If not given, will fit all pulsars with data.",
+    )
+    parser.add_argument(
+        "-r",
+        "--results",
+        type=str,
+        help="A JSON lines file to append each pulsar's fit to as it completes. "
+        + "If the file already exists, only pulsars that are new or whose data has changed are fit (the --pulsars "
+        + "are always refit), so interrupted runs can be resumed and catalogue updates only refit the affected "
+        + "pulsars. The fits of pulsars that no longer have any data are removed.",
+    )
+
+    parser.add_argument(
+        "--parquet",
+        type=str,
+        help="A Parquet file to stream each pulsar's fit to (requires pyarrow). Will overwrite an existing file.",
+    )
+    parser.add_argument(
+        "--buffer_size",
+        type=int,
+        default=1,
+        help="The number of fit records to hold in memory before writing them to the --results file "
+        + "(Parquet files use at least 100). Default: 1",
+    )
+    parser.add_argument(
+        "--changes_only",
+        action="store_true",
+        help="Only report which pulsars in the --results file need to be refit because of catalogue changes.",
+    )
+    parser.add_argument(
+        "--band_tolerance",
+        type=float,
+        help="Skip the bandwidth corrected fit of a model if the largest bandwidth correction is less than "
+        + "this many flux density uncertainties. Default: always do the bandwidth corrected fit",
+    )
+
+    parser.add_argument(
+        "--max_calls",
+        type=int,
+        help="The maximum number of cost function calls of each model fit. Default: no limit",
+    )
+    parser.add_argument(
+        "--max_time",
+        type=float,
+        help="The maximum time in seconds of each model fit. Default: no limit",
+    )
+    parser.add_argument(
+        "--pulsar_max_calls",
+        type=int,
+        help="The maximum number of cost function calls of all a pulsar's model fits. Default: no limit",
+    )
+    parser.add_argument(
+        "--pulsar_max_time",
+        type=float,
+        help="The maximum time in seconds of all a pulsar's model fits. Fits that run out of calls or time are "
+        + "stopped and marked as budget_exceeded so the other pulsars can be fit. Default: no limit",
+    )
+    parser.add_argument(
+        "--n_starts",
+        type=int,
+        default=1,
+        help="Fit each model from this many starts spread over the parameter limits and keep the best. Default: 1",
+    )
+    parser.add_argument(
+        "--n_workers",
+        type=int,
+        help="The number of processes used to fit the --n_starts starts. Default: the number of CPUs",
+    )
+    parser.add_argument(
+        "--use_jit",
+        action="store_true",
+        help="Fit with the numba compiled models, which are faster but calculate in double precision. "
+        + "Requires the jit extra (pip install pulsar-spectra[jit]). Default: fit with the NumPy models",
+    )
+
+    parser.add_argument(
+        "--plot",
+        action="store_true",
+        help="Plot the best fit of every pulsar. Default: only plot when --pulsars are given",
+    )
+
+    parser.add_argument(
+        "--cone",
+        type=float,
+        nargs=3,
+        metavar=("RA_DEG", "DEC_DEG", "RADIUS_DEG"),
+        help="Only fit the pulsars within RADIUS_DEG degrees of this sky position. Default: the whole sky",
+    )
+    parser.add_argument(
+        "--param_range",
+        type=str,
+        nargs=3,
+        action="append",
+        metavar=("PARAM", "MIN", "MAX"),
+        help="Only fit the pulsars with an ATNF parameter in this range (MIN <= value < MAX, use inf or -inf for "
+        + "no limit). Can be used multiple times, e.g. --param_range P0 0 0.03 --param_range DM 0 50 for "
+        + "millisecond pulsars with a DM less than 50. Default: no parameter limits",
+    )
+    parser.add_argument(
+        "--freq_range",
+        type=float,
+        nargs=2,
+        metavar=("MIN_MHZ", "MAX_MHZ"),
+        help="Only fit the pulsars with measurements between these frequencies (including their bandwidths) "
+        + "from at least --min_refs references. Default: no frequency limits",
+    )
+    parser.add_argument(
+        "--min_refs",
+        type=int,
+        default=1,
+        help="The minimum number of references with measurements in the --freq_range. Default: 1",
+    )
 
     parser.add_argument("-L", "--loglvl", type=str, default="INFO", help="Logger verbosity level. Default: INFO")
     args = parser.parse_args()
@@ -69,7 +326,36 @@ def main():
             logging.getLogger(imported_module).addHandler(ch)
             logging.getLogger(imported_module).propagate = False
 
-    quick_fit(args.pulsars)
+    if args.changes_only and args.results is None:
+        parser.error("--changes_only requires a --results file")
+
+    selection = None
+    if args.cone is not None or args.param_range is not None or args.freq_range is not None:
+        selection = {"cone": args.cone, "ranges": None, "freq_range_MHz": args.freq_range, "min_refs": args.min_refs}
+        if args.param_range is not None:
+            selection["ranges"] = {
+                param: (float(min_value), float(max_value)) for param, min_value, max_value in args.param_range
+            }
+
+    quick_fit(
+        args.pulsars,
+        results_file=args.results,
+        changes_only=args.changes_only,
+        parquet_file=args.parquet,
+        buffer_size=args.buffer_size,
+        band_tolerance=args.band_tolerance,
+        fit_budget={
+            "max_calls": args.max_calls,
+            "max_time": args.max_time,
+            "pulsar_max_calls": args.pulsar_max_calls,
+            "pulsar_max_time": args.pulsar_max_time,
+        },
+        n_starts=args.n_starts,
+        n_workers=args.n_workers,
+        selection=selection,
+        plot_best=True if args.plot else None,
+        use_jit=args.use_jit,
+    )
 
 
 if __name__ == "__main__":
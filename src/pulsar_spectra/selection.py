@@ -0,0 +1,308 @@
+"""
+Functions used to select pulsars by their sky position, ATNF parameters and frequency coverage
+"""
+
+import functools
+import logging
+
+import numpy as np
+import pandas as pd
+
+from pulsar_spectra.utils import get_atnf_table, unit_vectors
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def scipy_available():
+    """Check if scipy is installed.
+
+    Returns
+    -------
+    available : `boolean`
+        True if scipy can be imported.
+    """
+    try:
+        import scipy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class FrequencyCoverageIndex:
+    """An index of the frequency range (frequency +/- bandwidth / 2) of every measurement in a catalogue that
+    quickly finds which pulsars and references cover a frequency range.
+
+    The measurements are sorted by their lowest frequency, so the measurements that overlap a frequency range are
+    found with a binary search between the lowest frequency of the range minus the widest measurement and the
+    highest frequency of the range.
+
+    Parameters
+    ----------
+    cat_list : `dict`
+        The catalogue from :py:meth:`pulsar_spectra.catalogue.collect_catalogue_fluxes`.
+    pulsars : `list`, optional
+        Only index these pulsars. |br| Default: None, all the pulsars with data.
+    """
+
+    def __init__(self, cat_list, pulsars=None):
+        if pulsars is None:
+            pulsars = [pulsar for pulsar in cat_list.keys() if len(cat_list[pulsar][0]) > 0]
+        self.pulsars = np.array(pulsars, dtype=str)
+        freqs = np.array([freq for pulsar in pulsars for freq in cat_list[pulsar][0]], dtype=float)
+        bands = np.array(
+            [np.nan if band is None else band for pulsar in pulsars for band in cat_list[pulsar][1]], dtype=float
+        )
+        pulsar_codes = np.repeat(np.arange(len(pulsars)), [len(cat_list[pulsar][0]) for pulsar in pulsars])
+        self.refs, ref_codes = np.unique(
+            np.array([ref for pulsar in pulsars for ref in cat_list[pulsar][4]], dtype=str), return_inverse=True
+        )
+        # Measurements without a bandwidth only cover their frequency
+        half_bands = np.where(np.isfinite(bands), bands / 2, 0.0)
+
+        order = np.argsort(freqs - half_bands, kind="stable")
+        self.lower_freqs_MHz = (freqs - half_bands)[order]
+        self.upper_freqs_MHz = (freqs + half_bands)[order]
+        self.pulsar_codes = pulsar_codes[order]
+        self.ref_codes = ref_codes[order]
+        self._max_width = np.max(self.upper_freqs_MHz - self.lower_freqs_MHz, initial=0.0)
+
+    def measurement_rows(self, min_freq_MHz, max_freq_MHz):
+        """Find the rows of the measurements that overlap a frequency range.
+
+        Parameters
+        ----------
+        min_freq_MHz : `float`
+            The minimum frequency in MHz.
+        max_freq_MHz : `float`
+            The maximum frequency in MHz.
+
+        Returns
+        -------
+        rows : `numpy.ndarray`
+            The rows of the measurements in order of their lowest frequency.
+        """
+        start = np.searchsorted(self.lower_freqs_MHz, min_freq_MHz - self._max_width, side="left")
+        stop = np.searchsorted(self.lower_freqs_MHz, max_freq_MHz, side="right")
+        rows = np.arange(start, stop)
+        return rows[self.upper_freqs_MHz[start:stop] >= min_freq_MHz]
+
+    def pulsars_in_range(self, min_freq_MHz, max_freq_MHz, min_refs=1, min_points=1):
+        """Find the pulsars with measurements that overlap a frequency range.
+
+        Parameters
+        ----------
+        min_freq_MHz : `float`
+            The minimum frequency in MHz.
+        max_freq_MHz : `float`
+            The maximum frequency in MHz.
+        min_refs : `int`, optional
+            The minimum number of references with a measurement in the range. |br| Default: 1.
+        min_points : `int`, optional
+            The minimum number of measurements in the range. |br| Default: 1.
+
+        Returns
+        -------
+        pulsars : `list`
+            The pulsar Jnames in the order they were indexed.
+        """
+        rows = self.measurement_rows(min_freq_MHz, max_freq_MHz)
+        n_points = np.bincount(self.pulsar_codes[rows], minlength=len(self.pulsars))
+        # Count each pulsar and reference pair once
+        pairs = np.unique(self.pulsar_codes[rows] * len(self.refs) + self.ref_codes[rows])
+        n_refs = np.bincount(pairs // max(len(self.refs), 1), minlength=len(self.pulsars))
+        return self.pulsars[(n_points >= min_points) & (n_refs >= min_refs) & (n_points > 0)].tolist()
+
+    def coverage_table(self, by="pulsar", min_freq_MHz=-np.inf, max_freq_MHz=np.inf, group_atnf=False):
+        """Summarise the frequency coverage of each pulsar or reference.
+
+        Parameters
+        ----------
+        by : `str`, optional
+            Either "pulsar" or "reference". |br| Default: "pulsar".
+        min_freq_MHz : `float`, optional
+            Only include the measurements that overlap this minimum frequency in MHz. |br| Default: -inf.
+        max_freq_MHz : `float`, optional
+            Only include the measurements that overlap this maximum frequency in MHz. |br| Default: inf.
+        group_atnf : `boolean`, optional
+            Count all the ATNF pulsar catalogue references (ending in "_ATNF") as a single "ATNF" reference.
+            |br| Default: False.
+
+        Returns
+        -------
+        table : `pandas.DataFrame`
+            A row for each pulsar or reference with measurements in the range, with the number of measurements
+            (``'n_points'``), the number of references or pulsars (``'n_refs'`` or ``'n_pulsars'``) and the lowest
+            and highest frequency covered (``'min_freq_MHz'`` and ``'max_freq_MHz'``).
+        """
+        if by not in ("pulsar", "reference"):
+            raise ValueError(f"by must be 'pulsar' or 'reference', not {by}")
+        rows = self.measurement_rows(min_freq_MHz, max_freq_MHz)
+        refs = self.refs
+        if group_atnf:
+            refs = np.where(np.char.endswith(refs, "_ATNF"), "ATNF", refs)
+        measurements = pd.DataFrame(
+            {
+                "pulsar": self.pulsars[self.pulsar_codes[rows]],
+                "reference": refs[self.ref_codes[rows]],
+                "lower": self.lower_freqs_MHz[rows],
+                "upper": self.upper_freqs_MHz[rows],
+            }
+        )
+        other = "reference" if by == "pulsar" else "pulsar"
+        table = measurements.groupby(by).agg(
+            n_points=("lower", "size"),
+            n_other=(other, "nunique"),
+            min_freq_MHz=("lower", "min"),
+            max_freq_MHz=("upper", "max"),
+        )
+        return table.rename(columns={"n_other": "n_refs" if by == "pulsar" else "n_pulsars"})
+
+
+class PulsarSelector:
+    """An index of an ATNF catalogue snapshot that quickly selects pulsars by their sky position and parameters.
+
+    The sky positions are indexed with a KD-tree of their unit vectors (if scipy is installed, otherwise all the
+    separations are calculated at once) and each parameter is indexed by sorting it,
+    so each selection only takes a few milliseconds.
+
+    Parameters
+    ----------
+    query : `pandas.DataFrame`, optional
+        A previous psrqpy.QueryATNF query with the ``PSRJ``, ``RAJD`` and ``DECJD`` columns and the params.
+        Can be supplied to prevent performing a new query. |br| Default: None, will query the ATNF catalogue once
+        with :py:meth:`pulsar_spectra.utils.get_atnf_table`.
+    params : `tuple`, optional
+        The ATNF parameters to index. |br| Default: ("P0", "DM").
+    use_kdtree : `boolean`, optional
+        Use a scipy KD-tree for the sky positions if scipy is installed. |br| Default: True.
+    cat_list : `dict`, optional
+        The catalogue from :py:meth:`pulsar_spectra.catalogue.collect_catalogue_fluxes` to make a
+        :py:class:`FrequencyCoverageIndex` from, so pulsars can be selected by their frequency coverage.
+        |br| Default: None.
+    """
+
+    def __init__(self, query=None, params=("P0", "DM"), use_kdtree=True, cat_list=None):
+        params = [param.upper() for param in params]
+        if query is None:
+            query = get_atnf_table(tuple(["RAJD", "DECJD"] + params))
+        query = query.drop_duplicates("PSRJ")
+        self.pulsars = query["PSRJ"].to_numpy(dtype=str)
+
+        # Sky positions of the pulsars with a position
+        ra_deg = query["RAJD"].to_numpy(dtype=float)
+        dec_deg = query["DECJD"].to_numpy(dtype=float)
+        self._sky_rows = np.flatnonzero(np.isfinite(ra_deg) & np.isfinite(dec_deg))
+        self._sky_vectors = unit_vectors(ra_deg[self._sky_rows], dec_deg[self._sky_rows])
+        self._kdtree = None
+        if use_kdtree and scipy_available():
+            from scipy.spatial import cKDTree
+
+            self._kdtree = cKDTree(self._sky_vectors)
+
+        # Sorted values of each parameter, leaving out the pulsars without a value
+        self._sorted_rows = {}
+        self._sorted_values = {}
+        for param in params:
+            values = query[param].to_numpy(dtype=float)
+            rows = np.flatnonzero(np.isfinite(values))
+            order = np.argsort(values[rows], kind="stable")
+            self._sorted_rows[param] = rows[order]
+            self._sorted_values[param] = values[rows[order]]
+
+        self.coverage_index = None if cat_list is None else FrequencyCoverageIndex(cat_list)
+
+    def cone_rows(self, ra_deg, dec_deg, radius_deg):
+        """Find the rows of the pulsars within a radius of a sky position.
+
+        Parameters
+        ----------
+        ra_deg : `float`
+            The right ascension of the centre in degrees.
+        dec_deg : `float`
+            The declination of the centre in degrees.
+        radius_deg : `float`
+            The radius in degrees.
+
+        Returns
+        -------
+        rows : `numpy.ndarray`
+            The sorted rows of the pulsars.
+        """
+        centre = unit_vectors(ra_deg, dec_deg)
+        if self._kdtree is None:
+            inside = self._sky_vectors @ centre >= np.cos(np.radians(min(radius_deg, 180)))
+            return np.sort(self._sky_rows[inside])
+        # The straight line distance between two unit vectors that are the radius apart
+        chord = 2 * np.sin(np.radians(min(radius_deg, 180)) / 2)
+        return np.sort(self._sky_rows[self._kdtree.query_ball_point(centre, chord * (1 + 1e-12))])
+
+    def range_rows(self, param, min_value=-np.inf, max_value=np.inf):
+        """Find the rows of the pulsars with a parameter between two values (min_value <= value < max_value).
+
+        Parameters
+        ----------
+        param : `str`
+            One of the indexed ATNF parameters.
+        min_value : `float`, optional
+            The minimum value. |br| Default: -inf.
+        max_value : `float`, optional
+            The maximum value, which is not included. |br| Default: inf.
+
+        Returns
+        -------
+        rows : `numpy.ndarray`
+            The sorted rows of the pulsars.
+        """
+        param = param.upper()
+        if param not in self._sorted_values:
+            raise KeyError(f"{param} is not indexed. Options are: {', '.join(self._sorted_values.keys())}")
+        start = np.searchsorted(self._sorted_values[param], min_value, side="left")
+        stop = np.searchsorted(self._sorted_values[param], max_value, side="left")
+        return np.sort(self._sorted_rows[param][start:stop])
+
+    def select(self, cone=None, ranges=None, pulsars=None, freq_range_MHz=None, min_refs=1):
+        """Select the pulsars that satisfy all the conditions.
+
+        Parameters
+        ----------
+        cone : `tuple`, optional
+            The (ra_deg, dec_deg, radius_deg) of a sky position and radius the pulsars must be within.
+            |br| Default: None.
+        ranges : `dict`, optional
+            The (min_value, max_value) of each parameter, e.g. {"P0": (0, 0.03), "DM": (0, 50)} for
+            millisecond pulsars with a DM less than 50. Either value can be None for no limit. |br| Default: None.
+        pulsars : `list`, optional
+            Only select from these pulsar Jnames. |br| Default: None, all the pulsars in the catalogue.
+        freq_range_MHz : `tuple`, optional
+            The (min_freq_MHz, max_freq_MHz) the pulsars must have measurements in, which requires the cat_list.
+            |br| Default: None.
+        min_refs : `int`, optional
+            The minimum number of references with measurements in the freq_range_MHz. |br| Default: 1.
+
+        Returns
+        -------
+        selected : `list`
+            The selected pulsar Jnames in the order of the catalogue.
+        """
+        rows = np.arange(len(self.pulsars))
+        if cone is not None:
+            rows = np.intersect1d(rows, self.cone_rows(*cone), assume_unique=True)
+        if ranges is not None:
+            for param, (min_value, max_value) in ranges.items():
+                param_rows = self.range_rows(
+                    param,
+                    -np.inf if min_value is None else min_value,
+                    np.inf if max_value is None else max_value,
+                )
+                rows = np.intersect1d(rows, param_rows, assume_unique=True)
+        selected = self.pulsars[rows]
+        if pulsars is not None:
+            selected = selected[np.isin(selected, list(pulsars))]
+        if freq_range_MHz is not None:
+            if self.coverage_index is None:
+                raise ValueError("Selecting by frequency coverage requires the PulsarSelector to have a cat_list")
+            covered = self.coverage_index.pulsars_in_range(*freq_range_MHz, min_refs=min_refs)
+            selected = selected[np.isin(selected, covered)]
+        logger.debug(f"Selected {len(selected)} of {len(self.pulsars)} pulsars")
+        return selected.tolist()
@@ -2,7 +2,12 @@
 Functions used to fit different spectral models to the fluxs_mJy densities of pulsars
 """
 
+import functools
+import inspect
 import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -14,12 +19,105 @@ from jacobi import propagate
 from matplotlib.ticker import FormatStrFormatter
 
 from pulsar_spectra.catalogue import convert_cat_list_to_dict
+from pulsar_spectra.jit_models import jit_model
 from pulsar_spectra.load_data import DEFAULT_PLOTTING_CONFIG
-from pulsar_spectra.models import model_settings
+from pulsar_spectra.models import get_model, model_registry
 
 logger = logging.getLogger(__name__)
 
 
+class SpectralMinuit(Minuit):
+    """The iminuit Minuit class with an extra ``fit_stats`` dictionary that records information about the spectral fit,
+    such as the Akaike information criterion (``'aic'``), if the bandwidth correction was used (``'band_bool'``),
+    the largest bandwidth correction in flux density uncertainties (``'band_correction'``),
+    if the bandwidth corrected fit was skipped because the correction was small (``'band_skipped'``),
+    if the fit was in log space (``'log_space'``),
+    if the fit was stopped because it used its budget of calls or time (``'budget_exceeded'``),
+    the number of starts of a multi-start fit (``'n_starts'``), how many found a valid minimum (``'n_starts_valid'``)
+    and how many converged to the best minimum (``'n_starts_best'``),
+    the total number of model calls (``'nfcn'``) and how long the fit took in seconds (``'fit_time'``).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fit_stats = {}
+
+
+class FitBudgetExceeded(Exception):
+    """Raised when a fit has used all of its :py:class:`pulsar_spectra.spectral_fit.FitBudget`."""
+
+
+class FitBudget:
+    """A budget of cost function calls and wall-clock time that a fit (or several fits) can use.
+
+    Parameters
+    ----------
+    max_calls : `int`, optional
+        The maximum number of cost function calls. |br| Default: None, no limit.
+    max_time : `float`, optional
+        The maximum wall-clock time in seconds, starting from when the budget is made. |br| Default: None, no limit.
+    parent : :py:class:`pulsar_spectra.spectral_fit.FitBudget`, optional
+        A larger budget shared by several fits (e.g. all the model fits of a pulsar) that this budget also uses.
+        |br| Default: None.
+    """
+
+    def __init__(self, max_calls=None, max_time=None, parent=None):
+        self.max_calls = max_calls
+        self.max_time = max_time
+        self.parent = parent
+        self.calls = 0
+        self.start_time = time.perf_counter()
+        self.exceeded = False
+
+    def remaining_calls(self):
+        """The number of calls left in this budget and its parent, or None if there is no call limit."""
+        remaining = None if self.max_calls is None else self.max_calls - self.calls
+        if self.parent is not None:
+            parent_remaining = self.parent.remaining_calls()
+            if remaining is None or (parent_remaining is not None and parent_remaining < remaining):
+                remaining = parent_remaining
+        return remaining
+
+    def is_used(self):
+        """Check if all the calls or time of this budget (or its parent) have been used."""
+        remaining = self.remaining_calls()
+        if remaining is not None and remaining <= 0:
+            return True
+        if self.max_time is not None and time.perf_counter() - self.start_time > self.max_time:
+            return True
+        return self.parent is not None and self.parent.is_used()
+
+    def spend(self, calls=1):
+        """Record calls, raising :py:class:`pulsar_spectra.spectral_fit.FitBudgetExceeded` if the budget is used."""
+        if self.is_used():
+            self.exceeded = True
+            raise FitBudgetExceeded(f"Fit budget of {self.max_calls} calls and {self.max_time} s exceeded")
+        self.charge(calls)
+
+    def charge(self, calls):
+        """Record calls that were made elsewhere (e.g. in worker processes) in this budget and its parents."""
+        budget = self
+        while budget is not None:
+            budget.calls += calls
+            budget = budget.parent
+
+    def ncall(self, ncall):
+        """Limit the number of calls of a minimiser to the number of calls left in the budget."""
+        remaining = self.remaining_calls()
+        if remaining is None:
+            return ncall
+        return max(min(ncall, remaining), 1)
+
+    def loss(self, loss_function):
+        """Wrap a loss function of an iminuit cost function so every call is charged to this budget."""
+
+        def budget_loss_function(sq_resi):
+            self.spend()
+            return loss_function(sq_resi)
+
+        return budget_loss_function
+
+
 def robust_cost_function(f_y, y, sigma_y, k=1.345):
     """Robust cost function. The negative log-likelihood of a Gaussian likelihood with Huber loss.
 
@@ -86,6 +184,60 @@ def huber_loss_function(sq_resi, k=1.345):
         return rho
 
 
+def log_space_params(model_function):
+    """The parameters of a model that are fit as their logarithm in log-space fits, which are the amplitude (c)
+    and the frequencies (excluding the fixed reference frequency v0).
+
+    Parameters
+    ----------
+    model_function : `function`
+        The model function from :py:meth:`pulsar_spectra.models`.
+
+    Returns
+    -------
+    log_params : `tuple`
+        The names of the parameters that are fit as their logarithm.
+    """
+    parameters = list(inspect.signature(model_function).parameters)[1:]
+    return tuple(p for p in parameters if p == "c" or (p.startswith("v") and p != "v0"))
+
+
+@functools.lru_cache(maxsize=None)
+def log_flux_function(model_function, log_params=()):
+    """Make a function of the log10 flux density of a model for log-space fits.
+
+    Parameters
+    ----------
+    model_function : `function`
+        The model function (or bandwidth intergration correction function) from :py:meth:`pulsar_spectra.models`.
+    log_params : `tuple`, optional
+        The names of the parameters that are input as their log10, which are renamed to log10_<name>. |br| Default: ().
+
+    Returns
+    -------
+    log_model_function : `function`
+        The function in the form log_model_function(v, *params) with the parameter names used by iminuit.
+    """
+    signature = inspect.signature(model_function)
+    parameters = list(signature.parameters.values())
+    log_mask = [p.name in log_params for p in parameters[1:]]
+
+    def log_model_function(v, *params):
+        params = [10**param if log else param for param, log in zip(params, log_mask)]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Floor the models that reach zero (above a cut-off) so the cost stays finite
+            return np.log10(np.maximum(model_function(v, *params), np.finfo(np.float64).tiny))
+
+    # iminuit uses the signature to find the parameter names
+    log_model_function.__signature__ = signature.replace(
+        parameters=[parameters[0]]
+        + [p.replace(name=f"log10_{p.name}") if log else p for p, log in zip(parameters[1:], log_mask)]
+    )
+    log_model_function.__name__ = f"{model_function.__name__}_log_flux"
+    log_model_function.__doc__ = f"The log10 flux density of {model_function.__name__}."
+    return log_model_function
+
+
 def propagate_flux_n_err(freqs, model, iminuit_result):
     """Propagate the flux based on an input model and use the iminuit to calculate errors if possible.
 
@@ -319,8 +471,7 @@ def plot_fit(
     # Plot fit line
     if alternate_style:
         # Just use a simple label
-        model_dict = model_settings()
-        fit_info = model_dict[fit_info.split()[0]][1]
+        fit_info = get_model(fit_info.split()[0]).short_name
     if secondary_fit:
         ax.plot(
             fitted_freq,
@@ -383,38 +534,327 @@ def plot_fit(
         plt.close()
 
 
-def migrad_simplex_scan(m, mod_limits, model_name):
+def migrad_simplex_scan(m, mod_limits, model_name, budget=None, fallback=True):
     """Find the minimum of least_squares function using the in-built minimisation
     algorithms in iminuit. If migrad by itself fails, then run the simplex
     minimiser before migrad. If simplex fails, run a grid scan over parameter
     space before migrad. Systematically increase the number of calls until
     a valid minimum is found.
+
+    If a budget is given (and the budget's loss function is used by the cost function), the minimisers are stopped
+    once the budget is used, leaving the Minuit class at its last valid state.
+    If fallback is False, only migrad is used.
     """
     m.tol = 0.00001  # low tolerace improves likelihood of a sensible fit
     m.limits = mod_limits  # limits are primarily to assist the scan minimiser
     ncall = 10000  # Calls until we abandon the fit
-    m.migrad(ncall=ncall)
-    if m.valid:
-        logger.debug(f"Found for fit with {model_name} using migrad and {m.nfcn} calls.")
-    else:
-        m.simplex(ncall=ncall)
-        m.migrad(ncall=ncall)
+    if budget is None:
+        budget = FitBudget()
+    try:
+        m.migrad(ncall=budget.ncall(ncall))
         if m.valid:
-            logger.debug(f"Found for fit with {model_name} using simplex and {m.nfcn} calls.")
-        else:
-            m.scan(ncall=ncall)
-            m.migrad(ncall=ncall)
+            logger.debug(f"Found for fit with {model_name} using migrad and {m.nfcn} calls.")
+        elif fallback:
+            m.simplex(ncall=budget.ncall(ncall))
+            m.migrad(ncall=budget.ncall(ncall))
             if m.valid:
-                logger.debug(f"Found for fit with {model_name} using scan and {m.nfcn} calls.")
-    if not m.valid:
-        logger.warning(f"No valid minimum found for model {model_name} after {m.nfcn} calls.")
-
-    m.hesse()  # accurately computes uncertainties
+                logger.debug(f"Found for fit with {model_name} using simplex and {m.nfcn} calls.")
+            else:
+                m.scan(ncall=budget.ncall(ncall))
+                m.migrad(ncall=budget.ncall(ncall))
+                if m.valid:
+                    logger.debug(f"Found for fit with {model_name} using scan and {m.nfcn} calls.")
+        if not m.valid:
+            logger.warning(f"No valid minimum found for model {model_name} after {m.nfcn} calls.")
+
+        m.hesse()  # accurately computes uncertainties
+    except FitBudgetExceeded as err:
+        logger.warning(f"Stopping the {model_name} fit after {m.nfcn} calls: {err}")
     logger.debug(model_name)
     logger.debug(m)
     return m
 
 
+def minimise_least_squares(
+    x,
+    fluxs_Jy,
+    flux_errs_Jy,
+    model_function,
+    start_params,
+    mod_limits,
+    model_name,
+    log_space=False,
+    budget=None,
+    fallback=True,
+):
+    """Minimise the robust least squares cost of a model with :py:meth:`pulsar_spectra.spectral_fit.migrad_simplex_scan`.
+
+    In log space, the log10 flux densities are fit with uncertainties of flux_errs_Jy / (fluxs_Jy ln(10)), and the
+    amplitude and frequency parameters (see :py:meth:`pulsar_spectra.spectral_fit.log_space_params`) are fit as
+    their log10, which are better scaled for the minimiser. The uncertainties are then calculated with the same
+    log flux density cost in the model's own parameters (which is minimised again if the log-space fit failed),
+    so the returned values, limits and uncertainties are in the usual units.
+
+    Parameters
+    ----------
+    x : `numpy.ndarray` or `tuple`
+        The frequencies in Hz, or the (min, max) frequencies in Hz for the bandwidth intergration correction functions.
+    fluxs_Jy : `numpy.ndarray`
+        The flux densities in Jy.
+    flux_errs_Jy : `numpy.ndarray`
+        The flux density uncertainties in Jy.
+    model_function : `function`
+        The model function (or bandwidth intergration correction function) from :py:meth:`pulsar_spectra.models`.
+    start_params : `tuple`
+        The starting parameters, including the reference frequency v0.
+    mod_limits : `list` of `tuple`s
+        The (min, max) limits of each parameter, including the reference frequency.
+    model_name : `str`
+        The model name used in the log messages.
+    log_space : `boolean`, optional
+        Fit the log10 flux densities. |br| Default: False.
+    budget : :py:class:`pulsar_spectra.spectral_fit.FitBudget`, optional
+        Stop minimising once this budget of calls and time is used. |br| Default: None, no limit.
+    fallback : `boolean`, optional
+        Use the simplex and scan minimisers if migrad fails. |br| Default: True.
+
+    Returns
+    -------
+    m : :py:class:`pulsar_spectra.spectral_fit.SpectralMinuit`
+        The Minuit class after being fit.
+    nfcn : `int`
+        The total number of model calls.
+    """
+    if budget is None:
+        loss_function = huber_loss_function
+    else:
+        # Charge every call to the budget
+        loss_function = budget.loss(huber_loss_function)
+    if not log_space:
+        least_squares = LeastSquares(x, fluxs_Jy, flux_errs_Jy, model_function)
+        least_squares.loss = loss_function
+        m = SpectralMinuit(least_squares, *start_params)
+        m.fixed["v0"] = True  # fix the reference frequency
+        m = migrad_simplex_scan(m, mod_limits, model_name, budget=budget, fallback=fallback)
+        return m, m.nfcn
+
+    log_fluxs = np.log10(fluxs_Jy)
+    log_flux_errs = flux_errs_Jy / (fluxs_Jy * np.log(10))
+    # Fit the amplitude and frequencies as their log10
+    log_params = log_space_params(model_function)
+    log_mask = [p in log_params for p in list(inspect.signature(model_function).parameters)[1:]]
+    log_start_params = [np.log10(param) if log else param for param, log in zip(start_params, log_mask)]
+    log_mod_limits = []
+    for limit, log in zip(mod_limits, log_mask):
+        if log and limit is not None:
+            limit = tuple(None if lim is None or lim <= 0 else np.log10(lim) for lim in limit)
+        log_mod_limits.append(limit)
+    least_squares = LeastSquares(x, log_fluxs, log_flux_errs, log_flux_function(model_function, log_params))
+    least_squares.loss = loss_function
+    m_log = SpectralMinuit(least_squares, *log_start_params)
+    m_log.fixed["v0"] = True  # fix the reference frequency
+    m_log = migrad_simplex_scan(m_log, log_mod_limits, model_name + "_log_space", budget=budget, fallback=fallback)
+
+    # Polish the solution in the model's parameters to get their uncertainties
+    values = [10**value if log else value for value, log in zip(m_log.values, log_mask)]
+    least_squares = LeastSquares(x, log_fluxs, log_flux_errs, log_flux_function(model_function))
+    least_squares.loss = loss_function
+    m = SpectralMinuit(least_squares, *values)
+    m.fixed["v0"] = True  # fix the reference frequency
+    if m_log.valid:
+        # Already at the minimum so only the uncertainties are needed
+        m.tol = m_log.tol
+        m.limits = mod_limits
+        try:
+            m.hesse()
+        except FitBudgetExceeded as err:
+            logger.warning(f"Stopping the {model_name} fit after {m.nfcn} calls: {err}")
+    if not m.valid and (budget is None or not budget.exceeded):
+        m = migrad_simplex_scan(m, mod_limits, model_name, budget=budget, fallback=fallback)
+    return m, m_log.nfcn + m.nfcn
+
+
+def multi_start_params(model_function, start_params, mod_limits, n_starts, seed=0):
+    """Make a space-filling (Latin hypercube) design of start parameters within the parameter limits.
+
+    Only the parameters with a lower and upper limit are varied, and the frequency parameters are spread evenly
+    in log space. The other parameters (e.g. the amplitude and the reference frequency) keep their start value.
+
+    Parameters
+    ----------
+    model_function : `function`
+        The model function from :py:meth:`pulsar_spectra.models`.
+    start_params : `tuple`
+        The default starting parameters, including the reference frequency v0, which is the first start.
+    mod_limits : `list` of `tuple`s
+        The (min, max) limits of each parameter, including the reference frequency.
+    n_starts : `int`
+        The number of starts.
+    seed : `int`, optional
+        The seed of the random design. |br| Default: 0.
+
+    Returns
+    -------
+    starts : `list` of `tuple`s
+        The start parameters of each fit.
+    """
+    rng = np.random.default_rng(seed)
+    log_params = log_space_params(model_function)
+    parameters = list(inspect.signature(model_function).parameters)[1:]
+    starts = np.tile(np.array(start_params, dtype=float), (n_starts, 1))
+    for j, (parameter, limit) in enumerate(zip(parameters, mod_limits)):
+        if limit is None or limit[0] is None or limit[1] is None:
+            continue
+        lower, upper = float(limit[0]), float(limit[1])
+        # One start in each of n_starts equal bins, in a random order
+        design = (rng.permutation(n_starts) + rng.uniform(size=n_starts)) / n_starts
+        if parameter in log_params and lower > 0:
+            starts[:, j] = 10 ** (np.log10(lower) + design * (np.log10(upper) - np.log10(lower)))
+        else:
+            starts[:, j] = lower + design * (upper - lower)
+    starts[0] = start_params
+    return [tuple(start) for start in starts]
+
+
+def multi_start_worker(
+    model_name, x, fluxs_Jy, flux_errs_Jy, start_params, mod_limits, band_bool, use_jit, log_space, max_calls, max_time
+):
+    """Fit a model from one start of :py:meth:`pulsar_spectra.spectral_fit.multi_start_fit`.
+
+    The model is found by name and the results are plain python types, so this can be run in a worker process.
+
+    Returns
+    -------
+    values : `list`
+        The fit values.
+    fval : `float`
+        The minimised cost, which is infinite if the fit stopped before finding a minimum.
+    valid : `boolean`
+        If the fit found a valid minimum.
+    nfcn : `int`
+        The number of model calls.
+    """
+    model_spec = get_model(model_name)
+    model_function = model_spec.integrate_function if band_bool else model_spec.function
+    if use_jit:
+        model_function = jit_model(model_function)
+    m, nfcn = minimise_least_squares(
+        x,
+        fluxs_Jy,
+        flux_errs_Jy,
+        model_function,
+        start_params,
+        mod_limits,
+        model_name,
+        log_space=log_space,
+        budget=FitBudget(max_calls=max_calls, max_time=max_time),
+        # The other starts replace the simplex and scan fallbacks
+        fallback=False,
+    )
+    fval = np.inf if m.fmin is None else float(m.fmin.fval)
+    return [float(value) for value in m.values], fval, bool(m.valid), int(nfcn)
+
+
+def multi_start_fit(
+    model_name,
+    x,
+    fluxs_Jy,
+    flux_errs_Jy,
+    starts,
+    mod_limits,
+    band_bool=False,
+    use_jit=False,
+    log_space=False,
+    max_calls=None,
+    max_time=None,
+    n_workers=None,
+    executor=None,
+):
+    """Fit a model from several starts (in parallel worker processes) and find the best valid minimum.
+
+    Parameters
+    ----------
+    model_name : `str`
+        One of the model names from :py:meth:`pulsar_spectra.models.model_registry`.
+    x : `numpy.ndarray` or `tuple`
+        The frequencies in Hz, or the (min, max) frequencies in Hz if band_bool is True.
+    fluxs_Jy : `numpy.ndarray`
+        The flux densities in Jy.
+    flux_errs_Jy : `numpy.ndarray`
+        The flux density uncertainties in Jy.
+    starts : `list` of `tuple`s
+        The start parameters of each fit from :py:meth:`pulsar_spectra.spectral_fit.multi_start_params`.
+    mod_limits : `list` of `tuple`s
+        The (min, max) limits of each parameter, including the reference frequency.
+    band_bool : `boolean`, optional
+        Fit the model's bandwidth intergration correction function. |br| Default: False.
+    use_jit : `boolean`, optional
+        Use the numba compiled models if numba is installed. |br| Default: False.
+    log_space : `boolean`, optional
+        Fit the log10 flux densities. |br| Default: False.
+    max_calls : `int`, optional
+        The maximum number of cost function calls of each start. |br| Default: None, no limit.
+    max_time : `float`, optional
+        The maximum wall-clock time of each start in seconds. |br| Default: None, no limit.
+    n_workers : `int`, optional
+        The number of worker processes. If 1, the starts are fit one after another in this process.
+        |br| Default: None, will use the number of CPUs.
+    executor : `concurrent.futures.Executor`, optional
+        An executor to run the fits with, so the worker processes can be reused by several multi-start fits.
+        |br| Default: None, will make a process pool of n_workers.
+
+    Returns
+    -------
+    best_values : `tuple`
+        The values of the best valid minimum, or of the first start if no start found a valid minimum.
+    multi_start_stats : `dict`
+        The number of starts (``'n_starts'``), how many found a valid minimum (``'n_starts_valid'``),
+        how many converged to the best minimum (``'n_starts_best'``) and the total number of model calls (``'nfcn'``).
+    """
+    fit_args = [
+        (
+            model_name,
+            x,
+            fluxs_Jy,
+            flux_errs_Jy,
+            start,
+            mod_limits,
+            band_bool,
+            use_jit,
+            log_space,
+            max_calls,
+            max_time,
+        )
+        for start in starts
+    ]
+    if executor is not None:
+        results = list(executor.map(multi_start_worker, *zip(*fit_args)))
+    elif n_workers == 1:
+        results = [multi_start_worker(*args) for args in fit_args]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            results = list(pool.map(multi_start_worker, *zip(*fit_args)))
+
+    fvals = np.array([fval if valid else np.inf for _, fval, valid, _ in results])
+    n_valid = int(np.sum(np.isfinite(fvals)))
+    if n_valid == 0:
+        best_values = tuple(starts[0])
+        n_best = 0
+    else:
+        best_i = int(np.argmin(fvals))
+        best_values = tuple(results[best_i][0])
+        # Starts that reached the same cost have converged to the same minimum
+        n_best = int(np.sum(fvals - fvals[best_i] < 1e-3 * (1 + abs(fvals[best_i]))))
+    logger.debug(f"{n_best} of {len(starts)} {model_name} starts ({n_valid} valid) converged to the best minimum")
+    multi_start_stats = {
+        "n_starts": len(starts),
+        "n_starts_valid": n_valid,
+        "n_starts_best": n_best,
+        "nfcn": sum(nfcn for _, _, _, nfcn in results),
+    }
+    return best_values, multi_start_stats
+
+
 def iminuit_fit_spectral_model(
     freqs_MHz,
     bands_MHz,
@@ -433,6 +873,16 @@ def iminuit_fit_spectral_model(
     fit_range=None,
     ref_markers=None,
     plotting_config=DEFAULT_PLOTTING_CONFIG,
+    band_tolerance=None,
+    use_jit=False,
+    log_space=False,
+    max_calls=None,
+    max_time=None,
+    budget=None,
+    n_starts=1,
+    n_workers=None,
+    executor=None,
+    v0_MHz=None,
 ):
     """Fit pulsar spectra with iminuit.
 
@@ -447,14 +897,14 @@ def iminuit_fit_spectral_model(
     refs : `list`
         A list of the reference labels (in the format 'Author_year').
     model_name : `function`, optional
-        One of the model names from :py:meth:`pulsar_spectra.models.model_settings`.
+        One of the model names from :py:meth:`pulsar_spectra.models.model_registry`.
         Default: :py:meth:`pulsar_spectra.models.simple_power_law`.
     start_params : `tuple`, optional
         A tuple of the starting paramaters for each input to the model that iminuit will use as an initial estimate.
-        If none provided, will use the defaults from :py:meth:`pulsar_spectra.models.model_settings`.
+        If none provided, will use the defaults from :py:meth:`pulsar_spectra.models.model_registry`.
     mod_limits : `list` of `tuple`s, optional
         A list of tuples where each tuples is the minimum and maximum limits that will be applied to the model by iminuit.
-        If none provided, will use the defaults from :py:meth:`pulsar_spectra.models.model_settings`.
+        If none provided, will use the defaults from :py:meth:`pulsar_spectra.models.model_registry`.
     plot : `boolean`, optional
         If you want to plot the result of the fit. |br| Default: False.
     plot_error : `boolean`, optional
@@ -473,38 +923,76 @@ def iminuit_fit_spectral_model(
         Used to overwrite the data marker defaults. The key is the reference name and the tuple contains (color, marker, markersize). |br| Default: None.
     plotting_config : `string`, optional
         File path of plotting config file. |br| Default: configs/plotting_config.yaml
+    band_tolerance : `float`, optional
+        Skip the bandwidth corrected fit if the largest bandwidth correction at the solution of the first fit
+        is less than this many flux density uncertainties. |br| Default: None, will always do the bandwidth corrected fit.
+    use_jit : `boolean`, optional
+        Fit with the numba compiled models from :py:meth:`pulsar_spectra.jit_models.jit_model` if numba is installed.
+        If False, will use the NumPy models. |br| Default: False.
+    log_space : `boolean`, optional
+        Fit the log10 of the flux densities with log10 amplitude and frequency parameters,
+        see :py:meth:`pulsar_spectra.spectral_fit.minimise_least_squares`. The AIC is then of the log-space fit,
+        so it can only be compared to other log-space fits. |br| Default: False.
+    max_calls : `int`, optional
+        The maximum number of cost function calls of the fit (including the bandwidth corrected fit).
+        Once they are used, the fit is stopped and marked as ``m.fit_stats['budget_exceeded']``. |br| Default: None, no limit.
+    max_time : `float`, optional
+        The maximum wall-clock time of the fit in seconds. |br| Default: None, no limit.
+    budget : :py:class:`pulsar_spectra.spectral_fit.FitBudget`, optional
+        A budget shared with other fits, such as all the model fits of a pulsar. |br| Default: None.
+    n_starts : `int`, optional
+        If more than 1, fit the model from this many starts spread over the parameter limits
+        (see :py:meth:`pulsar_spectra.spectral_fit.multi_start_params`) in parallel and refine the best valid minimum.
+        The max_calls and max_time are then for each start. |br| Default: 1.
+    n_workers : `int`, optional
+        The number of worker processes of the multi-start fit. |br| Default: None, will use the number of CPUs.
+    executor : `concurrent.futures.Executor`, optional
+        An executor to run the multi-start fits with, so the worker processes can be reused. |br| Default: None.
+    v0_MHz : `float`, optional
+        The reference frequency in MHz, so fits of subsets of the data can be compared.
+        |br| Default: None, will use the logarithmic centre frequency of the data.
 
     Returns
     -------
     aic : `float`
         The Akaike information criterion of the fit.
-    m : `iminuit.Minuit`
-        The Minuit class after being fit in :py:meth:`pulsar_spectra.spectral_fit.iminuit_fit_spectral_model`.
+    m : :py:class:`pulsar_spectra.spectral_fit.SpectralMinuit`
+        The Minuit class after being fit, with the fit information recorded in ``m.fit_stats``.
     fit_info : `str`
         The string to label the fit with from :py:meth:`pulsar_spectra.spectral_fit.iminuit_fit_spectral_model`.
+    band_bool : `boolean`
+        If the bandwidth intergration correction was used in the fit.
     """
+    start_time = time.perf_counter()
     # Covert to SI (Hz and Jy)
-    v0_Hz = (
-        10 ** ((np.log10(min(freqs_MHz)) + np.log10(max(freqs_MHz))) / 2) * 1e6
-    )  # reference frequency is the logarithmic centre frequency
+    if v0_MHz is None:
+        v0_Hz = (
+            10 ** ((np.log10(min(freqs_MHz)) + np.log10(max(freqs_MHz))) / 2) * 1e6
+        )  # reference frequency is the logarithmic centre frequency
+    else:
+        v0_Hz = v0_MHz * 1e6
     freqs_Hz = np.array(freqs_MHz, dtype=np.float128) * 1e6
     bands_Hz = np.array(bands_MHz, dtype=np.float128) * 1e6
     fluxs_Jy = np.array(fluxs_mJy, dtype=np.float128) / 1e3
     flux_errs_Jy = np.array(flux_errs_mJy, dtype=np.float128) / 1e3
 
     # Load model settings
-    model_dict = model_settings()
-    model_function = model_dict[model_name][0]
-    model_function_integrate = model_dict[model_name][4]
+    model_spec = get_model(model_name)
+    model_function = model_spec.function
+    model_function_integrate = model_spec.integrate_function
+    if use_jit:
+        # Use the numba compiled models if numba is installed
+        model_function = jit_model(model_function)
+        model_function_integrate = jit_model(model_function_integrate)
 
     # Check for model dependent defaults
     if start_params is None:
-        start_params = model_dict[model_name][2]
+        start_params = model_spec.start_params
     if mod_limits is None:
-        mod_limits = model_dict[model_name][3]
-    # Add the reference frequency
-    start_params += (v0_Hz,)
-    mod_limits += [None]
+        mod_limits = model_spec.mod_limits
+    # Add the reference frequency (copying so the inputs and defaults are not altered)
+    start_params = tuple(start_params) + (v0_Hz,)
+    mod_limits = list(mod_limits) + [None]
 
     if (model_name == "high_frequency_cut_off_power_law" or model_name == "double_turn_over_spectrum") and mod_limits[
         0
@@ -523,13 +1011,51 @@ def iminuit_fit_spectral_model(
         logger.warn(f"Only {len(freqs_MHz)} supplied for {model_name} model fit. This is not enough so skipping")
         return 1e9, None, None, False
 
+    multi_start_stats = {"n_starts": 1, "n_starts_valid": None, "n_starts_best": None}
+    multi_start_nfcn = 0
+    band_start_params = None
+    if n_starts > 1:
+        # Start from the best minimum of several starts spread over the parameter limits,
+        # using the bandwidth corrected model if it will be used for the final fit
+        multi_band_bool = None not in bands_MHz
+        start_params, multi_start_stats = multi_start_fit(
+            model_name,
+            (freqs_Hz - bands_Hz / 2, freqs_Hz + bands_Hz / 2) if multi_band_bool else freqs_Hz,
+            fluxs_Jy,
+            flux_errs_Jy,
+            multi_start_params(model_spec.function, start_params, mod_limits, n_starts),
+            mod_limits,
+            band_bool=multi_band_bool,
+            use_jit=use_jit,
+            log_space=log_space,
+            max_calls=max_calls,
+            max_time=max_time,
+            n_workers=n_workers,
+            executor=executor,
+        )
+        multi_start_nfcn = multi_start_stats.pop("nfcn")
+        if multi_band_bool:
+            band_start_params = start_params
+        if budget is not None:
+            budget.charge(multi_start_nfcn)
+
     # Fit model
-    least_squares = LeastSquares(freqs_Hz, fluxs_Jy, flux_errs_Jy, model_function)
-    least_squares.loss = huber_loss_function
-    m = Minuit(least_squares, *start_params)
-    m.fixed["v0"] = True  # fix the reference frequency
-    m = migrad_simplex_scan(m, mod_limits, model_name)
+    fit_budget = FitBudget(max_calls=max_calls, max_time=max_time, parent=budget)
+    m, nfcn = minimise_least_squares(
+        freqs_Hz,
+        fluxs_Jy,
+        flux_errs_Jy,
+        model_function,
+        start_params,
+        mod_limits,
+        model_name,
+        log_space=log_space,
+        budget=fit_budget,
+    )
+    nfcn += multi_start_nfcn
 
+    band_correction = None
+    band_skipped = False
     if m.valid and (None not in bands_MHz):
         # Fit model with bandwidth intergration correction
         try:
@@ -540,24 +1066,57 @@ def iminuit_fit_spectral_model(
                 print(f"{float(freq):8.1f}{float(band):8.1f}{float(flux):12.4f}{float(flux_err):12.4f} {str(ref):20s}")
             return 1e9, None, None, False
         max_freqs_Hz = freqs_Hz + bands_Hz / 2
-        least_squares = LeastSquares((min_freqs_Hz, max_freqs_Hz), fluxs_Jy, flux_errs_Jy, model_function_integrate)
-        least_squares.loss = huber_loss_function
+        if band_tolerance is not None:
+            # Estimate the largest bandwidth correction (relative to the flux density uncertainty) at the first fit's
+            # solution, if it's small the bandwidth corrected fit will give the same result
+            band_correction = float(
+                np.max(
+                    np.abs(
+                        model_function_integrate((min_freqs_Hz, max_freqs_Hz), *m.values)
+                        - model_function(freqs_Hz, *m.values)
+                    )
+                    / flux_errs_Jy
+                )
+            )
+            band_skipped = band_correction < band_tolerance
+            logger.debug(f"Maximum bandwidth correction: {band_correction} flux density uncertainties")
+    if band_skipped:
+        logger.debug(f"Skipping the {model_name} bandwidth fit as the correction is below {band_tolerance}")
+        band_bool = False
+    elif m.valid and (None not in bands_MHz):
         # Set start params as results from first fit
         past_params = ()
         for param in m.values:
             past_params += (param,)
+        if band_start_params is not None:
+            # Use the best minimum of the multi-start fit instead
+            past_params = band_start_params
 
         logger.debug(f"bandwidth fit params: {past_params}")
-        m_band = Minuit(least_squares, *past_params)
-        m_band.fixed["v0"] = True  # fix the reference frequency
         try:
-            m_band = migrad_simplex_scan(m_band, mod_limits, model_name + "_log")
+            m_band, band_nfcn = minimise_least_squares(
+                (min_freqs_Hz, max_freqs_Hz),
+                fluxs_Jy,
+                flux_errs_Jy,
+                model_function_integrate,
+                past_params,
+                mod_limits,
+                model_name + "_log",
+                log_space=log_space,
+                budget=fit_budget,
+            )
         except ValueError as verr:
             logger.warning(f"{model_name}_log Value Error: {verr}")
             m_band = m
             band_bool = False
         else:
-            band_bool = True
+            nfcn += band_nfcn
+            if fit_budget.exceeded and not m_band.valid:
+                # Keep the fit without the bandwidth correction
+                m_band = m
+                band_bool = False
+            else:
+                band_bool = True
         m = m_band
     else:
         band_bool = False
@@ -577,13 +1136,32 @@ def iminuit_fit_spectral_model(
 
     # Calculate AIC
     if band_bool:
+        fitted_fluxs_Jy = model_function_integrate((min_freqs_Hz, max_freqs_Hz), *m.values)
+    else:
+        fitted_fluxs_Jy = model_function(freqs_Hz, *m.values)
+    if log_space:
         beta = robust_cost_function(
-            model_function_integrate((min_freqs_Hz, max_freqs_Hz), *m.values), fluxs_Jy, flux_errs_Jy
+            np.log10(np.maximum(fitted_fluxs_Jy, np.finfo(np.float64).tiny)),
+            np.log10(fluxs_Jy),
+            flux_errs_Jy / (fluxs_Jy * np.log(10)),
         )
     else:
-        beta = robust_cost_function(model_function(freqs_Hz, *m.values), fluxs_Jy, flux_errs_Jy)
+        beta = robust_cost_function(fitted_fluxs_Jy, fluxs_Jy, flux_errs_Jy)
     aic = 2 * beta + 2 * k + (2 * k * (k + 1)) / (len(freqs_Hz) - k - 1)
     fit_info.append(f"AIC: {aic:.1f}")
+    m.fit_stats.update(
+        {
+            "aic": float(aic),
+            "band_bool": band_bool,
+            "band_correction": band_correction,
+            "band_skipped": band_skipped,
+            "log_space": log_space,
+            "budget_exceeded": fit_budget.exceeded,
+            **multi_start_stats,
+            "nfcn": nfcn,
+            "fit_time": time.perf_counter() - start_time,
+        }
+    )
 
     fit_info = "\n".join(fit_info)
 
@@ -628,6 +1206,16 @@ def find_best_spectral_fit(
     fit_range=None,
     ref_markers=None,
     plotting_config=DEFAULT_PLOTTING_CONFIG,
+    band_tolerance=None,
+    use_jit=False,
+    log_space=False,
+    max_calls=None,
+    max_time=None,
+    pulsar_max_calls=None,
+    pulsar_max_time=None,
+    n_starts=1,
+    n_workers=None,
+    executor=None,
 ):
     """Fit pulsar spectra with iminuit.
 
@@ -663,6 +1251,33 @@ def find_best_spectral_fit(
         Used to overwrite the data marker defaults. The key is the reference name and the tuple contains (color, marker, markersize). |br| Default: None.
     plotting_config : `string`, optional
         File path of plotting config file. |br| Default: configs/plotting_config.yaml
+    band_tolerance : `float`, optional
+        Skip the bandwidth corrected fits if the largest bandwidth correction is less than this many
+        flux density uncertainties, see :py:meth:`pulsar_spectra.spectral_fit.iminuit_fit_spectral_model`.
+        |br| Default: None, will always do the bandwidth corrected fits.
+    use_jit : `boolean`, optional
+        Fit with the numba compiled models from :py:meth:`pulsar_spectra.jit_models.jit_model` if numba is installed.
+        If False, will use the NumPy models. |br| Default: False.
+    log_space : `boolean`, optional
+        Fit all the models in log space, see :py:meth:`pulsar_spectra.spectral_fit.iminuit_fit_spectral_model`.
+        |br| Default: False.
+    max_calls : `int`, optional
+        The maximum number of cost function calls of each model fit. |br| Default: None, no limit.
+    max_time : `float`, optional
+        The maximum wall-clock time of each model fit in seconds. |br| Default: None, no limit.
+    pulsar_max_calls : `int`, optional
+        The maximum number of cost function calls of all the model fits. |br| Default: None, no limit.
+    pulsar_max_time : `float`, optional
+        The maximum wall-clock time of all the model fits in seconds. Once a budget is used, the model fits are stopped
+        and the fits without a valid minimum are not compared. |br| Default: None, no limit.
+    n_starts : `int`, optional
+        The number of starts of each model fit, see :py:meth:`pulsar_spectra.spectral_fit.iminuit_fit_spectral_model`.
+        |br| Default: 1.
+    n_workers : `int`, optional
+        The number of worker processes used by the multi-start fits. |br| Default: None, will use the number of CPUs.
+    executor : `concurrent.futures.Executor`, optional
+        An executor to run the multi-start fits with, so the worker processes can be reused by several pulsars.
+        It is not shut down. |br| Default: None, will make a process pool of n_workers that is used for all the models.
 
     Returns
     -------
@@ -694,7 +1309,7 @@ def find_best_spectral_fit(
         )
 
     # Load model settings
-    model_dict = model_settings()
+    model_dict = model_registry()
 
     # Prepare plots and fitting frequencies
     if plot_compare:
@@ -709,55 +1324,79 @@ def find_best_spectral_fit(
     fit_infos = []
     model_i = []
     band_bools = []
-    # loop over models and fit
-    for i, model_name in enumerate(model_dict.keys()):
-        model_function = model_dict[model_name][0]
-        model_dict[model_name][-1]
-        aic, iminuit_result, fit_info, band_bool = iminuit_fit_spectral_model(
-            freqs_MHz,
-            bands_MHz,
-            fluxs_mJy,
-            flux_errs_mJy,
-            ref_all,
-            model_name=model_name,
-            plot=plot_all,
-            plot_error=plot_error,
-            save_name=f"{pulsar}_{model_name}_fit.png",
-            alternate_style=alternate_style,
-            axis=axis,
-            secondary_fit=secondary_fit,
-            ref_markers=ref_markers,
-            plotting_config=plotting_config,
-        )
-        logger.debug(f"{model_name} model fit gave AIC {aic}.")
-        if iminuit_result is not None:
-            aics.append(aic)
-            iminuit_results.append(iminuit_result)
-            fit_infos.append(fit_info)
-            model_i.append(i)
-            band_bools.append(band_bool)
-
-            # Add to comparison plot
-            if plot_compare:
-                # plot data
-                plot_fit(
-                    freqs_MHz,
-                    bands_MHz,
-                    fluxs_mJy,
-                    flux_errs_mJy,
-                    ref_all,
-                    model_function,
-                    iminuit_result,
-                    fit_info,
-                    plot_error=plot_error,
-                    alternate_style=alternate_style,
-                    axis=axs[i],
-                    secondary_fit=secondary_fit,
-                    fit_range=fit_range,
-                    ref_markers=ref_markers,
-                    plot_bands=band_bool,
-                    plotting_config=plotting_config,
+    pulsar_budget = FitBudget(max_calls=pulsar_max_calls, max_time=pulsar_max_time)
+    if executor is None and n_starts > 1 and n_workers != 1:
+        # Reuse the worker processes for all the models and shut them down even if a fit raises
+        pool = ProcessPoolExecutor(max_workers=n_workers)
+    else:
+        pool = nullcontext(executor)
+    with pool as executor:
+        # loop over models and fit
+        for i, model_name in enumerate(model_dict.keys()):
+            if pulsar_budget.is_used():
+                logger.warning(
+                    f"The fit budget of {pulsar} is used so not fitting {model_name} or the remaining models"
+                )
+                break
+            model_function = model_dict[model_name].function
+            aic, iminuit_result, fit_info, band_bool = iminuit_fit_spectral_model(
+                freqs_MHz,
+                bands_MHz,
+                fluxs_mJy,
+                flux_errs_mJy,
+                ref_all,
+                model_name=model_name,
+                plot=plot_all,
+                plot_error=plot_error,
+                save_name=f"{pulsar}_{model_name}_fit.png",
+                alternate_style=alternate_style,
+                axis=axis,
+                secondary_fit=secondary_fit,
+                ref_markers=ref_markers,
+                plotting_config=plotting_config,
+                band_tolerance=band_tolerance,
+                use_jit=use_jit,
+                log_space=log_space,
+                max_calls=max_calls,
+                max_time=max_time,
+                budget=pulsar_budget,
+                n_starts=n_starts,
+                n_workers=n_workers,
+                executor=executor,
+            )
+            logger.debug(f"{model_name} model fit gave AIC {aic}.")
+            if iminuit_result is not None and iminuit_result.fit_stats["budget_exceeded"] and not iminuit_result.valid:
+                logger.warning(
+                    f"The {model_name} fit of {pulsar} used its budget without finding a minimum so skipping"
                 )
+            elif iminuit_result is not None:
+                aics.append(aic)
+                iminuit_results.append(iminuit_result)
+                fit_infos.append(fit_info)
+                model_i.append(i)
+                band_bools.append(band_bool)
+
+                # Add to comparison plot
+                if plot_compare:
+                    # plot data
+                    plot_fit(
+                        freqs_MHz,
+                        bands_MHz,
+                        fluxs_mJy,
+                        flux_errs_mJy,
+                        ref_all,
+                        model_function,
+                        iminuit_result,
+                        fit_info,
+                        plot_error=plot_error,
+                        alternate_style=alternate_style,
+                        axis=axs[i],
+                        secondary_fit=secondary_fit,
+                        fit_range=fit_range,
+                        ref_markers=ref_markers,
+                        plot_bands=band_bool,
+                        plotting_config=plotting_config,
+                    )
 
     # Return best result
     if len(aics) == 0:
@@ -801,7 +1440,7 @@ def find_best_spectral_fit(
                 fluxs_mJy,
                 flux_errs_mJy,
                 ref_all,
-                model_dict[best_model_name][0],
+                model_dict[best_model_name].function,
                 iminuit_results[aici],
                 fit_infos[aici],
                 save_name=f"{pulsar}_{best_model_name}_fit.png",
@@ -817,6 +1456,181 @@ def find_best_spectral_fit(
         return best_model_name, iminuit_results[aici], fit_infos[aici], p_best, band_bools[aici]
 
 
+def jackknife_worker(freqs_MHz, bands_MHz, fluxs_mJy, flux_errs_mJy, refs, model_name, start_params, v0_MHz, log_space):
+    """Fit a model to the data without one reference for :py:meth:`pulsar_spectra.spectral_fit.reference_jackknife`.
+
+    The results are plain python types, so this can be run in a worker process.
+
+    Returns
+    -------
+    values : `list`
+        The fit values, or None if there was too little data to fit.
+    errors : `list`
+        The fit uncertainties.
+    aic : `float`
+        The Akaike information criterion of the fit.
+    valid : `boolean`
+        If the fit found a valid minimum.
+    band_bool : `boolean`
+        If the bandwidth intergration correction was used in the fit.
+    """
+    model_spec = get_model(model_name)
+    mod_limits = list(model_spec.mod_limits)
+    start_params = list(start_params)
+    for j, limit in enumerate(mod_limits):
+        if limit is None:
+            # Keep the warm start inside the cut off frequency limits of the remaining data
+            max_freq_Hz = max(freqs_MHz) * 1e6
+            mod_limits[j] = (max_freq_Hz, 10 * max_freq_Hz)
+            start_params[j] = min(max(start_params[j], mod_limits[j][0]), mod_limits[j][1])
+    aic, m, _, band_bool = iminuit_fit_spectral_model(
+        freqs_MHz,
+        bands_MHz,
+        fluxs_mJy,
+        flux_errs_mJy,
+        refs,
+        model_name=model_name,
+        start_params=start_params,
+        mod_limits=mod_limits,
+        log_space=log_space,
+        v0_MHz=v0_MHz,
+    )
+    if m is None:
+        return None, None, None, False, False
+    return [float(v) for v in m.values], [float(e) for e in m.errors], float(aic), bool(m.valid), band_bool
+
+
+def reference_jackknife(
+    freqs_MHz,
+    bands_MHz,
+    fluxs_mJy,
+    flux_errs_mJy,
+    refs,
+    model_name="simple_power_law",
+    iminuit_result=None,
+    n_workers=None,
+    executor=None,
+):
+    """Measure the influence of each reference on a spectral fit by refitting the model without it.
+
+    The fits without each reference are run in parallel worker processes, start from the fit of all the data and
+    use its reference frequency, so the parameter shifts are comparable.
+
+    Parameters
+    ----------
+    freqs_MHz : `list`
+        A list of the frequencies in MHz.
+    bands_MHz : `list`
+        A list of the bandwidths in MHz.
+    fluxs_mJy : `list`
+        A list of the flux density in mJy.
+    flux_errs_mJy : `list`
+        A list of the uncertainty of the flux density in mJy.
+    refs : `list`
+        A list of the reference labels (in the format 'Author_year').
+    model_name : `str`, optional
+        One of the model names from :py:meth:`pulsar_spectra.models.model_registry`. |br| Default: "simple_power_law".
+    iminuit_result : :py:class:`pulsar_spectra.spectral_fit.SpectralMinuit`, optional
+        The fit of all the data from :py:meth:`pulsar_spectra.spectral_fit.iminuit_fit_spectral_model`.
+        The refits use the same log_space option. |br| Default: None, will fit the model.
+    n_workers : `int`, optional
+        The number of worker processes. If 1, the references are refit one after another in this process.
+        |br| Default: None, will use the number of CPUs.
+    executor : `concurrent.futures.Executor`, optional
+        An executor to run the fits with, so the worker processes can be reused. |br| Default: None.
+
+    Returns
+    -------
+    jackknife_results : `dict`
+        None if the model could not be fit to all the data, otherwise the influence of each reference keyed by
+        the reference label, each a dictionary with the keys:
+
+        ``'n_data'`` : `int`
+            The number of the reference's measurements.
+        ``'values'`` : `list`
+            The fit values without the reference (including the fixed reference frequency v0).
+        ``'errors'`` : `list`
+            The fit uncertainties without the reference.
+        ``'shifts'`` : `list`
+            The change in each free parameter when the reference is removed.
+        ``'shifts_sigma'`` : `list`
+            The shifts divided by the uncertainties of the fit of all the data.
+        ``'aic'`` : `float`
+            The Akaike information criterion of the fit without the reference.
+        ``'delta_aic'`` : `float`
+            The change in the AIC when the reference is removed. Removing data always lowers the AIC,
+            so a reference that is inconsistent with the others stands out by lowering it by much more than its
+            number of measurements.
+        ``'valid'`` : `boolean`
+            If the fit without the reference found a valid minimum.
+        ``'band_bool'`` : `boolean`
+            If the bandwidth intergration correction was used in the fit without the reference.
+
+        The values of references that leave too little data to fit the model are None.
+    """
+    if iminuit_result is None:
+        _, iminuit_result, _, _ = iminuit_fit_spectral_model(
+            freqs_MHz, bands_MHz, fluxs_mJy, flux_errs_mJy, refs, model_name=model_name
+        )
+        if iminuit_result is None:
+            return None
+    full_values = np.array(iminuit_result.values, dtype=float)
+    full_errors = np.array(iminuit_result.errors, dtype=float)
+    full_aic = iminuit_result.fit_stats["aic"]
+    log_space = iminuit_result.fit_stats["log_space"]
+
+    # The data without each reference, keeping the order of the references
+    unique_refs = list(dict.fromkeys(refs))
+    n_ref_data = []
+    fit_args = []
+    for ref in unique_refs:
+        keep = [i for i, data_ref in enumerate(refs) if data_ref != ref]
+        n_ref_data.append(len(refs) - len(keep))
+        fit_args.append(
+            (
+                [freqs_MHz[i] for i in keep],
+                [bands_MHz[i] for i in keep],
+                [fluxs_mJy[i] for i in keep],
+                [flux_errs_mJy[i] for i in keep],
+                [refs[i] for i in keep],
+                model_name,
+                tuple(full_values[:-1]),
+                full_values[-1] / 1e6,
+                log_space,
+            )
+        )
+    if executor is not None:
+        results = list(executor.map(jackknife_worker, *zip(*fit_args)))
+    elif n_workers == 1:
+        results = [jackknife_worker(*args) for args in fit_args]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            results = list(pool.map(jackknife_worker, *zip(*fit_args)))
+
+    jackknife_results = {}
+    for ref, n_data, (values, errors, aic, valid, band_bool) in zip(unique_refs, n_ref_data, results):
+        if values is None:
+            shifts = shifts_sigma = delta_aic = None
+        else:
+            shifts = np.array(values[:-1]) - full_values[:-1]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                shifts_sigma = (shifts / full_errors[:-1]).tolist()
+            shifts = shifts.tolist()
+            delta_aic = aic - full_aic
+        jackknife_results[ref] = {
+            "n_data": n_data,
+            "values": values,
+            "errors": errors,
+            "shifts": shifts,
+            "shifts_sigma": shifts_sigma,
+            "aic": aic,
+            "delta_aic": delta_aic,
+            "valid": valid,
+            "band_bool": band_bool,
+        }
+    return jackknife_results
+
+
 def estimate_flux_density(
     est_freq,
     model_name,
@@ -848,8 +1662,7 @@ def estimate_flux_density(
     elif isinstance(est_freq, list):
         est_freq = np.array(est_freq)
 
-    model_dict = model_settings()
-    model = model_dict[model_name][0]
+    model = get_model(model_name).function
 
     fitted_flux, fitted_flux_err = propagate_flux_n_err(est_freq, model, iminuit_result)
 
@@ -857,3 +1670,154 @@ def estimate_flux_density(
         return fitted_flux[0], fitted_flux_err[0]
     else:
         return fitted_flux, fitted_flux_err
+
+
+def fit_result_to_dict(pulsar, model_name, iminuit_result):
+    """Convert a spectral fit into a dictionary of plain python types so it can be stored and used without the Minuit class.
+
+    Parameters
+    ----------
+    pulsar : `str`
+        The Jname of the pulsar that was fit.
+    model_name : `str`
+        The pulsar spectra model name from :py:meth:`pulsar_spectra.models`.
+    iminuit_result : `iminuit.Minuit`
+        The Minuit class after being fit in :py:meth:`pulsar_spectra.spectral_fit.iminuit_fit_spectral_model`.
+
+    Returns
+    -------
+    fit_result : `dict`
+        A dictionary with the keys:
+
+        ``'pulsar'`` : `str`
+            The pulsar's Jname.
+        ``'model'`` : `str`
+            The model name.
+        ``'parameters'`` : `list`
+            The parameter names (including the fixed reference frequency v0).
+        ``'values'`` : `list`
+            The fitted parameter values.
+        ``'errors'`` : `list`
+            The parameter uncertainties.
+        ``'covariance'`` : `list` of `list`
+            The covariance matrix of the parameters or None if the fit was not valid.
+
+        Any information in the ``fit_stats`` of a :py:class:`pulsar_spectra.spectral_fit.SpectralMinuit` (e.g. ``'aic'``) is also included.
+    """
+    if iminuit_result.valid and iminuit_result.covariance is not None:
+        covariance = np.array(iminuit_result.covariance, dtype=float).tolist()
+    else:
+        covariance = None
+    fit_result = {
+        "pulsar": pulsar,
+        "model": model_name,
+        "parameters": list(iminuit_result.parameters),
+        "values": [float(v) for v in iminuit_result.values],
+        "errors": [float(e) for e in iminuit_result.errors],
+        "covariance": covariance,
+    }
+    fit_result.update(getattr(iminuit_result, "fit_stats", {}))
+    return fit_result
+
+
+def propagate_fit_quantities_bulk(fit_results, group_quantity, shape=(), rel_step=1e-6):
+    """Calculate quantities of many stored spectral fits and propagate their uncertainties.
+
+    The fits are grouped by model and the quantities are calculated for the whole group at once.
+    The uncertainties are propagated with a central difference Jacobian and the covariance matrix of each fit.
+
+    Parameters
+    ----------
+    fit_results : `list` of `dict` or `pandas.DataFrame`
+        The stored fit results, each with at least the ``'model'``, ``'values'`` and ``'covariance'`` keys
+        (see :py:meth:`pulsar_spectra.spectral_fit.fit_result_to_dict`).
+    group_quantity : `function`
+        Called once for each model as ``group_quantity(model_function, params)``, where params are the fit values of
+        the group with the shape (nfits, nparams). It returns a function ``quantity(params, fits)`` that calculates the
+        quantities, with the shape (nfits, \\*shape), of the params of the fits with the indices fits in the group.
+    shape : `tuple`, optional
+        The shape of the quantities of each fit. |br| Default: (), a single quantity.
+    rel_step : `float`, optional
+        The relative step size used to compute the Jacobian by central differences. |br| Default: 1e-6.
+
+    Returns
+    -------
+    values : `numpy.ndarray`
+        The quantities with the shape (len(fit_results), \\*shape). NaN for the fits without a model.
+    errors : `numpy.ndarray`
+        The uncertainties of the quantities with the same shape as values. NaN for the fits without a covariance matrix.
+    """
+    if hasattr(fit_results, "to_dict"):
+        # Convert pandas DataFrames to a list of records
+        fit_results = fit_results.to_dict("records")
+    values = np.full((len(fit_results), *shape), np.nan)
+    errors = np.full((len(fit_results), *shape), np.nan)
+
+    # Group the fit results by model
+    model_rows = {}
+    for row_i, fit_result in enumerate(fit_results):
+        if fit_result["model"] is not None:
+            model_rows.setdefault(fit_result["model"], []).append(row_i)
+
+    for model_name, rows in model_rows.items():
+        params = np.array([fit_results[row_i]["values"] for row_i in rows], dtype=float)
+        quantity = group_quantity(get_model(model_name).function, params)
+        values[rows] = quantity(params, np.arange(len(rows)))
+
+        # Only propagate errors for the fits with a covariance matrix
+        has_cov = [i for i, row_i in enumerate(rows) if fit_results[row_i]["covariance"] is not None]
+        if len(has_cov) == 0:
+            continue
+        cov = np.array([fit_results[rows[i]]["covariance"] for i in has_cov], dtype=float)
+        cov_params = params[has_cov]
+
+        # Jacobian with the shape (nfits, *shape, nparams)
+        jac = np.zeros((len(has_cov), *shape, params.shape[1]))
+        for j in range(params.shape[1]):
+            if not np.any(cov[:, j, j]):
+                # Fixed parameter (e.g. v0) so no contribution to the error
+                continue
+            step = rel_step * np.maximum(np.abs(cov_params[:, j]), 1e-12)
+            params_up = cov_params.copy()
+            params_down = cov_params.copy()
+            params_up[:, j] += step
+            params_down[:, j] -= step
+            diff = quantity(params_up, has_cov) - quantity(params_down, has_cov)
+            jac[..., j] = diff / (2 * step.reshape(-1, *[1] * len(shape)))
+        variance = np.einsum("n...i,nij,n...j->n...", jac, cov, jac)
+        errors[[rows[i] for i in has_cov]] = np.sqrt(np.abs(variance))
+    return values, errors
+
+
+def estimate_flux_density_bulk(est_freqs, fit_results, rel_step=1e-6):
+    """Estimate the flux density of many pulsars at many frequencies using previously stored spectral fits.
+
+    The fits are grouped by model and each group is evaluated with a single broadcasted call of the model function.
+    The uncertainties are propagated with a finite difference Jacobian that is also computed for the whole group at once,
+    see :py:meth:`pulsar_spectra.spectral_fit.propagate_fit_quantities_bulk`.
+
+    Parameters
+    ----------
+    est_freqs : `float` or `list`
+        A single or list of frequencies to estimate flux at (in MHz).
+    fit_results : `list` of `dict` or `pandas.DataFrame`
+        The stored fit results, each with at least the ``'model'``, ``'values'`` and ``'covariance'`` keys
+        (see :py:meth:`pulsar_spectra.spectral_fit.fit_result_to_dict`).
+    rel_step : `float`, optional
+        The relative step size used to compute the Jacobian by central differences. |br| Default: 1e-6.
+
+    Returns
+    -------
+    fitted_flux : `numpy.ndarray`
+        The estimated flux densities (in mJy) with the shape (len(fit_results), len(est_freqs)).
+    fitted_flux_err : `numpy.ndarray`
+        The estimated flux density errors (in mJy) with the same shape as fitted_flux.
+        The errors are NaN for fits without a covariance matrix.
+    """
+    est_freqs_Hz = np.atleast_1d(np.array(est_freqs, dtype=float)) * 1e6
+
+    def group_flux(model, params):
+        # Parameters with the shape (nparams, nfits, 1) so they broadcast against the frequencies
+        return lambda fit_params, fits: model(est_freqs_Hz, *fit_params.T[:, :, np.newaxis]) * 1e3
+
+    return propagate_fit_quantities_bulk(fit_results, group_flux, shape=est_freqs_Hz.shape, rel_step=rel_step)
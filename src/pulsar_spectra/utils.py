@@ -0,0 +1,48 @@
+"""
+Functions shared by several modules, such as the cached ATNF pulsar catalogue query and sky position conversions
+"""
+
+import functools
+
+import numpy as np
+from psrqpy import QueryATNF
+
+from pulsar_spectra.catalogue import ATNF_VER
+
+
+@functools.lru_cache(maxsize=None)
+def get_atnf_table(params=("P0", "BSURF", "B_LC")):
+    """Query the ATNF pulsar catalogue for some parameters of all the pulsars once and cache the table.
+
+    Parameters
+    ----------
+    params : `tuple`, optional
+        The ATNF parameters to query. |br| Default: ("P0", "BSURF", "B_LC").
+
+    Returns
+    -------
+    query : `pandas.DataFrame`
+        The psrqpy.QueryATNF table with the ``PSRJ`` and ``PSRB`` names and a column for each parameter.
+        The table is shared by all callers so should not be modified.
+    """
+    return QueryATNF(params=["PSRJ", "PSRB"] + list(params), version=ATNF_VER).pandas
+
+
+def unit_vectors(ra_deg, dec_deg):
+    """Convert right ascensions and declinations to unit vectors.
+
+    Parameters
+    ----------
+    ra_deg : `float` or `numpy.ndarray`
+        The right ascensions in degrees.
+    dec_deg : `float` or `numpy.ndarray`
+        The declinations in degrees.
+
+    Returns
+    -------
+    vectors : `numpy.ndarray`
+        The unit vectors with the shape (n, 3), or (3,) for a single position.
+    """
+    ra = np.radians(ra_deg)
+    dec = np.radians(dec_deg)
+    return np.stack([np.cos(dec) * np.cos(ra), np.cos(dec) * np.sin(ra), np.sin(dec)], axis=-1)
@@ -0,0 +1,136 @@
+#! /usr/bin/env python
+"""
+Tests the analysis.py script
+"""
+
+from math import pi
+
+import numpy as np
+import pandas as pd
+
+from pulsar_spectra.analysis import (
+    calc_derived_quantities_bulk,
+    calc_high_frequency_cutoff_emission_height_bulk,
+    calc_log_parabolic_spectrum_max_freq,
+    peak_frequency,
+)
+from pulsar_spectra.models import (
+    ModelSpec,
+    broken_power_law,
+    double_turn_over_spectrum,
+    high_frequency_cut_off_power_law,
+    log_parabolic_spectrum,
+    low_frequency_turn_over_power_law,
+    register_model,
+    simple_power_law,
+    unregister_model,
+)
+
+
+def test_calc_high_frequency_cutoff_emission_height_bulk():
+    """Tests the bulk emission heights use the parameters of each pulsar."""
+    query = pd.DataFrame(
+        {
+            "PSRJ": ["J0034-0721", "J0437-4715", "J1645-0317"],
+            "PSRB": ["B0031-07", np.nan, "B1642-03"],
+            "P0": [0.943, 0.00576, 0.388],
+            "BSURF": [6.3e11, 5.8e8, 8.4e11],
+            "B_LC": [7.0, 2.8e4, 39.0],
+        }
+    )
+    psrnames = ["J1645-0317", "B0031-07", "J0437-4715", "J9999+9999"]
+    v_c = np.array([2e9, 1e9, 5e9, 1e9])
+    u_v_c = np.array([2e8, 1e8, 5e8, 1e8])
+    B_pc, u_B_pc, B_surf, B_lc, r_lc, z_e, u_z_e, z_percent, u_z_percent = (
+        calc_high_frequency_cutoff_emission_height_bulk(psrnames, v_c, u_v_c, query=query)
+    )
+    np.testing.assert_array_equal(B_surf[:3], [8.4e11, 6.3e11, 5.8e8])
+    np.testing.assert_array_equal(B_lc[:3], [39.0, 7.0, 2.8e4])
+    # The first pulsar calculated by hand
+    c_B = 9.1094e-28 * 2.99792458e10 / (pi * 4.8032e-10)
+    np.testing.assert_allclose(B_pc[0], c_B * 0.388 * 2e9**2)
+    np.testing.assert_allclose(r_lc[0], 4.77e4 * 0.388)
+    np.testing.assert_allclose(z_e[0], 12 * (c_B * 0.388 * 2e9**2 / 8.4e11) ** (-1 / 3))
+    np.testing.assert_allclose(z_percent, z_e / r_lc * 100)
+    np.testing.assert_allclose(u_z_percent, u_z_e / r_lc * 100)
+    # Pulsars that aren't in the catalogue have no results
+    for column in [B_pc, u_B_pc, B_surf, B_lc, r_lc, z_e, u_z_e, z_percent, u_z_percent]:
+        assert len(column) == 4
+        assert np.all(np.isfinite(column[:3])) and np.isnan(column[3])
+
+
+def test_peak_frequency():
+    """Tests the peak frequencies of models with a known peak."""
+    values = np.array([[1e8, -1.6, 1.0, 1.0, 5e8], [3e8, -2.0, 1.0, 0.5, 5e8]])
+    np.testing.assert_allclose(
+        peak_frequency(low_frequency_turn_over_power_law, values, (1e7, 1e10)), values[:, 0], rtol=1e-8
+    )
+    # A peak at the break
+    values = np.array([[2e8, 0.5, -2.0, 1.0, 5e8]])
+    np.testing.assert_allclose(peak_frequency(broken_power_law, values, (1e7, 1e10)), [2e8], rtol=1e-6)
+    # The peak of a rising power law with a high frequency cut off is at a vc / (a + 1)
+    values = np.array([[3e9, 0.5, 1.0, 5e8]])
+    np.testing.assert_allclose(peak_frequency(high_frequency_cut_off_power_law, values, (1e7, 1e10)), [1e9], rtol=1e-8)
+    # A power law has no peak inside the frequency range
+    assert np.all(np.isnan(peak_frequency(simple_power_law, np.array([[-1.6, 1.0, 5e8]]), (1e7, 1e10))))
+
+
+def test_calc_derived_quantities_bulk():
+    """Tests the derived quantities and their uncertainties of several models."""
+    lps_cov = [[0.01, 0.002, 0.0, 0.0], [0.002, 0.04, 0.0, 0.0], [0.0, 0.0, 0.01, 0.0], [0.0, 0.0, 0.0, 0.0]]
+    dto_cov = np.diag([4e16, 1e14, 0.01, 0.01, 0.01, 0.0]).tolist()
+    fit_results = [
+        {"model": "log_parabolic_spectrum", "values": [-0.3, -1.0, 0.2, 5e8], "covariance": lps_cov},
+        {"model": "simple_power_law", "values": [-1.6, 1.0, 5e8], "covariance": None},
+        {"model": "low_frequency_turn_over_power_law", "values": [1e8, -1.6, 1.0, 1.0, 5e8], "covariance": None},
+        {"model": "double_turn_over_spectrum", "values": [2e9, 1e8, -1.6, 1.0, 1.0, 5e8], "covariance": dto_cov},
+        {"model": None},
+    ]
+    register_model(
+        ModelSpec("log_parabolic_spectrum", log_parabolic_spectrum, "lps", (-1.0, -1.0, 1.0), ((-5, 2), (-5, 2), None))
+    )
+    try:
+        derived = calc_derived_quantities_bulk(pd.DataFrame(fit_results))
+    finally:
+        unregister_model("log_parabolic_spectrum")
+    for column in derived.values():
+        assert len(column) == len(fit_results)
+        assert np.isnan(column[4])
+
+    # Log parabolic spectrum
+    v_peak, u_v_peak = calc_log_parabolic_spectrum_max_freq(-0.3, -1.0, 5e8, 0.1, 0.2, 0.002)
+    np.testing.assert_allclose(derived["v_peak"][0], v_peak, rtol=1e-8)
+    np.testing.assert_allclose(derived["u_v_peak"][0], u_v_peak, rtol=1e-4)
+    np.testing.assert_allclose(derived["S_peak"][0], 10 ** (-(1.0**2) / (4 * -0.3) + 0.2) * 1e3, rtol=1e-8)
+    np.testing.assert_allclose(derived["curvature"][0], -0.6, rtol=1e-6)
+    np.testing.assert_allclose(derived["u_curvature"][0], 0.2, rtol=1e-4)
+
+    # Power law
+    assert np.isnan(derived["v_peak"][1]) and np.isnan(derived["u_curvature"][1])
+    np.testing.assert_allclose(derived["curvature"][1], 0, atol=1e-6)
+
+    # Low frequency turn over
+    np.testing.assert_allclose(derived["v_peak"][2], 1e8, rtol=1e-8)
+    np.testing.assert_allclose(
+        derived["S_peak"][2], low_frequency_turn_over_power_law(1e8, 1e8, -1.6, 1.0, 1.0, 5e8) * 1e3, rtol=1e-8
+    )
+    assert np.isnan(derived["break_ratio"][2])
+
+    # Double turn over spectrum
+    v = np.logspace(7, 10, 100001)
+    v_max = v[np.argmax(double_turn_over_spectrum(v, 2e9, 1e8, -1.6, 1.0, 1.0, 5e8))]
+    np.testing.assert_allclose(derived["v_peak"][3], v_max, rtol=1e-4)
+    assert derived["u_v_peak"][3] > 0
+    np.testing.assert_allclose(derived["break_ratio"][3], 20)
+    np.testing.assert_allclose(derived["u_break_ratio"][3], 20 * np.sqrt(0.1**2 + 0.1**2), rtol=1e-4)
+
+
+if __name__ == "__main__":
+    """
+    Tests the relevant functions in analysis.py
+    """
+    # introspect and run all the functions starting with 'test'
+    for f in dir():
+        if f.startswith("test"):
+            print(f)
+            globals()[f]()
@@ -0,0 +1,121 @@
+#! /usr/bin/env python
+"""
+Tests the batch_fit.py script
+"""
+
+import numpy as np
+
+from pulsar_spectra.batch_fit import (
+    batch_find_best_spectral_fit,
+    batch_fit_spectral_model,
+    bootstrap_spectral_fit,
+    stack_pulsar_data,
+)
+from pulsar_spectra.spectral_fit import iminuit_fit_spectral_model
+
+
+def make_cat_list():
+    """Make a catalogue of simulated pulsars with and without bandwidths."""
+    rng = np.random.default_rng(42)
+    cat_list = {}
+    for i in range(6):
+        freqs = list(np.logspace(np.log10(80 + 10 * i), np.log10(3000), 8 + i))
+        fluxs = 300.0 * (np.array(freqs) / 400.0) ** (-1.2 - 0.2 * i)
+        flux_errs = 0.1 * fluxs
+        fluxs = fluxs + rng.normal(0, flux_errs)
+        bands = [0.1 * freq for freq in freqs] if i % 2 else [None] * len(freqs)
+        cat_list[f"J000{i}+0000"] = [freqs, bands, list(fluxs), list(flux_errs), ["test_ref"] * len(freqs)]
+    # Too few points for a fit
+    cat_list["J0010+0000"] = [[100.0, 200.0], [None, None], [10.0, 5.0], [1.0, 0.5], ["test_ref"] * 2]
+    return cat_list
+
+
+def test_stack_pulsar_data():
+    """Tests the padding of the stacked data."""
+    cat_list = make_cat_list()
+    pulsars = ["J0010+0000", "J0001+0000"]
+    freqs_Hz, bands_Hz, fluxs_Jy, flux_errs_Jy, mask = stack_pulsar_data(cat_list, pulsars)
+    assert freqs_Hz.shape == (2, 9)
+    assert mask.sum(axis=1).tolist() == [2, 9]
+    assert np.all(np.isnan(bands_Hz[0]))
+    np.testing.assert_allclose(freqs_Hz[1], np.array(cat_list["J0001+0000"][0]) * 1e6)
+    np.testing.assert_allclose(flux_errs_Jy[1], np.array(cat_list["J0001+0000"][3]) / 1e3)
+
+
+def test_batch_fit_spectral_model():
+    """Tests the batch fits match the iminuit fits."""
+    cat_list = make_cat_list()
+    for model_name in ["simple_power_law", "high_frequency_cut_off_power_law"]:
+        fit_results = batch_fit_spectral_model(cat_list, model_name=model_name, fallback=False)
+        assert "J0010+0000" not in fit_results
+        for pulsar, fit_result in fit_results.items():
+            assert fit_result["converged"]
+            assert fit_result["engine"] == "lm"
+            aic, m, _, band_bool = iminuit_fit_spectral_model(*cat_list[pulsar], model_name=model_name)
+            assert fit_result["band_bool"] == band_bool
+            assert fit_result["parameters"] == list(m.parameters)
+            np.testing.assert_allclose(fit_result["aic"], aic, rtol=1e-6, atol=1e-6, err_msg=pulsar)
+            np.testing.assert_allclose(fit_result["values"], np.array(m.values), rtol=1e-3, err_msg=pulsar)
+            # The cut off frequency of a power law is on its limit, so its error is not well defined
+            if model_name == "simple_power_law":
+                np.testing.assert_allclose(
+                    fit_result["errors"][:-1], np.array(m.errors)[:-1], rtol=5e-2, err_msg=pulsar
+                )
+
+
+def test_batch_fit_fallback():
+    """Tests the fits that don't converge are refit with iminuit."""
+    cat_list = make_cat_list()
+    fit_results = batch_fit_spectral_model(cat_list, max_iter=1, fallback=False)
+    assert not any(fit_result["converged"] for fit_result in fit_results.values())
+    fit_results = batch_fit_spectral_model(cat_list, max_iter=1)
+    for fit_result in fit_results.values():
+        assert fit_result["converged"]
+        assert fit_result["engine"] == "iminuit"
+
+
+def test_batch_find_best_spectral_fit():
+    """Tests the best batch fits are simple power laws for the simulated power law spectra."""
+    cat_list = make_cat_list()
+    best_fits = batch_find_best_spectral_fit(cat_list, pulsars=["J0004+0000", "J0005+0000"])
+    assert sorted(best_fits) == ["J0004+0000", "J0005+0000"]
+    for best_fit in best_fits.values():
+        assert best_fit["model"] == "simple_power_law"
+        assert 0 < best_fit["p_best"] <= 1
+
+
+def test_bootstrap_spectral_fit():
+    """Tests the bootstrap intervals of a simulated power law are similar to the iminuit uncertainties."""
+    rng = np.random.default_rng(1)
+    freqs = list(np.logspace(np.log10(100), np.log10(3000), 40))
+    flux_errs = list(0.1 * 300.0 * (np.array(freqs) / 400.0) ** -1.6)
+    fluxs = list(300.0 * (np.array(freqs) / 400.0) ** -1.6 + rng.normal(0, flux_errs))
+    bands = [None] * len(freqs)
+    refs = [f"ref_{i % 8}" for i in range(len(freqs))]
+    _, m, _, _ = iminuit_fit_spectral_model(freqs, bands, fluxs, flux_errs, refs)
+    for per_reference in (False, True):
+        bootstrap_result = bootstrap_spectral_fit(
+            freqs, bands, fluxs, flux_errs, refs, iminuit_result=m, n_boot=500, per_reference=per_reference, seed=0
+        )
+        assert bootstrap_result["parameters"] == list(m.parameters)
+        assert bootstrap_result["n_converged"] > 490
+        assert sorted(bootstrap_result["intervals"]) == ["a", "c", "peak_frequency"]
+        assert np.all(np.isnan(bootstrap_result["intervals"]["peak_frequency"]))
+        for j, parameter in enumerate(["a", "c"]):
+            low, median, high = bootstrap_result["intervals"][parameter]
+            assert low < m.values[j] < high
+            assert len(bootstrap_result["samples"][parameter]) == bootstrap_result["n_converged"]
+            if not per_reference:
+                # The Huber loss is half the chi-squared so the iminuit uncertainties are sqrt(2) larger
+                np.testing.assert_allclose((high - low) / 2, m.errors[j] / np.sqrt(2), rtol=0.3)
+
+
+if __name__ == "__main__":
+    """
+    Tests the relevant functions in batch_fit.py
+    """
+    # introspect and run all the functions starting with 'test'
+    for f in dir():
+        if f.startswith("test"):
+            print(f)
+            globals()[f]()
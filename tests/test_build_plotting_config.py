@@ -0,0 +1,39 @@
+#! /usr/bin/env python
+"""
+Tests the build_plotting_config.py script
+"""
+
+import pandas as pd
+import psrqpy
+
+from pulsar_spectra.catalogue import ATNF_VER, collect_catalogue_fluxes
+from pulsar_spectra.scripts.build_plotting_config import get_pulsar_refs
+
+PSRS = ["J0820-1350", "J0837+0610", "J1453-6413", "J1456-6843", "J1645-0317", "J2018+2839"]
+
+
+def test_get_pulsar_refs_no_atnf():
+    """Tests the catalogue paper references match the ones collected from the catalogue."""
+    cat_dict = collect_catalogue_fluxes(query=pd.DataFrame({"PSRJ": PSRS}), use_atnf=False)
+    pulsar_refs = get_pulsar_refs(PSRS, use_atnf=False)
+    for psr in PSRS:
+        assert sorted(set(pulsar_refs[psr])) == sorted(set(cat_dict[psr][4])), psr
+
+
+def test_get_pulsar_refs():
+    """Tests the references, including the ATNF references that are not redundant, match the collected ones."""
+    cat_dict = collect_catalogue_fluxes(query=psrqpy.QueryATNF(version=ATNF_VER, psrs=PSRS).pandas)
+    pulsar_refs = get_pulsar_refs(PSRS)
+    for psr in PSRS:
+        assert sorted(set(pulsar_refs[psr])) == sorted(set(cat_dict[psr][4])), psr
+
+
+if __name__ == "__main__":
+    """
+    Tests the relevant functions in build_plotting_config.py
+    """
+    # introspect and run all the functions starting with 'test'
+    for f in dir():
+        if f.startswith("test"):
+            print(f)
+            globals()[f]()
@@ -15,9 +15,11 @@ from pulsar_spectra.catalogue import (
     CAT_DIR,
     CAT_YAMLS,
     all_flux_from_atnf,
+    catalogue_summary,
     collect_catalogue_fluxes,
     convert_atnf_ref,
     get_atnf_references,
+    get_reference_index,
 )
 
 logger = logging.getLogger(__name__)
@@ -322,6 +324,40 @@ def todo_test_for_duplicate_data():
             # assert len(duplicates) == nexceptions
 
 
+def test_catalogue_summary():
+    """Tests the summary of the catalogue of a few pulsars groups the ATNF measurements into a single row."""
+    query = psrqpy.QueryATNF(version=ATNF_VER, psrs=["J0034-0721", "J1453-6413", "J2145-0750"]).pandas
+    cat_list = collect_catalogue_fluxes(query=query)
+    summary = catalogue_summary(cat_list)
+    assert summary.index[0] == "ATNF"
+    assert not any(ref.endswith("_ATNF") for ref in summary.index)
+    for ref in summary.index:
+        if ref == "ATNF":
+            counts = {jname: sum(r.endswith("_ATNF") for r in cat_list[jname][4]) for jname in cat_list.keys()}
+        else:
+            counts = {jname: cat_list[jname][4].count(ref) for jname in cat_list.keys()}
+        assert summary.loc[ref, "n_points"] == sum(counts.values())
+        assert summary.loc[ref, "n_pulsars"] == sum(count > 0 for count in counts.values())
+        assert summary.loc[ref, "min_freq_MHz"] <= summary.loc[ref, "max_freq_MHz"]
+    assert summary.loc["ATNF", "ads"] is None
+    assert summary.loc["Xue_2017", "ads"] == ADS_REF["Xue_2017"]
+
+
+def test_get_reference_index():
+    """Tests the reference index matches the pulsars with measurements in the loaded catalogue yaml files."""
+    expected_index = {}
+    for cat_file in sorted(CAT_YAMLS):
+        cat_label = os.path.basename(cat_file).split(".")[0]
+        with open(cat_file, "r") as stream:
+            cat_dict = yaml.safe_load(stream)
+        for jname in cat_dict.keys():
+            if jname != "Paper Metadata" and len(cat_dict[jname]["Frequency MHz"]) > 0:
+                expected_index.setdefault(jname, []).append(cat_label)
+    assert get_reference_index() == expected_index
+    # Pulsars listed without any measurements are not indexed
+    assert "Jankowski_2018" not in get_reference_index()["J0737-3039B"]
+
+
 if __name__ == "__main__":
     """
     Tests the relevant functions in catalogue.py
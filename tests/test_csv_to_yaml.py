@@ -0,0 +1,102 @@
+#! /usr/bin/env python
+"""
+Tests the csv_to_yaml.py script
+"""
+
+import os
+
+import pandas as pd
+import yaml
+
+from pulsar_spectra.names import PulsarNameIndex
+from pulsar_spectra.scripts.csv_to_yaml import bulk_convert_csv_to_yaml, convert_csv_to_yaml
+
+QUERY = pd.DataFrame(
+    {
+        "PSRJ": ["J0040+5716", "J0048+3412", "J0055+5117"],
+        "PSRB": ["B0037+56", "B0045+33", None],
+        "NAME": ["B0037+56", "B0045+33", "J0055+5117"],
+    }
+)
+
+
+def test_convert_csv_to_yaml(tmp_path):
+    """Tests the valid rows are converted and the invalid rows are rejected."""
+    csv_location = os.path.join(tmp_path, "Test_2024.csv")
+    with open(csv_location, "w") as csv_file:
+        csv_file.write(
+            "Pulsar Jname,Frequency (MHz),Bandwidth (MHz),Flux Density (mJy),Flux Density error (mJy)\n"
+            "B0037+56,390,20,3.5,0.5\n"
+            "B0045+33,390,20,4.5\n"
+            "B0037+56,1400,100,1.5,0.2\n"
+            "B0052+51,390,20,3.6,0.5\n"
+            "J0055−5117,390,20,3.6,0.5\n"
+            "J0055+5117,390,20,-3.6,0.5\n"
+            "J0055+5117,390,20,abc,0.5\n"
+            "J0055+5117,390\n"
+        )
+    rejected, unknown = convert_csv_to_yaml(
+        csv_location,
+        "Test_2024",
+        "Single-epoch",
+        "Beamforming",
+        name_index=PulsarNameIndex(QUERY, alias_file=None),
+        output_dir=tmp_path,
+    )
+    with open(os.path.join(tmp_path, "Test_2024.yaml")) as stream:
+        cat_dict = yaml.safe_load(stream)
+    assert list(cat_dict.keys()) == ["Paper Metadata", "J0040+5716", "J0048+3412", "J0055-5117"]
+    assert cat_dict["J0040+5716"]["Frequency MHz"] == [390.0, 1400.0]
+    assert cat_dict["J0040+5716"]["Flux Density error mJy"] == [0.5, 0.2]
+    assert cat_dict["J0048+3412"]["Flux Density error mJy"] == [2.25]
+    assert rejected["line"].tolist() == [5, 7, 8, 9]
+    assert rejected["reason"].tolist() == [
+        "unknown pulsar name",
+        "flux density is not positive",
+        "non-numeric value",
+        "expected 4 or 5 columns",
+    ]
+    # The Jname that is not in the ATNF is kept and reported
+    assert unknown["file"].tolist() == [csv_location]
+    assert unknown["pulsar"].tolist() == ["J0055-5117"]
+
+
+def test_bulk_convert_csv_to_yaml(tmp_path, capfd):
+    """Tests csv and tsv files are converted in parallel and their rejected rows are combined."""
+    csv_locations = []
+    for i, delimiter, extension in [(0, ",", "csv"), (1, "\t", "tsv"), (2, ",", "csv")]:
+        csv_locations.append(os.path.join(tmp_path, f"Test_202{i}.{extension}"))
+        with open(csv_locations[-1], "w") as csv_file:
+            csv_file.write(delimiter.join(["Pulsar", "Freq", "Band", "Flux"]) + "\n")
+            csv_file.write(delimiter.join(["B0045+33", "150", "10", str(i + 1)]) + "\n")
+            csv_file.write(delimiter.join(["B9999+99", "150", "10", "1"]) + "\n")
+    with open(csv_locations[-1], "a") as csv_file:
+        csv_file.write("J0055+5118,150,10,1\n")
+    rejected, unknown = bulk_convert_csv_to_yaml(
+        csv_locations,
+        obs_span="Multi-epoch",
+        name_index=PulsarNameIndex(QUERY, alias_file=None),
+        output_dir=tmp_path,
+        n_workers=2,
+    )
+    assert rejected["file"].tolist() == csv_locations
+    assert set(rejected["reason"]) == {"unknown pulsar name"}
+    # The workers return the Jnames that are not in the ATNF instead of printing them
+    assert unknown.to_dict("records") == [{"file": csv_locations[-1], "pulsar": "J0055+5118", "closest": "J0055+5117"}]
+    assert capfd.readouterr().out == ""
+    for i in range(3):
+        with open(os.path.join(tmp_path, f"Test_202{i}.yaml")) as stream:
+            cat_dict = yaml.safe_load(stream)
+        assert cat_dict["Paper Metadata"]["Observation Span"] == "Multi-epoch"
+        assert cat_dict["J0048+3412"]["Flux Density mJy"] == [i + 1.0]
+
+
+if __name__ == "__main__":
+    """
+    Tests the relevant functions in csv_to_yaml.py
+    """
+    # introspect and run all the functions starting with 'test'
+    for f in dir():
+        if f.startswith("test"):
+            print(f)
+            globals()[f]()
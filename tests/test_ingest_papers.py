@@ -0,0 +1,140 @@
+#! /usr/bin/env python
+"""
+Tests the ingest_papers.py script
+"""
+
+import glob
+import os
+import sys
+
+import pandas as pd
+import yaml
+
+from pulsar_spectra.catalogue import CAT_DIR
+from pulsar_spectra.names import PulsarNameIndex
+from pulsar_spectra.scripts import ingest_papers as ingest_papers_script
+from pulsar_spectra.scripts.ingest_papers import (
+    MEASUREMENT_DEFAULTS,
+    SPEC_DIR,
+    ingest_paper,
+    ingest_papers,
+    parse_measurement,
+)
+
+
+def test_ingest_papers_reproduce_catalogue(tmp_path):
+    """Tests the papers rebuilt from their specs are the same as the catalogue yaml files."""
+    summaries = ingest_papers(output_dir=tmp_path, n_workers=2)
+    assert len(summaries) == len(glob.glob(os.path.join(SPEC_DIR, "*.yaml")))
+    for summary in summaries:
+        with open(os.path.join(tmp_path, f"{summary['ref']}.yaml")) as stream:
+            rebuilt = stream.read()
+        with open(os.path.join(CAT_DIR, f"{summary['ref']}.yaml")) as stream:
+            assert rebuilt == stream.read(), summary["ref"]
+
+
+def test_ingest_paper(tmp_path):
+    """Tests a paper with several measurements per row, name fixes and repeated pulsars."""
+    with open(os.path.join(tmp_path, "Test_2024_raw.csv"), "w") as raw_file:
+        raw_file.write(
+            "# A comment\n"
+            "PSR,S150,e_S150,S400,e_S400\n"
+            "J0040+57,1.5,0.1,0.5,0.05\n"
+            "B0045+33,2.5,0.2,,\n"
+            "J0040+57,1.2,0.1,<0.3,\n"
+        )
+    os.mkdir(os.path.join(tmp_path, "ingest_specs"))
+    with open(os.path.join(tmp_path, "ingest_specs", "Test_2024.yaml"), "w") as spec_file:
+        spec_file.write(
+            "raw_file: Test_2024_raw.csv\n"
+            "metadata: {Data Type: Imaging, Observation Span: Single-epoch}\n"
+            'delimiter: ","\n'
+            'skip_prefixes: ["#", "PSR"]\n'
+            'name_fixes: {"J0040+57": "J0040+5716"}\n'
+            "resolve_names: true\n"
+            "measurements:\n"
+            "  - {freq: 150, band: 10, flux_column: 1, flux_err_column: 2, flux_scale: 1.e+3}\n"
+            "  - {freq: 400, band: 20, flux_column: 3, flux_err_column: 4, flux_scale: 1.e+3}\n"
+        )
+    summary = ingest_paper(
+        os.path.join(tmp_path, "ingest_specs", "Test_2024.yaml"),
+        raw_dir=tmp_path,
+        output_dir=tmp_path,
+        name_index=PulsarNameIndex(pd.DataFrame({"PSRJ": ["J0048+3412"], "PSRB": ["B0045+33"]}), alias_file=None),
+    )
+    assert summary["n_pulsars"] == 2
+    assert summary["n_measurements"] == 4
+    assert summary["unknown_pulsars"] == ["J0040+5716", "J0040+5716"]
+    with open(os.path.join(tmp_path, "Test_2024.yaml")) as stream:
+        cat_dict = yaml.safe_load(stream)
+    assert cat_dict["Paper Metadata"]["Data Type"] == "Imaging"
+    assert cat_dict["J0040+5716"]["Frequency MHz"] == [150, 400, 150]
+    assert cat_dict["J0040+5716"]["Flux Density mJy"] == [1500.0, 500.0, 1200.0]
+    assert cat_dict["J0048+3412"]["Flux Density error mJy"] == [200.0]
+
+
+def test_main_resolve_names(tmp_path, monkeypatch, capsys):
+    """Tests the command line suggests the closest pulsars to unknown names when a spec resolves names."""
+    with open(os.path.join(tmp_path, "Test_2024_raw.csv"), "w") as raw_file:
+        raw_file.write("J0040+57 1.5 0.1\nB0045+33 2.5 0.2\n")
+    os.mkdir(os.path.join(tmp_path, "ingest_specs"))
+    with open(os.path.join(tmp_path, "ingest_specs", "Test_2024.yaml"), "w") as spec_file:
+        spec_file.write(
+            f"raw_file: {os.path.join(tmp_path, 'Test_2024_raw.csv')}\n"
+            "metadata: {Data Type: Imaging, Observation Span: Single-epoch}\n"
+            "resolve_names: true\n"
+            "measurements:\n"
+            "  - {freq: 150, band: 10, flux_column: 1, flux_err_column: 2}\n"
+        )
+    name_index = PulsarNameIndex(
+        pd.DataFrame({"PSRJ": ["J0040+5716", "J0048+3412"], "PSRB": ["B0037+56", "B0045+33"]}), alias_file=None
+    )
+    monkeypatch.setattr(ingest_papers_script, "get_name_index", lambda: name_index)
+    spec_dir = os.path.join(tmp_path, "ingest_specs")
+    monkeypatch.setattr(
+        sys, "argv", ["ingest-papers", "--spec_dir", spec_dir, "--output_dir", str(tmp_path), "--n_workers", "1"]
+    )
+    ingest_papers_script.main()
+    assert "J0040+57 not in the ATNF, the closest pulsar is J0040+5716" in capsys.readouterr().out
+    with open(os.path.join(tmp_path, "Test_2024.yaml")) as stream:
+        cat_dict = yaml.safe_load(stream)
+    assert "J0048+3412" in cat_dict
+
+
+def test_parse_measurement():
+    """Tests the flux(error) columns, fractional errors, rounding to the error and frequency columns."""
+    paren = {**MEASUREMENT_DEFAULTS, "freq": 436, "band": 32, "flux_paren_column": 1}
+    assert parse_measurement(["0034-0534", "0.61(9)"], paren) == (436, 32, 0.61, 0.09)
+    assert parse_measurement(["0034-0534", "17(5)"], paren) == (436, 32, 17.0, 5.0)
+    assert parse_measurement(["0613-0200", "..."], paren) is None
+    fraction = {
+        **MEASUREMENT_DEFAULTS,
+        "freq": 1360,
+        "band": 256,
+        "flux_column": 1,
+        "flux_err_fraction": 0.2,
+        "round_to_error": True,
+    }
+    assert parse_measurement(["J0034-0721", "11.12"], fraction) == (1360, 256, 11.0, 2.0)
+    assert parse_measurement(["J0051+0423", "0.49"], fraction) == (1360, 256, 0.49, 0.1)
+    assert parse_measurement(["J0051+0423", ""], fraction) is None
+    freq_column = {
+        **MEASUREMENT_DEFAULTS,
+        "freq_column": 1,
+        "freq_scale": 1e3,
+        "band": 40.0,
+        "flux_column": 2,
+        "flux_err_column": 3,
+    }
+    assert parse_measurement(["J0613-0200", "1.410", "1.4", "0.2"], freq_column) == (1410.0, 40.0, 1.4, 0.2)
+
+
+if __name__ == "__main__":
+    """
+    Tests the relevant functions in ingest_papers.py
+    """
+    # introspect and run all the functions starting with 'test'
+    for f in dir():
+        if f.startswith("test"):
+            print(f)
+            globals()[f]()
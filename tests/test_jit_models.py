@@ -0,0 +1,86 @@
+#! /usr/bin/env python
+"""
+Tests the jit_models.py script
+"""
+
+import numpy as np
+import pytest
+from iminuit.util import describe
+
+from pulsar_spectra import models
+from pulsar_spectra.jit_models import jit_model, numba_available
+from pulsar_spectra.spectral_fit import iminuit_fit_spectral_model
+
+
+def test_jit_models():
+    """Tests the numba compiled models match the NumPy models."""
+    pytest.importorskip("numba")
+    freqs = np.logspace(np.log10(2e7), np.log10(1e10), 50)
+    bands = freqs * 0.3
+    vmin_vmax = (freqs - bands / 2, freqs + bands / 2)
+    pulsar_model = {
+        models.simple_power_law: (-1.6, 1.0, 5e8),
+        models.broken_power_law: (1e9, -0.5, -2.0, 1.0, 5e8),
+        models.double_broken_power_law: (1e8, 1e9, -0.5, -1.5, -2.5, 1.0, 5e8),
+        models.log_parabolic_spectrum: (-0.3, -1.0, 0.2, 5e8),
+        models.high_frequency_cut_off_power_law: (3e9, -1.6, 1.0, 5e8),
+        models.low_frequency_turn_over_power_law: (1e8, -1.6, 1.0, 1.0, 5e8),
+        models.double_turn_over_spectrum: (3e9, 1e8, -1.6, 1.0, 1.0, 5e8),
+    }
+    band_model = {
+        models.simple_power_law_integrate: models.simple_power_law,
+        models.broken_power_law_intergral: models.broken_power_law,
+        models.high_frequency_cut_off_power_law_taylor: models.high_frequency_cut_off_power_law,
+        models.low_frequency_turn_over_power_law_taylor: models.low_frequency_turn_over_power_law,
+        models.double_turn_over_spectrum_taylor: models.double_turn_over_spectrum,
+    }
+    for model_function, fit_vals in pulsar_model.items():
+        jit_function = jit_model(model_function)
+        assert jit_function is not model_function
+        assert describe(jit_function) == describe(model_function)
+        np.testing.assert_allclose(
+            jit_function(freqs, *fit_vals),
+            model_function(freqs, *fit_vals),
+            rtol=1e-12,
+            err_msg=model_function.__name__,
+        )
+    for model_function, base_model in band_model.items():
+        fit_vals = pulsar_model[base_model]
+        np.testing.assert_allclose(
+            jit_model(model_function)(vmin_vmax, *fit_vals),
+            model_function(vmin_vmax, *fit_vals),
+            rtol=1e-12,
+            err_msg=model_function.__name__,
+        )
+
+
+def test_jit_model_fallback():
+    """Tests the NumPy model is used when there is no compiled version."""
+    assert jit_model(None) is None
+    gauss_legendre = models.gauss_legendre_integrate_function(models.simple_power_law)
+    assert jit_model(gauss_legendre) is gauss_legendre
+    if not numba_available():
+        assert jit_model(models.simple_power_law) is models.simple_power_law
+
+
+def test_jit_fit():
+    """Tests fitting with the compiled models gives the same fit as the NumPy models."""
+    pytest.importorskip("numba")
+    freqs = [80.0, 150.0, 200.0, 400.0, 800.0, 1400.0, 3000.0]
+    fluxs = [600.0, 400.0, 250.0, 100.0, 30.0, 15.0, 4.0]
+    cat_data = (freqs, [freq * 0.1 for freq in freqs], fluxs, [flux * 0.1 for flux in fluxs], ["Paper_2000"] * 7)
+    for model_name in ["simple_power_law", "broken_power_law"]:
+        _, numpy_fit, _, _ = iminuit_fit_spectral_model(*cat_data, model_name=model_name)
+        _, jit_fit, _, _ = iminuit_fit_spectral_model(*cat_data, model_name=model_name, use_jit=True)
+        np.testing.assert_allclose(jit_fit.values, numpy_fit.values, rtol=1e-4, err_msg=model_name)
+
+
+if __name__ == "__main__":
+    """
+    Tests the relevant functions in jit_models.py
+    """
+    # introspect and run all the functions starting with 'test'
+    for f in dir():
+        if f.startswith("test"):
+            print(f)
+            globals()[f]()
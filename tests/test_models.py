@@ -1,10 +1,24 @@
 #! /usr/bin/env python
 
+from dataclasses import FrozenInstanceError, replace
+
 import matplotlib.pyplot as plt
 import numpy as np
+import pytest
+from iminuit.util import describe
 from matplotlib.ticker import FormatStrFormatter
 
-from pulsar_spectra.models import model_settings
+from pulsar_spectra.models import (
+    gauss_legendre_integrate,
+    gauss_legendre_integrate_function,
+    get_model,
+    model_registry,
+    model_settings,
+    register_model,
+    simple_power_law,
+    simple_power_law_integrate,
+    unregister_model,
+)
 
 
 def test_bandwidth_model():
@@ -99,6 +113,89 @@ def test_bandwidth_model():
             np.testing.assert_approx_equal(band_sum, area_sum, significant=1)
 
 
+def test_taylor_models():
+    """Tests if the Taylor series bandwidth corrections match the integral for narrow bands."""
+    freq_all = np.logspace(np.log10(5e7), np.log10(5e9), 20)
+    band_all = freq_all * 0.1
+    model_dict = model_settings()
+    for a_s, beta_s in ((-1.6, 1.0), (-2.5, 0.6), (0.5, 2.1)):
+        taylor_models = {
+            # vc, a, c, v0
+            "high_frequency_cut_off_power_law": (1e10, a_s, 1.0, 5e8),
+            # vpeak, a, c, beta, v0
+            "low_frequency_turn_over_power_law": (1e8, a_s, 1.0, beta_s, 5e8),
+            # vc, vpeak, a, beta, c, v0
+            "double_turn_over_spectrum": (1e10, 1e8, a_s, beta_s, 1.0, 5e8),
+        }
+        for model_name, fit_vals in taylor_models.items():
+            model_function = model_dict[model_name][0]
+            model_function_taylor = model_dict[model_name][-1]
+            band_freq_range = np.linspace(freq_all - band_all / 2, freq_all + band_all / 2, 20001)
+            area_avg = np.trapz(model_function(band_freq_range, *fit_vals), band_freq_range, axis=0) / band_all
+            taylor_avg = model_function_taylor((freq_all - band_all / 2, freq_all + band_all / 2), *fit_vals)
+            np.testing.assert_allclose(taylor_avg, area_avg, rtol=1e-6, err_msg=model_name)
+
+
+def test_gauss_legendre_integrate():
+    """Tests if the Gauss-Legendre quadrature is accurate for every model."""
+    freq_all = np.logspace(np.log10(5e7), np.log10(5e9), 20)
+    band_all = freq_all * 0.5
+    vmin_vmax = (freq_all - band_all / 2, freq_all + band_all / 2)
+    pulsar_model = {
+        "simple_power_law": (-1.6, 1.0, 5e8),
+        "broken_power_law": (1e9, -0.5, -2.0, 1.0, 5e8),
+        "high_frequency_cut_off_power_law": (1e10, -1.6, 1.0, 5e8),
+        "low_frequency_turn_over_power_law": (1e8, -1.6, 1.0, 1.0, 5e8),
+        "double_turn_over_spectrum": (1e10, 1e8, -1.6, 1.0, 1.0, 5e8),
+    }
+    for model_name, fit_vals in pulsar_model.items():
+        model_function = get_model(model_name).function
+        band_freq_range = np.linspace(*vmin_vmax, 20001)
+        area_avg = np.trapz(model_function(band_freq_range, *fit_vals), band_freq_range, axis=0) / band_all
+        gl_avg = gauss_legendre_integrate(model_function, vmin_vmax, *fit_vals)
+        # The break is not smooth so the quadrature is less accurate
+        rtol = 1e-3 if model_name == "broken_power_law" else 1e-8
+        np.testing.assert_allclose(gl_avg, area_avg, rtol=rtol, err_msg=model_name)
+
+    # Models without an intergral function are integrated numerically with the model's parameter names
+    spec = replace(get_model("simple_power_law"), name="numerical_power_law", integrate_function=None)
+    assert spec.integrate_function is gauss_legendre_integrate_function(simple_power_law)
+    assert describe(spec.integrate_function) == ["vmin_vmax", "a", "c", "v0"]
+    np.testing.assert_allclose(
+        spec.integrate_function(vmin_vmax, -1.6, 1.0, 5e8),
+        simple_power_law_integrate(vmin_vmax, -1.6, 1.0, 5e8),
+        rtol=1e-10,
+    )
+
+
+def test_model_registry():
+    """Tests the model registry is read-only and that models can be registered."""
+    registry = model_registry()
+    assert list(registry.keys()) == list(model_settings().keys())
+    with pytest.raises(TypeError):
+        registry["new_model"] = registry["simple_power_law"]
+    with pytest.raises(FrozenInstanceError):
+        registry["simple_power_law"].start_params = (0.0, 0.0)
+
+    # The legacy dictionary can be altered without changing the registry
+    model_dict = model_settings()
+    model_dict["simple_power_law"][3][0] = (0.0, 1.0)
+    assert get_model("simple_power_law").mod_limits[0] == (-8.0, 3.0)
+
+    # Register a copy of a model under a new name
+    new_spec = replace(get_model("simple_power_law"), name="steep_power_law", start_params=[-3.0, 1.0])
+    with pytest.raises(ValueError):
+        register_model(replace(new_spec, name="simple_power_law"))
+    register_model(new_spec)
+    try:
+        assert "steep_power_law" not in registry
+        assert get_model("steep_power_law").start_params == (-3.0, 1.0)
+        assert "steep_power_law" in model_settings()
+    finally:
+        unregister_model("steep_power_law")
+    assert "steep_power_law" not in model_registry()
+
+
 if __name__ == "__main__":
     """
     Tests the relevant functions in models.py
@@ -0,0 +1,68 @@
+#! /usr/bin/env python
+"""
+Tests the names.py script
+"""
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from pulsar_spectra.load_data import DEFAULT_ALIAS_FILE
+from pulsar_spectra.names import PulsarNameIndex, parse_name_position
+
+QUERY = pd.DataFrame(
+    {
+        "PSRJ": ["J0038-2501", "J0040+5716", "J0048+3412", "J0534+2200", "J1921-0510", "J1921-05"],
+        "PSRB": ["B0036-25", "B0037+56", "B0045+33", "B0531+21", None, None],
+        "NAME": ["J0038-2501", "B0037+56", "B0045+33", "B0531+21", "J1921-0510", "J1921-05"],
+    }
+)
+
+
+def test_parse_name_position():
+    """Tests the positions encoded in full and truncated Jnames."""
+    np.testing.assert_allclose(parse_name_position("J0038-2501"), (9.5, -25 - 1 / 60))
+    np.testing.assert_allclose(parse_name_position("J1921-05"), (290.25, -5))
+    np.testing.assert_allclose(parse_name_position("J0737-3039A"), (114.25, -30.65))
+    assert np.all(np.isnan(parse_name_position("B0037+56")))
+
+
+def test_pulsar_name_index():
+    """Tests the exact, alias and fuzzy name resolution."""
+    name_index = PulsarNameIndex(QUERY, aliases={"PSR 0037 ": "J0040+5716"})
+    assert name_index.resolve("B0037+56") == "J0040+5716"
+    assert name_index.resolve(" J0048+3412") == "J0048+3412"
+    assert name_index.resolve("J0038−2501") == "J0038-2501"
+    assert name_index.resolve("PSR 0037") == "J0040+5716"
+    # From the curated alias file
+    assert name_index.resolve("Crab") == "J0534+2200"
+    assert name_index.resolve("J1921-05A") == "J1921-0510"
+    # Unknown names are only resolved by their position if fuzzy
+    assert name_index.resolve("J0037-25") is None
+    assert "J0037-25" not in name_index
+    assert name_index.resolve("J0037-25", fuzzy=True) == "J0038-2501"
+    assert name_index.resolve("J0040+57", fuzzy=True) == "J0040+5716"
+    assert name_index.resolve("J1200+00", fuzzy=True) is None
+    assert name_index.resolve_many(["B0045+33", "B9999+99"]) == ["J0048+3412", None]
+    assert [jname for jname, _ in name_index.candidates("J1921-05", max_sep_deg=0.5)] == ["J1921-05", "J1921-0510"]
+
+
+def test_alias_file():
+    """Tests the curated aliases are not Jnames of other pulsars and don't chain."""
+    with open(DEFAULT_ALIAS_FILE) as stream:
+        aliases = yaml.safe_load(stream)
+    assert len(aliases) > 0
+    for alias, jname in aliases.items():
+        assert jname.startswith("J"), alias
+        assert jname not in aliases, alias
+
+
+if __name__ == "__main__":
+    """
+    Tests the relevant functions in names.py
+    """
+    # introspect and run all the functions starting with 'test'
+    for f in dir():
+        if f.startswith("test"):
+            print(f)
+            globals()[f]()
@@ -0,0 +1,115 @@
+#! /usr/bin/env python
+"""
+Tests the population.py script
+"""
+
+import numpy as np
+import pandas as pd
+
+from pulsar_spectra.population import (
+    grouped_histogram,
+    grouped_quantiles,
+    model_fractions,
+    population_table,
+    weighted_quantiles,
+)
+
+
+def make_records():
+    """Make fit records of simulated pulsars whose turn-over fraction increases with period."""
+    rng = np.random.default_rng(0)
+    records = {}
+    for i in range(200):
+        pulsar = f"J{i:04d}+0000"
+        if i % 4 == 0:
+            model = "low_frequency_turn_over_power_law"
+            parameters = ["vpeak", "a", "c", "beta", "v0"]
+            values = [1e8, rng.normal(-2.0, 0.3), 1.0, 1.0, 4e8]
+        else:
+            model = "simple_power_law"
+            parameters = ["a", "c", "v0"]
+            values = [rng.normal(-1.6, 0.3), 1.0, 4e8]
+        errors = [0.1 * abs(value) for value in values[:-1]] + [0.0]
+        records[pulsar] = {
+            "pulsar": pulsar,
+            "model": model,
+            "parameters": parameters,
+            "values": values,
+            "errors": errors,
+            "p_best": 0.9,
+        }
+    records["J9999+0000"] = {"pulsar": "J9999+0000", "model": None, "p_best": None}
+    query = pd.DataFrame(
+        {
+            "PSRJ": [f"J{i:04d}+0000" for i in range(200)],
+            "P0": np.logspace(-2.5, 0.5, 200),
+            "AGE": np.logspace(9, 5, 200),
+        }
+    )
+    return records, query
+
+
+def test_population_table():
+    """Tests each pulsar's fit parameters and ATNF parameters are in the table."""
+    records, query = make_records()
+    table = population_table(records, query=query)
+    assert len(table) == 200
+    assert list(table["pulsar"]) == [f"J{i:04d}+0000" for i in range(200)]
+    np.testing.assert_array_equal(
+        table["a"], [records[pulsar]["values"][-3 if i % 4 else 1] for i, pulsar in enumerate(table["pulsar"])]
+    )
+    np.testing.assert_allclose(table["u_a"], 0.1 * np.abs(table["a"]))
+    assert np.all(np.isnan(table["vpeak"][table["model"] == "simple_power_law"]))
+    np.testing.assert_array_equal(table["P0"], query["P0"])
+    # The same table from a list of records and without ATNF parameters
+    table = population_table(list(records.values()), atnf_params=())
+    assert "P0" not in table and len(table) == 200
+
+
+def test_weighted_quantiles():
+    """Tests the weighted quantiles match numpy for equal weights and follow the weights."""
+    values = np.random.default_rng(1).normal(size=101)
+    np.testing.assert_allclose(
+        weighted_quantiles(values, [0.16, 0.5, 0.84]), np.quantile(values, [0.16, 0.5, 0.84], method="hazen")
+    )
+    # The middle of the weights are at 0.375 and 0.875 so the median is a quarter of the way between the values
+    np.testing.assert_allclose(weighted_quantiles([1.0, 2.0, np.nan], [0.5], weights=[3.0, 1.0, 1.0]), [1.25])
+    np.testing.assert_allclose(weighted_quantiles([1.0, 1.0, 1.0, 2.0], [0.5]), [1.0])
+    assert np.all(np.isnan(weighted_quantiles([], [0.5])))
+
+
+def test_grouped_statistics():
+    """Tests the histograms, quantiles and model fractions in bins of period."""
+    records, query = make_records()
+    table = population_table(records, query=query)
+    p0_bins = [1e-3, 1e-2, 1e-1, 1e0, 1e1]
+
+    histograms = grouped_histogram(table, "a", np.linspace(-4, 0, 9), by="P0", by_bins=p0_bins)
+    assert histograms.shape == (4, 8)
+    np.testing.assert_array_equal(histograms.sum(axis=1), np.histogram(table["P0"], p0_bins)[0])
+    assert grouped_histogram(table, "a", np.linspace(-4, 0, 9)).to_numpy().sum() == 200
+
+    group_quantiles = grouped_quantiles(table, "a", "P0", p0_bins, weights=1 / table["u_a"] ** 2)
+    assert list(group_quantiles.columns) == [0.16, 0.5, 0.84, "n"]
+    assert list(group_quantiles["n"]) == list(np.histogram(table["P0"], p0_bins)[0])
+    in_bin = (table["P0"] > 1e-1) & (table["P0"] <= 1e0)
+    np.testing.assert_allclose(
+        group_quantiles.iloc[2][[0.16, 0.5, 0.84]],
+        weighted_quantiles(table["a"][in_bin], [0.16, 0.5, 0.84], 1 / table["u_a"][in_bin] ** 2),
+    )
+
+    fractions = model_fractions(table, by="P0", bins=p0_bins)
+    assert list(fractions["n"]) == list(np.histogram(table["P0"], p0_bins)[0])
+    np.testing.assert_allclose(fractions[["low_frequency_turn_over_power_law", "simple_power_law"]].sum(axis=1), 1)
+    np.testing.assert_allclose(model_fractions(table)["low_frequency_turn_over_power_law"], [0.25])
+
+
+if __name__ == "__main__":
+    """
+    Tests the relevant functions in population.py
+    """
+    # introspect and run all the functions starting with 'test'
+    for f in dir():
+        if f.startswith("test"):
+            print(f)
+            globals()[f]()
@@ -0,0 +1,133 @@
+#! /usr/bin/env python
+"""
+Tests the results.py script
+"""
+
+import pytest
+
+from pulsar_spectra.results import (
+    ParquetResultsWriter,
+    ResultsStore,
+    data_hash,
+    find_changed_pulsars,
+    make_fit_record,
+)
+from pulsar_spectra.spectral_fit import iminuit_fit_spectral_model
+
+freqs = [150.0, 400.0, 800.0, 1400.0]
+bands = [10.0, 20.0, 50.0, 100.0]
+fluxs = [400.0, 100.0, 30.0, 15.0]
+flux_errs = [40.0, 10.0, 3.0, 1.5]
+refs = ["Paper_2000", "Paper_2000", "Paper_2010", "Paper_2020"]
+
+
+def test_data_hash():
+    """Tests the data hash only changes when the data changes."""
+    cat_data = [freqs, bands, fluxs, flux_errs, refs]
+    reordered = [x[::-1] for x in cat_data]
+    assert data_hash(*cat_data) == data_hash(*reordered)
+    changed = [freqs, bands, fluxs[:-1] + [16.0], flux_errs, refs]
+    assert data_hash(*cat_data) != data_hash(*changed)
+
+
+def test_results_store(tmp_path):
+    """Tests records can be appended and reloaded, including after an interrupted write."""
+    cat_data = [freqs, bands, fluxs, flux_errs, refs]
+    _, m, _, _ = iminuit_fit_spectral_model(*cat_data, model_name="simple_power_law")
+    store = ResultsStore(tmp_path / "results.jsonl")
+    assert store.load() == {}
+
+    store.append(make_fit_record("J0000+0000", cat_data, "simple_power_law", m, 1.0))
+    # Simulate a crash part way through writing a record
+    with open(store.filename, "a") as stream:
+        stream.write('{"pulsar": "J1111+')
+    store.append(make_fit_record("J1111+1111", cat_data, None, None, None))
+
+    records = store.load()
+    assert list(records.keys()) == ["J0000+0000", "J1111+1111"]
+    assert records["J0000+0000"]["aic"] == m.fit_stats["aic"]
+    assert records["J0000+0000"]["refs"] == ["Paper_2000", "Paper_2010", "Paper_2020"]
+    assert records["J1111+1111"]["model"] is None
+    assert store.completed() == {"J0000+0000": data_hash(*cat_data), "J1111+1111": data_hash(*cat_data)}
+
+    # Removed pulsars are dropped until they are refit
+    store.remove(["J0000+0000"])
+    assert list(store.load().keys()) == ["J1111+1111"]
+    store.append(make_fit_record("J0000+0000", cat_data, None, None, None))
+    assert list(store.load().keys()) == ["J1111+1111", "J0000+0000"]
+
+
+def test_results_buffering(tmp_path):
+    """Tests records are only written to disk once the buffer is full or the store is closed."""
+    cat_data = [freqs, bands, fluxs, flux_errs, refs]
+    with ResultsStore(tmp_path / "results.jsonl", buffer_size=3) as store:
+        for pulsar in ["J0000+0000", "J1111+1111"]:
+            store.append(make_fit_record(pulsar, cat_data, None, None, None))
+        assert store.load() == {}
+        store.append(make_fit_record("J2222+2222", cat_data, None, None, None))
+        assert len(store.load()) == 3
+        store.append(make_fit_record("J3333+3333", cat_data, None, None, None))
+    assert len(store.load()) == 4
+
+
+def test_parquet_results_writer(tmp_path):
+    """Tests the fit records can be streamed to a Parquet file."""
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    cat_data = [freqs, bands, fluxs, flux_errs, refs]
+    _, m, _, _ = iminuit_fit_spectral_model(*cat_data, model_name="simple_power_law")
+    parquet_file = tmp_path / "results.parquet"
+    with ParquetResultsWriter(parquet_file, buffer_size=2) as writer:
+        for pulsar in ["J0000+0000", "J1111+1111", "J2222+2222"]:
+            writer.append(make_fit_record(pulsar, cat_data, "simple_power_law", m, 1.0, fit_time=0.1))
+        writer.append(make_fit_record("J3333+3333", cat_data, None, None, None))
+
+    results = pd.read_parquet(parquet_file)
+    assert list(results["pulsar"]) == ["J0000+0000", "J1111+1111", "J2222+2222", "J3333+3333"]
+    assert results["aic"][0] == m.fit_stats["aic"]
+    assert list(results["values"][0]) == list(m.values)
+    assert results["model"][3] is None
+
+
+def test_find_changed_pulsars():
+    """Tests only pulsars with changed data are flagged for refitting."""
+    cat_list = {
+        "J0000+0000": [freqs, bands, fluxs, flux_errs, refs],
+        "J1111+1111": [freqs, bands, fluxs, flux_errs, refs],
+        "J2222+2222": [freqs, bands, fluxs, flux_errs, refs],
+    }
+    records = {}
+    for pulsar in ["J0000+0000", "J1111+1111", "J2222+2222"]:
+        records[pulsar] = make_fit_record(pulsar, cat_list[pulsar], None, None, None)
+    assert find_changed_pulsars(records, cat_list) == {}
+
+    # Correct a flux in one paper, add a paper to another pulsar and remove all data of the last pulsar
+    cat_list["J0000+0000"] = [freqs, bands, fluxs[:-1] + [16.0], flux_errs, refs]
+    cat_list["J1111+1111"] = [x + [y] for x, y in zip(cat_list["J1111+1111"], [50.0, 1.0, 900.0, 90.0, "New_2030"])]
+    cat_list["J2222+2222"] = [[], [], [], [], []]
+    cat_list["J3333+3333"] = [freqs, bands, fluxs, flux_errs, refs]
+
+    changes = find_changed_pulsars(records, cat_list)
+    assert changes["J0000+0000"] == {
+        "status": "changed",
+        "added_refs": [],
+        "removed_refs": [],
+        "changed_refs": ["Paper_2020"],
+    }
+    assert changes["J1111+1111"]["added_refs"] == ["New_2030"]
+    assert changes["J1111+1111"]["changed_refs"] == []
+    assert changes["J2222+2222"]["status"] == "removed"
+    assert changes["J2222+2222"]["removed_refs"] == ["Paper_2000", "Paper_2010", "Paper_2020"]
+    assert changes["J3333+3333"]["status"] == "new"
+    assert find_changed_pulsars(records, cat_list, pulsars=["J3333+3333"]).keys() == {"J3333+3333"}
+
+
+if __name__ == "__main__":
+    """
+    Tests the relevant functions in results.py
+    """
+    # introspect and run all the functions starting with 'test'
+    for f in dir():
+        if f.startswith("test"):
+            print(f)
+            globals()[f]()
@@ -0,0 +1,123 @@
+#! /usr/bin/env python
+"""
+Tests the selection.py script
+"""
+
+import numpy as np
+import pandas as pd
+
+from pulsar_spectra.selection import FrequencyCoverageIndex, PulsarSelector
+
+
+def make_query(n=2000):
+    """Make a catalogue of random pulsars with some missing values."""
+    rng = np.random.default_rng(3)
+    query = pd.DataFrame(
+        {
+            "PSRJ": [f"J{i:04d}+0000" for i in range(n)],
+            "RAJD": rng.uniform(0, 360, n),
+            "DECJD": np.degrees(np.arcsin(rng.uniform(-1, 1, n))),
+            "P0": 10 ** rng.uniform(-3, 1, n),
+            "DM": rng.uniform(1, 500, n),
+        }
+    )
+    query.loc[::50, "DM"] = np.nan
+    query.loc[::70, "RAJD"] = np.nan
+    return query
+
+
+def test_pulsar_selector():
+    """Tests the selections match a brute force search with and without the KD-tree."""
+    query = make_query()
+    ra, dec = np.radians(query["RAJD"]), np.radians(query["DECJD"])
+    centre_ra, centre_dec, radius = 350.0, -30.0, 25.0
+    separation = np.degrees(
+        np.arccos(
+            np.sin(dec) * np.sin(np.radians(centre_dec))
+            + np.cos(dec) * np.cos(np.radians(centre_dec)) * np.cos(ra - np.radians(centre_ra))
+        )
+    )
+    expected = query["PSRJ"][(separation <= radius) & (query["P0"] < 0.03) & (query["DM"] < 50)].tolist()
+    assert len(expected) > 0
+    for use_kdtree in (True, False):
+        selector = PulsarSelector(query=query, use_kdtree=use_kdtree)
+        selected = selector.select(cone=(centre_ra, centre_dec, radius), ranges={"P0": (None, 0.03), "dm": (0, 50)})
+        assert selected == expected
+        # The pulsars without a position are never in a cone
+        assert len(selector.select(cone=(0, 0, 180))) == np.sum(np.isfinite(query["RAJD"]))
+
+    selector = PulsarSelector(query=query)
+    assert selector.select() == query["PSRJ"].tolist()
+    assert (
+        selector.select(ranges={"DM": (100, 200)}) == query["PSRJ"][(query["DM"] >= 100) & (query["DM"] < 200)].tolist()
+    )
+    assert selector.select(ranges={"P0": (1, None)}, pulsars=["J0002+0000", "J0001+0000"]) == [
+        pulsar for pulsar in ["J0001+0000", "J0002+0000"] if query.set_index("PSRJ").loc[pulsar, "P0"] >= 1
+    ]
+
+
+def make_cat_list(pulsars):
+    """Make a catalogue of random measurements with and without bandwidths from a few references."""
+    rng = np.random.default_rng(4)
+    cat_list = {}
+    for pulsar in pulsars:
+        n = rng.integers(0, 12)
+        freqs = list(10 ** rng.uniform(1.5, 3.5, n))
+        bands = [None if rng.uniform() < 0.5 else 0.3 * freq for freq in freqs]
+        refs = [f"ref_{i}" for i in rng.integers(0, 6, n)]
+        cat_list[pulsar] = [freqs, bands, [1.0] * n, [0.1] * n, refs]
+    return cat_list
+
+
+def test_frequency_coverage_index():
+    """Tests the pulsars and coverage tables match a brute force search."""
+    cat_list = make_cat_list(make_query(300)["PSRJ"])
+    coverage_index = FrequencyCoverageIndex(cat_list)
+    for min_freq, max_freq, min_refs in [(50, 300, 1), (50, 300, 3), (1000, 1000, 1), (1e4, 1e5, 1)]:
+        expected = []
+        for pulsar, (freqs, bands, _, _, refs) in cat_list.items():
+            covered_refs = {
+                ref
+                for freq, band, ref in zip(freqs, bands, refs)
+                if freq - (band or 0) / 2 <= max_freq and freq + (band or 0) / 2 >= min_freq
+            }
+            if len(covered_refs) >= min_refs and len(covered_refs) > 0:
+                expected.append(pulsar)
+        assert coverage_index.pulsars_in_range(min_freq, max_freq, min_refs=min_refs) == expected
+
+    table = coverage_index.coverage_table()
+    pulsar = table.index[0]
+    freqs, bands, _, _, refs = cat_list[pulsar]
+    half_bands = np.array([0 if band is None else band / 2 for band in bands])
+    assert table.loc[pulsar, "n_points"] == len(freqs)
+    assert table.loc[pulsar, "n_refs"] == len(set(refs))
+    np.testing.assert_allclose(table.loc[pulsar, "min_freq_MHz"], np.min(np.array(freqs) - half_bands))
+    np.testing.assert_allclose(table.loc[pulsar, "max_freq_MHz"], np.max(np.array(freqs) + half_bands))
+    ref_table = coverage_index.coverage_table(by="reference")
+    assert ref_table["n_points"].sum() == sum(len(cat_list[pulsar][0]) for pulsar in cat_list)
+
+    # The ATNF references (labelled like flux_from_atnf) can be counted as a single reference
+    atnf_cat_list = {
+        pulsar: values[:4] + [[f"{ref}_ATNF" if ref in ("ref_4", "ref_5") else ref for ref in values[4]]]
+        for pulsar, values in cat_list.items()
+    }
+    atnf_table = FrequencyCoverageIndex(atnf_cat_list).coverage_table(by="reference", group_atnf=True)
+    assert list(atnf_table.index) == ["ATNF", "ref_0", "ref_1", "ref_2", "ref_3"]
+    assert atnf_table.loc["ATNF", "n_points"] == ref_table.loc[["ref_4", "ref_5"], "n_points"].sum()
+
+    # The selector combines the frequency coverage with the other conditions
+    selector = PulsarSelector(query=make_query(300), cat_list=cat_list)
+    selected = selector.select(ranges={"P0": (0.1, None)}, freq_range_MHz=(50, 300), min_refs=2)
+    expected = coverage_index.pulsars_in_range(50, 300, min_refs=2)
+    assert selected == [pulsar for pulsar in selector.select(ranges={"P0": (0.1, None)}) if pulsar in expected]
+
+
+if __name__ == "__main__":
+    """
+    Tests the relevant functions in selection.py
+    """
+    # introspect and run all the functions starting with 'test'
+    for f in dir():
+        if f.startswith("test"):
+            print(f)
+            globals()[f]()
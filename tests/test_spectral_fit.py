@@ -3,11 +3,24 @@
 Tests the spectral_fit.py script
 """
 
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import pytest
 
 from pulsar_spectra.catalogue import collect_catalogue_fluxes
-from pulsar_spectra.spectral_fit import find_best_spectral_fit
+from pulsar_spectra.models import broken_power_law, model_registry
+from pulsar_spectra.spectral_fit import (
+    FitBudget,
+    FitBudgetExceeded,
+    estimate_flux_density,
+    estimate_flux_density_bulk,
+    find_best_spectral_fit,
+    fit_result_to_dict,
+    iminuit_fit_spectral_model,
+    multi_start_params,
+    reference_jackknife,
+)
 
 spectral_fit_tests = [
     (
@@ -137,6 +150,47 @@ def test_find_best_spectral_fit(pulsar, exp_model_name, frozen_refs):
     np.testing.assert_string_equal(model_name, exp_model_name)
 
 
+@pytest.mark.parametrize("pulsar, exp_model_name, frozen_refs", spectral_fit_tests)
+def test_log_space_fit(pulsar, exp_model_name, frozen_refs):
+    """Tests the log-space fits find the same best model and reports how they compare to the linear fits."""
+    cat_list = collect_catalogue_fluxes(only_use=frozen_refs)
+    freq_all, band_all, flux_all, flux_err_all, ref_all = cat_list[pulsar]
+    print(f"\nFitting {pulsar}")
+    print(f"{'model':35s}{'linear nfcn':>12s}{'valid':>7s}{'log nfcn':>10s}{'valid':>7s}")
+    for model_name in model_registry():
+        _, m_linear, _, _ = iminuit_fit_spectral_model(
+            freq_all, band_all, flux_all, flux_err_all, ref_all, model_name=model_name
+        )
+        _, m_log, _, _ = iminuit_fit_spectral_model(
+            freq_all, band_all, flux_all, flux_err_all, ref_all, model_name=model_name, log_space=True
+        )
+        assert m_log.fit_stats["log_space"]
+        print(
+            f"{model_name:35s}{m_linear.fit_stats['nfcn']:12d}{m_linear.valid!s:>7s}"
+            f"{m_log.fit_stats['nfcn']:10d}{m_log.valid!s:>7s}"
+        )
+    model_name, _, _, _, _ = find_best_spectral_fit(
+        pulsar, freq_all, band_all, flux_all, flux_err_all, ref_all, log_space=True
+    )
+    np.testing.assert_string_equal(model_name, exp_model_name)
+
+
+def test_log_space_power_law():
+    """Tests a log-space fit of a power law recovers its parameters with the uncertainties in the usual units."""
+    freqs = [100.0, 150.0, 300.0, 400.0, 800.0, 1400.0, 3000.0]
+    bands = [None] * len(freqs)
+    fluxs = list(500.0 * (np.array(freqs) / 400.0) ** -1.6)
+    flux_errs = [0.1 * flux for flux in fluxs]
+    refs = ["test_ref"] * len(freqs)
+    _, m_linear, _, _ = iminuit_fit_spectral_model(freqs, bands, fluxs, flux_errs, refs)
+    _, m_log, _, _ = iminuit_fit_spectral_model(freqs, bands, fluxs, flux_errs, refs, log_space=True)
+    assert m_log.valid and m_log.fit_stats["log_space"]
+    assert list(m_log.parameters) == list(m_linear.parameters)
+    np.testing.assert_allclose(np.array(m_log.values), np.array(m_linear.values), rtol=1e-4)
+    # For small fractional uncertainties the log-space uncertainties match the linear ones
+    np.testing.assert_allclose(np.array(m_log.errors)[:2], np.array(m_linear.errors)[:2], rtol=0.05)
+
+
 def test_plot_methods():
     """Tests the find_best_spectral_fit plotting methods."""
     cat_list = collect_catalogue_fluxes()
@@ -186,6 +240,195 @@ def test_plot_methods():
     )
 
 
+def test_estimate_flux_density_bulk():
+    """Tests the bulk flux density estimates match the single fit estimates."""
+    freqs = [100.0, 150.0, 300.0, 400.0, 800.0, 1400.0, 3000.0]
+    bands = [10.0] * len(freqs)
+    fluxs = list(500.0 * (np.array(freqs) / 400.0) ** -1.6)
+    flux_errs = [0.1 * flux for flux in fluxs]
+    refs = ["test_ref"] * len(freqs)
+    fit_results = []
+    iminuit_results = []
+    for model_name in ["simple_power_law", "high_frequency_cut_off_power_law"]:
+        _, m, _, _ = iminuit_fit_spectral_model(freqs, bands, fluxs, flux_errs, refs, model_name=model_name)
+        fit_results.append(fit_result_to_dict("test_pulsar", model_name, m))
+        iminuit_results.append((model_name, m))
+
+    est_freqs = [50.0, 150.0, 1000.0]
+    bulk_fluxs, bulk_flux_errs = estimate_flux_density_bulk(est_freqs, fit_results)
+    assert bulk_fluxs.shape == (len(fit_results), len(est_freqs))
+    for bulk_flux, bulk_flux_err, (model_name, m) in zip(bulk_fluxs, bulk_flux_errs, iminuit_results):
+        fitted_flux, fitted_flux_err = estimate_flux_density(est_freqs, model_name, m)
+        np.testing.assert_allclose(bulk_flux, fitted_flux, rtol=1e-8)
+        np.testing.assert_allclose(bulk_flux_err, np.array(fitted_flux_err, dtype=float), rtol=1e-4)
+
+
+def test_band_tolerance():
+    """Tests the bandwidth corrected fit is only skipped when the correction is small."""
+    freqs = [100.0, 150.0, 300.0, 400.0, 800.0, 1400.0, 3000.0]
+    fluxs = list(500.0 * (np.array(freqs) / 400.0) ** -1.6)
+    flux_errs = [0.1 * flux for flux in fluxs]
+    refs = ["test_ref"] * len(freqs)
+
+    # Narrow bands give a tiny correction so the bandwidth fit is skipped
+    narrow_bands = [0.01 * freq for freq in freqs]
+    _, m_full, _, band_bool = iminuit_fit_spectral_model(freqs, narrow_bands, fluxs, flux_errs, refs)
+    assert band_bool and m_full.fit_stats["band_correction"] is None
+    _, m_skip, _, band_bool = iminuit_fit_spectral_model(
+        freqs, narrow_bands, fluxs, flux_errs, refs, band_tolerance=0.01
+    )
+    assert not band_bool
+    assert m_skip.fit_stats["band_skipped"]
+    assert m_skip.fit_stats["band_correction"] < 0.01
+    assert m_skip.fit_stats["nfcn"] < m_full.fit_stats["nfcn"]
+    np.testing.assert_allclose(np.array(m_skip.values), np.array(m_full.values), rtol=1e-3)
+
+    # Wide bands need the bandwidth fit
+    wide_bands = [0.5 * freq for freq in freqs]
+    _, m_wide, _, band_bool = iminuit_fit_spectral_model(freqs, wide_bands, fluxs, flux_errs, refs, band_tolerance=0.01)
+    assert band_bool
+    assert not m_wide.fit_stats["band_skipped"]
+    assert m_wide.fit_stats["band_correction"] > 0.01
+
+
+def test_fit_budget():
+    """Tests fits are stopped and marked once they use their budget of calls or time."""
+    freqs = [100.0, 150.0, 300.0, 400.0, 800.0, 1400.0, 3000.0]
+    bands = [0.1 * freq for freq in freqs]
+    fluxs = list(500.0 * (np.array(freqs) / 400.0) ** -1.6)
+    flux_errs = [0.1 * flux for flux in fluxs]
+    refs = ["test_ref"] * len(freqs)
+
+    _, m, _, band_bool = iminuit_fit_spectral_model(freqs, bands, fluxs, flux_errs, refs)
+    assert m.valid and band_bool and not m.fit_stats["budget_exceeded"]
+    # A large budget doesn't change the fit
+    _, m_large, _, _ = iminuit_fit_spectral_model(freqs, bands, fluxs, flux_errs, refs, max_calls=100000, max_time=600)
+    assert not m_large.fit_stats["budget_exceeded"]
+    np.testing.assert_allclose(np.array(m_large.values), np.array(m.values))
+    # Too few calls to find the minimum
+    _, m_small, _, band_bool = iminuit_fit_spectral_model(freqs, bands, fluxs, flux_errs, refs, max_calls=10)
+    assert m_small.fit_stats["budget_exceeded"]
+    assert not m_small.valid and not band_bool
+    assert m_small.fit_stats["nfcn"] <= 11
+    # Enough calls for the first fit but not the bandwidth corrected fit, so the first fit is kept
+    first_fit_calls = m.fit_stats["nfcn"] - 20
+    _, m_first, _, band_bool = iminuit_fit_spectral_model(
+        freqs, bands, fluxs, flux_errs, refs, max_calls=first_fit_calls
+    )
+    assert m_first.fit_stats["budget_exceeded"]
+    assert m_first.valid and not band_bool
+    # No time to fit
+    _, m_time, _, _ = iminuit_fit_spectral_model(freqs, bands, fluxs, flux_errs, refs, max_time=0)
+    assert m_time.fit_stats["budget_exceeded"] and not m_time.valid
+
+    # The calls of each fit are also charged to the shared budget
+    pulsar_budget = FitBudget(max_calls=100)
+    budget = FitBudget(max_calls=1000, parent=pulsar_budget)
+    assert budget.remaining_calls() == 100
+    budget.spend(60)
+    assert pulsar_budget.calls == 60 and budget.remaining_calls() == 40
+    assert not budget.is_used()
+    budget.spend(40)
+    assert budget.is_used()
+    with pytest.raises(FitBudgetExceeded):
+        budget.spend()
+    assert budget.exceeded
+
+    # The pulsar budget stops the remaining models
+    model_name, m_best, _, _, _ = find_best_spectral_fit(
+        "test_pulsar", freqs, bands, fluxs, flux_errs, refs, pulsar_max_calls=m.fit_stats["nfcn"]
+    )
+    assert model_name == "simple_power_law"
+    assert m_best.valid
+    model_name, m_best, _, _, _ = find_best_spectral_fit(
+        "test_pulsar", freqs, bands, fluxs, flux_errs, refs, pulsar_max_calls=10
+    )
+    assert model_name is None and m_best is None
+
+
+def test_multi_start_fit():
+    """Tests the multi-start fits find a minimum at least as good as the single start fit."""
+    start_params = (1e9, -1.6, -1.6, 1.0, 4e8)
+    mod_limits = [(50e6, 5e9), (-8.0, 3.0), (-8.0, 3.0), (0.0, None), None]
+    starts = multi_start_params(broken_power_law, start_params, mod_limits, 8)
+    assert len(starts) == 8 and starts[0] == start_params
+    starts = np.array(starts)
+    # The other starts are each in a different eighth of the (log) range
+    vb_bins = np.floor(8 * np.log10(starts[1:, 0] / 50e6) / 2)
+    a1_bins = np.floor(8 * (starts[1:, 1] + 8) / 11)
+    assert len(set(vb_bins)) == 7 and len(set(a1_bins)) == 7
+    assert np.all(starts[:, 3:] == start_params[3:])
+
+    freqs = [60.0, 80.0, 100.0, 150.0, 200.0, 300.0, 400.0, 800.0, 1400.0, 3000.0]
+    bands = [None] * len(freqs)
+    fluxs = list(broken_power_law(np.array(freqs) * 1e6, 2e8, 0.5, -2.0, 0.5, 4e8) * 1e3)
+    flux_errs = [0.1 * flux for flux in fluxs]
+    refs = ["test_ref"] * len(freqs)
+    aic, m, _, _ = iminuit_fit_spectral_model(freqs, bands, fluxs, flux_errs, refs, model_name="broken_power_law")
+    assert m.fit_stats["n_starts"] == 1
+    for n_workers in [1, 2]:
+        multi_aic, m_multi, _, _ = iminuit_fit_spectral_model(
+            freqs, bands, fluxs, flux_errs, refs, model_name="broken_power_law", n_starts=8, n_workers=n_workers
+        )
+        assert m_multi.valid
+        assert multi_aic <= aic + 1e-6
+        assert m_multi.fit_stats["n_starts"] == 8
+        assert 1 <= m_multi.fit_stats["n_starts_best"] <= m_multi.fit_stats["n_starts_valid"] <= 8
+        assert m_multi.fit_stats["nfcn"] > m.fit_stats["nfcn"]
+        np.testing.assert_allclose(m_multi.values["vb"], 2e8, rtol=1e-3)
+
+    # A shared executor is used for all the models and is left open for the next pulsar
+    serial_model_name, _, _, _, _ = find_best_spectral_fit(
+        "test_pulsar", freqs, bands, fluxs, flux_errs, refs, n_starts=4, n_workers=1
+    )
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        for _ in range(2):
+            model_name, m_best, _, _, _ = find_best_spectral_fit(
+                "test_pulsar", freqs, bands, fluxs, flux_errs, refs, n_starts=4, executor=executor
+            )
+            assert model_name == serial_model_name
+            assert m_best.fit_stats["n_starts"] == 4
+
+
+def test_reference_jackknife():
+    """Tests the jackknife finds the reference that is inconsistent with the others."""
+    rng = np.random.default_rng(0)
+    freqs = list(np.logspace(np.log10(100), np.log10(3000), 24))
+    fluxs = 300.0 * (np.array(freqs) / 400.0) ** -1.6
+    flux_errs = list(0.1 * fluxs)
+    fluxs = fluxs + rng.normal(0, flux_errs)
+    refs = [f"ref_{i % 6}" for i in range(len(freqs))]
+    # Make one reference's flux densities three times too high
+    fluxs = list(np.where(np.array(refs) == "ref_2", 3 * fluxs, fluxs))
+    bands = [None] * len(freqs)
+    _, m, _, _ = iminuit_fit_spectral_model(freqs, bands, fluxs, flux_errs, refs)
+    for n_workers in [1, 2]:
+        jackknife_results = reference_jackknife(
+            freqs, bands, fluxs, flux_errs, refs, iminuit_result=m, n_workers=n_workers
+        )
+        assert list(jackknife_results) == [f"ref_{i}" for i in range(6)]
+        for jackknife_result in jackknife_results.values():
+            assert jackknife_result["n_data"] == 4
+            assert jackknife_result["valid"]
+            # The fits share the reference frequency of the fit of all the data
+            assert jackknife_result["values"][-1] == m.values["v0"]
+            np.testing.assert_allclose(
+                jackknife_result["shifts"], np.array(jackknife_result["values"][:-1]) - np.array(m.values[:-1])
+            )
+        delta_aics = {ref: jackknife_result["delta_aic"] for ref, jackknife_result in jackknife_results.items()}
+        assert min(delta_aics, key=delta_aics.get) == "ref_2"
+        assert delta_aics["ref_2"] < -4 * jackknife_results["ref_2"]["n_data"]
+        # Removing it lowers the amplitude by the most
+        c_shifts = {ref: jackknife_result["shifts_sigma"][1] for ref, jackknife_result in jackknife_results.items()}
+        assert min(c_shifts, key=c_shifts.get) == "ref_2"
+        assert c_shifts["ref_2"] < 0
+    # Too few measurements are left to fit a model without one of the two references
+    jackknife_results = reference_jackknife(
+        freqs[:4], bands[:4], fluxs[:4], flux_errs[:4], ["ref_0"] * 2 + ["ref_1"] * 2
+    )
+    assert jackknife_results["ref_0"]["values"] is None and not jackknife_results["ref_0"]["valid"]
+
+
 if __name__ == "__main__":
     """
     Tests the relevant functions in spectral_fit.py
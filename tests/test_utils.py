@@ -0,0 +1,31 @@
+#! /usr/bin/env python
+"""
+Tests the utils.py script
+"""
+
+import numpy as np
+
+from pulsar_spectra.utils import unit_vectors
+
+
+def test_unit_vectors():
+    """Tests the unit vectors of some sky positions."""
+    vectors = unit_vectors(np.array([0.0, 90.0, 45.0, 180.0]), np.array([0.0, 0.0, 90.0, -30.0]))
+    assert vectors.shape == (4, 3)
+    np.testing.assert_allclose(np.linalg.norm(vectors, axis=1), 1)
+    np.testing.assert_allclose(vectors[:3], [[1, 0, 0], [0, 1, 0], [0, 0, 1]], atol=1e-12)
+    np.testing.assert_allclose(vectors[3], [-np.sqrt(3) / 2, 0, -0.5], atol=1e-12)
+    # A single position is a single vector
+    assert unit_vectors(10.0, 20.0).shape == (3,)
+    np.testing.assert_allclose(unit_vectors(10.0, 20.0), unit_vectors([10.0], [20.0])[0])
+
+
+if __name__ == "__main__":
+    """
+    Tests the relevant functions in utils.py
+    """
+    # introspect and run all the functions starting with 'test'
+    for f in dir():
+        if f.startswith("test"):
+            print(f)
+            globals()[f]()